@@ -0,0 +1,438 @@
+"""
+Asyncio client for the MLB Stats API endpoints used by print_lineups.py
+
+Every fetch function in print_lineups.py has an awaitable equivalent on
+AsyncMLBClient. Responses are parsed with the same helpers the synchronous
+CLI uses, so both paths return identical structures. Requests are made with
+aiohttp and bounded by a semaphore, so many lookups can run concurrently in
+one event loop without flooding the API.
+
+Example:
+    async with AsyncMLBClient(max_concurrency=20) as client:
+        game_id, status, venue, teams, game_time = await client.get_team_game(121)
+        lineup_data, error = await client.fallback_get_lineup(game_id, 121)
+"""
+import asyncio
+
+import aiohttp
+
+from print_lineups import (
+    BOXSCORE_FIELDS,
+    BOXSCORE_URL,
+    PEOPLE_FIELDS,
+    PEOPLE_URL,
+    PERSON_URL,
+    SCHEDULE_URL,
+    build_pitcher_details,
+    build_player_details,
+    find_starting_pitchers,
+    get_today_date_eastern,
+    parse_boxscore,
+    parse_boxscore_lineup,
+    parse_boxscore_pitchers,
+    parse_schedule_game,
+    parse_schedule_pitchers,
+    parse_umpires,
+)
+
+# Maximum number of requests in flight at once for one client
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Errors raised by aiohttp for failed or timed out requests
+FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
+
+def schedule_games_from_response(data):
+    """
+    Convert a raw schedule response into statsapi.schedule style game entries
+
+    Args:
+        data (dict): The raw JSON from the schedule endpoint
+
+    Returns:
+        list: Games with the keys used by parse_schedule_game and parse_schedule_pitchers
+    """
+    games = []
+    for date in data.get('dates', []):
+        for game in date.get('games', []):
+            teams = game.get('teams', {})
+            home = teams.get('home', {})
+            away = teams.get('away', {})
+            games.append({
+                'game_id': game['gamePk'],
+                'status': game.get('status', {}).get('detailedState', ''),
+                'game_datetime': game.get('gameDate', ''),
+                'venue_name': game.get('venue', {}).get('name'),
+                'home_id': home.get('team', {}).get('id'),
+                'home_name': home.get('team', {}).get('name', ''),
+                'away_id': away.get('team', {}).get('id'),
+                'away_name': away.get('team', {}).get('name', ''),
+                'home_probable_pitcher': home.get('probablePitcher', {}).get('fullName', ''),
+                'away_probable_pitcher': away.get('probablePitcher', {}).get('fullName', ''),
+            })
+    return games
+
+
+class AsyncGameSnapshot:
+    """
+    Per-game view of the boxscore for the async client, downloaded at most once
+
+    Concurrent awaiters share the same in-flight download, and a failed
+    download is re-raised to every consumer rather than retried.
+
+    Args:
+        client (AsyncMLBClient): The client used to fetch data
+        game_id (int): The game ID
+    """
+
+    def __init__(self, client, game_id):
+        self.client = client
+        self.game_id = game_id
+        self._boxscore_task = None
+        self._parsed_boxscore = None
+        self._people = {}
+        self._people_lock = asyncio.Lock()
+
+    async def boxscore(self):
+        """
+        Get the raw boxscore JSON for the game
+
+        Returns:
+            dict: The raw boxscore JSON
+        """
+        if self._boxscore_task is None:
+            url = BOXSCORE_URL.format(game_id=self.game_id)
+            self._boxscore_task = asyncio.ensure_future(self.client.get_json(url, {'fields': BOXSCORE_FIELDS}))
+        return await self._boxscore_task
+
+    async def parsed_boxscore(self):
+        """
+        Get the boxscore as extracted by parse_boxscore, computed once
+
+        Returns:
+            dict: The parsed boxscore
+        """
+        if self._parsed_boxscore is None:
+            self._parsed_boxscore = parse_boxscore(await self.boxscore())
+        return self._parsed_boxscore
+
+    async def get_person(self, person_id):
+        """
+        Get a person's details, resolving both starting pitchers in one request on first use
+
+        Batters' jersey numbers and positions are in the boxscore itself, so
+        only the pitchers are looked up, as GameSnapshot.person_ids does.
+
+        Args:
+            person_id (int): The MLB ID of the person
+
+        Returns:
+            dict: Person details as returned by get_people_details, or None
+        """
+        async with self._people_lock:
+            if person_id not in self._people:
+                wanted = []
+                try:
+                    boxscore = await self.boxscore()
+                    starters = find_starting_pitchers(boxscore, parsed=await self.parsed_boxscore())
+                    wanted.extend(pid for pid in starters.values() if pid)
+                except FETCH_ERRORS:
+                    pass
+                wanted = [pid for pid in dict.fromkeys(wanted + [person_id]) if pid not in self._people]
+                resolved = await self.client.get_people_details(wanted)
+                for pid in wanted:
+                    self._people[pid] = resolved.get(pid)
+            return self._people[person_id]
+
+
+class AsyncMLBClient:
+    """
+    Awaitable equivalents of the print_lineups.py fetch functions
+
+    Use as an async context manager to have the client own its aiohttp
+    session, or pass an existing session to share one across clients.
+
+    Args:
+        session (aiohttp.ClientSession, optional): Session to make requests with
+        max_concurrency (int, optional): Maximum number of requests in flight at once
+    """
+
+    def __init__(self, session=None, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        self._session = session
+        self._owns_session = session is None
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self._max_concurrency)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the aiohttp session if this client created it"""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def snapshot(self, game_id):
+        """
+        Create a snapshot for sharing one boxscore download between lookups
+
+        Args:
+            game_id (int): The game ID
+
+        Returns:
+            AsyncGameSnapshot: A new snapshot for the game
+        """
+        return AsyncGameSnapshot(self, game_id)
+
+    async def get_json(self, url, params=None):
+        """
+        Fetch a URL and decode its JSON body, respecting the concurrency limit
+
+        Args:
+            url (str): The URL to fetch
+            params (dict, optional): Query string parameters
+
+        Returns:
+            dict: The decoded JSON response
+        """
+        async with self._semaphore, self._session.get(url, params=params) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def schedule(self, date=None, team_id=None, game_id=None):
+        """
+        Fetch schedule entries in the same shape statsapi.schedule returns
+
+        Args:
+            date (str, optional): Date in YYYY-MM-DD format
+            team_id (int, optional): Only include games for this team
+            game_id (int, optional): Only include this game
+
+        Returns:
+            list: Schedule entries
+        """
+        params = {'sportId': 1, 'hydrate': 'probablePitcher'}
+        if date:
+            params['date'] = date
+        if team_id:
+            params['teamId'] = team_id
+        if game_id:
+            params['gamePk'] = game_id
+        return schedule_games_from_response(await self.get_json(SCHEDULE_URL, params))
+
+    async def get_team_game(self, team_id, date=None):
+        """
+        Fetch a team's game information for a specific date
+
+        Args:
+            team_id (int): The MLB team ID
+            date (str, optional): Date in YYYY-MM-DD format. Defaults to today's date.
+
+        Returns:
+            tuple: (game_id, game_status, venue_name, team_names, game_time) or (None, None, None, None, error_message)
+        """
+        if date is None:
+            date = get_today_date_eastern()
+
+        try:
+            schedule_data = await self.schedule(date=date, team_id=team_id)
+
+            if not schedule_data:
+                return None, None, None, None, "No game scheduled for the selected team on this date."
+
+            return parse_schedule_game(schedule_data[0])
+        except Exception as e:
+            return None, None, None, None, f"Error fetching game data: {e}"
+
+    async def get_player_details(self, player_id):
+        """
+        Fetch detailed information about a player
+
+        Args:
+            player_id (int): The MLB ID of the player
+
+        Returns:
+            dict: Player details including name and jersey number
+        """
+        try:
+            data = await self.get_json(PERSON_URL.format(person_id=player_id),
+                                      {'fields': PEOPLE_FIELDS})
+            if not data.get('people'):
+                return None
+            return build_player_details(data['people'][0])
+        except FETCH_ERRORS as e:
+            print(f"Error fetching player details: {e}")
+            return None
+
+    async def get_pitcher_details(self, pitcher_id):
+        """
+        Fetch detailed information about a pitcher
+
+        Args:
+            pitcher_id (int): The MLB ID of the pitcher
+
+        Returns:
+            dict: Pitcher details including name, jersey number, and handedness
+        """
+        try:
+            data = await self.get_json(PERSON_URL.format(person_id=pitcher_id),
+                                      {'fields': PEOPLE_FIELDS})
+            if not data.get('people'):
+                return None
+            return build_pitcher_details(data['people'][0])
+        except FETCH_ERRORS as e:
+            print(f"Error fetching pitcher details: {e}")
+            return None
+
+    async def get_people_details(self, person_ids):
+        """
+        Fetch details for many people with a single request
+
+        Args:
+            person_ids (list): MLB IDs of the players and pitchers to look up
+
+        Returns:
+            dict: Person details (name, jersey, throws, throws_desc) keyed by person ID
+        """
+        if not person_ids:
+            return {}
+
+        params = {'personIds': ','.join(str(pid) for pid in person_ids), 'fields': PEOPLE_FIELDS}
+        try:
+            data = await self.get_json(PEOPLE_URL, params)
+            return {person['id']: build_pitcher_details(person)
+                    for person in data.get('people', []) if 'id' in person}
+        except FETCH_ERRORS as e:
+            print(f"Error fetching player details: {e}")
+            return {}
+
+    async def get_umpires(self, game_id, snapshot=None):
+        """
+        Fetch umpire information for a game
+
+        Args:
+            game_id (int): The game ID
+            snapshot (AsyncGameSnapshot, optional): Shared per-game data to read from
+
+        Returns:
+            list: Umpire information including names and positions
+        """
+        if snapshot is None:
+            snapshot = self.snapshot(game_id)
+
+        try:
+            return parse_umpires(await snapshot.boxscore())
+        except FETCH_ERRORS as e:
+            print(f"Error fetching umpire data: {e}")
+            return None
+
+    async def get_pitchers_from_schedule(self, game_id, team_id):
+        """
+        Fetch probable pitchers from the schedule endpoint for upcoming games
+
+        Args:
+            game_id (int): The game ID
+            team_id (int): The MLB team ID for the team of interest
+
+        Returns:
+            dict: Pitcher information for both teams
+        """
+        try:
+            schedule_data = await self.schedule(game_id=game_id)
+            if not schedule_data:
+                return None
+            return parse_schedule_pitchers(schedule_data[0], team_id)
+        except Exception as e:
+            print(f"Error fetching probable pitchers from schedule: {e}")
+            return None
+
+    async def get_pitchers_from_boxscore(self, game_id, team_id, snapshot=None):
+        """
+        Fetch pitchers from the boxscore endpoint for completed games
+
+        Args:
+            game_id (int): The game ID
+            team_id (int): The MLB team ID for the team of interest
+            snapshot (AsyncGameSnapshot, optional): Shared per-game data to read from
+
+        Returns:
+            dict: Pitcher information for both teams
+        """
+        if snapshot is None:
+            snapshot = self.snapshot(game_id)
+
+        try:
+            pitchers, starter_ids = parse_boxscore_pitchers(await snapshot.boxscore(), team_id,
+                                                            parsed=await snapshot.parsed_boxscore())
+            for team_key, pitcher_id in starter_ids.items():
+                if pitcher_id:
+                    pitchers[team_key] = await snapshot.get_person(pitcher_id)
+            return pitchers
+        except FETCH_ERRORS as e:
+            print(f"Error fetching pitchers from boxscore: {e}")
+            return None
+
+    async def get_probable_pitchers(self, game_id, status, team_id, snapshot=None):
+        """
+        Fetch the probable starting pitchers for a game
+
+        Args:
+            game_id (int): The game ID
+            status (str): The game status
+            team_id (int): The MLB team ID for the team of interest
+            snapshot (AsyncGameSnapshot, optional): Shared per-game data to read from
+
+        Returns:
+            dict: Pitcher information for both teams
+        """
+        if status in ["Final", "In Progress"]:
+            return await self.get_pitchers_from_boxscore(game_id, team_id, snapshot=snapshot)
+        return await self.get_pitchers_from_schedule(game_id, team_id)
+
+    async def fallback_get_lineup(self, game_id, team_id, snapshot=None):
+        """
+        Fetch both starting lineups from the raw boxscore
+
+        Args:
+            game_id (int): The game ID
+            team_id (int): The MLB team ID for the team of interest
+            snapshot (AsyncGameSnapshot, optional): Shared per-game data to read from
+
+        Returns:
+            tuple: (lineup_data, error_message)
+        """
+        if snapshot is None:
+            snapshot = self.snapshot(game_id)
+
+        try:
+            return parse_boxscore_lineup(await snapshot.boxscore(), team_id)
+        except FETCH_ERRORS as e:
+            return None, f"Error fetching lineup data: {e}"
+        except KeyError as e:
+            return None, f"Lineup data not available yet: {e}"
+
+    async def fetch_game_details(self, game_id, game_status, team_id):
+        """
+        Fetch the starting pitchers, umpires and lineups for a game concurrently
+
+        Args:
+            game_id (int): The game ID
+            game_status (str): The game status
+            team_id (int): The MLB team ID for the team of interest
+
+        Returns:
+            tuple: (pitchers, umpires, lineup_data, lineup_error)
+        """
+        snapshot = self.snapshot(game_id)
+        pitchers, umpires, (lineup_data, error) = await asyncio.gather(
+            self.get_probable_pitchers(game_id, game_status, team_id, snapshot=snapshot),
+            self.get_umpires(game_id, snapshot=snapshot),
+            self.fallback_get_lineup(game_id, team_id, snapshot=snapshot),
+        )
+        return pitchers, umpires, lineup_data, error
@@ -0,0 +1,341 @@
+"""
+Resumable backfill of starting lineups for whole seasons
+
+The season's schedule is fetched with one ranged request, and every
+completed game between two MLB teams is then fetched on a thread pool,
+with all requests held under a rate limit. Each game's lineups and
+starting pitchers are written to a local SQLite store in the same
+transaction that checkpoints its game_id, so an interrupted run picks up
+where it left off without refetching anything.
+
+Example:
+    python backfill.py --season 2025 --store lineups-2025.sqlite3 --workers 8 --rate 10
+"""
+import argparse
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from print_lineups import (
+    POOL_CONNECTIONS,
+    TEAM_ABBRS,
+    GameSnapshot,
+    create_session,
+    get_games_in_range,
+    set_session,
+    statsapi,
+)
+
+DEFAULT_STORE_PATH = "lineups.sqlite3"
+DEFAULT_WORKERS = 8
+
+# Maximum requests per second sent to the MLB Stats API
+DEFAULT_RATE = 10.0
+
+# Seconds between progress reports
+REPORT_INTERVAL = 5.0
+
+# Statuses of games whose lineups will not change any more
+COMPLETED_STATUSES = ("Final", "Game Over", "Completed Early")
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces calls evenly at a fixed rate
+
+    Args:
+        rate (float): Maximum number of calls per second
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the caller may make its next call"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    Transport adapter that waits on a RateLimiter before sending each request
+
+    Args:
+        limiter (RateLimiter): The limiter shared by every request
+        **kwargs: Passed on to HTTPAdapter (e.g. pool_maxsize)
+    """
+
+    def __init__(self, limiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire()
+        return super().send(request, **kwargs)
+
+
+def create_rate_limited_session(rate, pool_maxsize):
+    """
+    Create a pooled session whose requests are held under a rate limit
+
+    Args:
+        rate (float): Maximum requests per second
+        pool_maxsize (int): Maximum connections kept open per host
+
+    Returns:
+        requests.Session: A session for set_session
+    """
+    session = create_session(pool_maxsize=pool_maxsize)
+    adapter = RateLimitedAdapter(RateLimiter(rate), pool_connections=POOL_CONNECTIONS,
+                                 pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class LineupStore:
+    """
+    SQLite store of backfilled lineups, doubling as the checkpoint of finished games
+
+    A game's row in the games table is written in the same transaction as
+    its lineups, so a game_id is only ever checkpointed with all of its data.
+
+    Args:
+        path (str): Path to the database file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS games ("
+            " game_id INTEGER PRIMARY KEY,"
+            " game_date TEXT NOT NULL,"
+            " home_id INTEGER,"
+            " away_id INTEGER,"
+            " home_pitcher_id INTEGER,"
+            " away_pitcher_id INTEGER,"
+            " fetched REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS lineups ("
+            " game_id INTEGER NOT NULL,"
+            " team_id INTEGER NOT NULL,"
+            " batting_order INTEGER NOT NULL,"
+            " person_id INTEGER,"
+            " name TEXT NOT NULL,"
+            " position TEXT NOT NULL,"
+            " jersey TEXT NOT NULL,"
+            " PRIMARY KEY (game_id, team_id, batting_order))"
+        )
+        self._conn.commit()
+
+    def completed_game_ids(self):
+        """
+        Get the IDs of every game already stored
+
+        Returns:
+            set: The checkpointed game IDs
+        """
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT game_id FROM games")}
+
+    def save_game(self, game, teams):
+        """
+        Store a game's lineups and starting pitchers, and checkpoint it
+
+        Args:
+            game (dict): The statsapi schedule entry for the game
+            teams (dict): The game as parsed by parse_boxscore
+        """
+        rows = [
+            (game['game_id'], teams[side]['team_id'], player['batting_order'], player.get('id'),
+             player['name'], player['position'], player['jersey'])
+            for side in ('home', 'away')
+            for player in teams[side]['lineup']
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO lineups"
+                " (game_id, team_id, batting_order, person_id, name, position, jersey)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO games"
+                " (game_id, game_date, home_id, away_id, home_pitcher_id, away_pitcher_id, fetched)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (game['game_id'], game.get('game_date', ''), teams['home']['team_id'],
+                 teams['away']['team_id'], teams['home']['starting_pitcher'],
+                 teams['away']['starting_pitcher'], time.time()),
+            )
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+def get_season_dates(season):
+    """
+    Look up the first and last dates of a season's regular season and postseason
+
+    Args:
+        season (int): The season, e.g. 2025
+
+    Returns:
+        tuple: (start_date, end_date) in YYYY-MM-DD format
+    """
+    info = statsapi.get('season', {'seasonId': season, 'sportId': 1})['seasons'][0]
+    end_date = info.get('postSeasonEndDate') or info['regularSeasonEndDate']
+    return info['regularSeasonStartDate'], end_date
+
+
+def get_backfill_games(start_date, end_date):
+    """
+    Fetch the completed games between two MLB teams in a range of dates
+
+    Args:
+        start_date (str): First date in YYYY-MM-DD format
+        end_date (str): Last date in YYYY-MM-DD format (inclusive)
+
+    Returns:
+        tuple: (games, error_message) where games is a list of statsapi schedule entries
+    """
+    games, error = get_games_in_range(start_date, end_date)
+    if error:
+        return [], error
+    return [game for game in games
+            if game['status'] in COMPLETED_STATUSES
+            and game.get('home_id') in TEAM_ABBRS and game.get('away_id') in TEAM_ABBRS], None
+
+
+def fetch_game_lineups(game):
+    """
+    Fetch and parse one game's boxscore
+
+    Args:
+        game (dict): The statsapi schedule entry for the game
+
+    Returns:
+        dict: The game as parsed by parse_boxscore
+
+    Raises:
+        requests.exceptions.RequestException: If the request failed
+    """
+    return GameSnapshot(game['game_id'], game['status']).parsed_boxscore
+
+
+def backfill(games, store, max_workers=DEFAULT_WORKERS, report_interval=REPORT_INTERVAL):
+    """
+    Fetch and store every game not already checkpointed in the store
+
+    Games are fetched on a thread pool and written from the calling thread
+    as each one completes. Games that fail are reported and left
+    unchecked, so the next run tries them again.
+
+    Args:
+        games (list): statsapi schedule entries of the games to backfill
+        store (LineupStore): Where results are written
+        max_workers (int, optional): Maximum number of games fetched at once
+        report_interval (float, optional): Seconds between progress reports
+
+    Returns:
+        tuple: (stored, failed) counts of games
+    """
+    done = store.completed_game_ids()
+    pending = [game for game in games if game['game_id'] not in done]
+    print(f"{len(games)} completed games, {len(games) - len(pending)} already stored, "
+          f"{len(pending)} to fetch")
+
+    stored = failed = 0
+    start = last_report = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        futures = {executor.submit(fetch_game_lineups, game): game for game in pending}
+        for future in as_completed(futures):
+            game = futures[future]
+            try:
+                teams = future.result()
+            except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+                failed += 1
+                print(f"Error fetching game {game['game_id']}: {e}")
+                continue
+
+            store.save_game(game, teams)
+            stored += 1
+
+            now = time.monotonic()
+            if now - last_report >= report_interval:
+                last_report = now
+                print(f"{stored + failed}/{len(pending)} games, "
+                      f"{stored / (now - start):.2f} games/s")
+    finally:
+        # On an interrupt, drop the games not yet started instead of waiting for them
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    elapsed = time.monotonic() - start
+    rate = stored / elapsed if elapsed > 0 else 0.0
+    print(f"Stored {stored} games ({failed} failed) in {elapsed:.1f}s, {rate:.2f} games/s")
+    return stored, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backfill MLB starting lineups into a local store')
+    parser.add_argument('--season', type=int, help='Season to backfill, e.g. 2025')
+    parser.add_argument('--start-date', type=str, help='First date in YYYY-MM-DD format (default: start of the season)')
+    parser.add_argument('--end-date', type=str, help='Last date in YYYY-MM-DD format (default: end of the season)')
+    parser.add_argument('--store', type=str, default=DEFAULT_STORE_PATH,
+                        help=f'SQLite file results are written to (default: {DEFAULT_STORE_PATH})')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Maximum number of games fetched at once (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f'Maximum requests per second (default: {DEFAULT_RATE:g})')
+    args = parser.parse_args()
+
+    if args.season is None and (args.start_date is None or args.end_date is None):
+        parser.error("--season is required unless both --start-date and --end-date are given")
+
+    # Every request, including those made by statsapi, goes through the rate-limited session
+    set_session(create_rate_limited_session(args.rate, max(1, args.workers)))
+
+    start_date, end_date = args.start_date, args.end_date
+    if start_date is None or end_date is None:
+        season_start, season_end = get_season_dates(args.season)
+        start_date = start_date or season_start
+        end_date = end_date or season_end
+
+    print(f"Fetching the schedule from {start_date} to {end_date}...")
+    games, error = get_backfill_games(start_date, end_date)
+    if error:
+        print(error)
+        sys.exit(1)
+
+    store = LineupStore(args.store)
+    try:
+        _, failed = backfill(games, store, args.workers)
+    finally:
+        store.close()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("Interrupted; run again to resume")
+        sys.exit(1)
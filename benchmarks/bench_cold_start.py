@@ -0,0 +1,115 @@
+"""
+Measure print_lineups.py's cold start on the runs that end before any request
+
+`--help` and an invalid --team exit right after argument checks, so they
+should not import requests, pytz or statsapi, nor the response cache
+(with sqlite3) or concurrent.futures. Each run is timed in a fresh
+interpreter with -X importtime. The benchmark fails (exit status 1) if a
+deferred module is imported on these paths, or if importing print_lineups
+costs more than --budget times what importing the deferred modules costs
+on the same machine.
+
+Usage:
+    python benchmarks/bench_cold_start.py [--runs N] [--budget FRACTION]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'print_lineups.py')
+
+# Modules print_lineups.py imports only when a run needs them
+DEFERRED_MODULES = ('requests', 'pytz', 'statsapi', 'response_cache', 'sqlite3', 'concurrent.futures')
+
+FAST_PATHS = {
+    '--help': ['--help'],
+    'invalid team': ['--team', 'XYZ'],
+}
+
+# Fraction of the deferred modules' import time that importing print_lineups may take.
+# requests, pytz and statsapi dominate the sum; response_cache, sqlite3 and
+# concurrent.futures add a few milliseconds that every early exit used to pay
+DEFAULT_BUDGET = 0.5
+
+
+def parse_importtime(stderr):
+    """
+    Read the cumulative import times from -X importtime output
+
+    Args:
+        stderr (str): The interpreter's stderr
+
+    Returns:
+        dict: Cumulative microseconds keyed by module name
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def run(args):
+    """
+    Run the interpreter once with -X importtime
+
+    Args:
+        args (list): Arguments after `python -X importtime`
+
+    Returns:
+        tuple: (wall seconds, cumulative import times by module)
+    """
+    # Run in-process even if a lineup helper is listening
+    env = dict(os.environ, MLB_LINEUPS_NO_HELPER='1')
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args], capture_output=True,
+                            text=True, cwd=ROOT, env=env, check=False)
+    return time.perf_counter() - start, parse_importtime(result.stderr)
+
+
+def best(args, runs, measure):
+    """
+    Returns:
+        The smallest value of measure(wall seconds, import times) over several runs
+    """
+    return min(measure(*run(args)) for _ in range(runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='Runs per measurement; the best is kept (default: 5)')
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET,
+                        help=f'Allowed fraction of the deferred imports\' cost (default: {DEFAULT_BUDGET})')
+    args = parser.parse_args()
+    failures = []
+
+    # What every run would pay with eager imports, measured on this machine
+    deferred = best(['-c', f"import {', '.join(DEFERRED_MODULES)}"], args.runs,
+                    lambda _, times: sum(times.get(name, 0) for name in DEFERRED_MODULES))
+    module = best(['-c', 'import print_lineups'], args.runs, lambda _, times: times['print_lineups'])
+    print(f"{'import deferred modules':28s} {deferred / 1000:8.1f} ms")
+    print(f"{'import print_lineups':28s} {module / 1000:8.1f} ms")
+    if module > args.budget * deferred:
+        failures.append(f"importing print_lineups takes {module / 1000:.1f} ms, over "
+                        f"{args.budget:g} x {deferred / 1000:.1f} ms")
+
+    for label, argv in FAST_PATHS.items():
+        results = [run([SCRIPT, *argv]) for _ in range(args.runs)]
+        wall = min(seconds for seconds, _ in results)
+        imported = sorted({name for _, times in results for name in times if name in DEFERRED_MODULES})
+        print(f"{label:28s} {wall * 1000:8.1f} ms")
+        if imported:
+            failures.append(f"{label} imported {', '.join(imported)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Compare get_lineup's direct boxscore parser with the statsapi.boxscore_data path
+
+The fixture in tests/fixtures/boxscore_response.json is expanded to full
+26-man rosters (nine starters, substitutes and a bullpen per side) so the
+numbers reflect a real game. No network access is needed: the statsapi
+path is fed an equivalent live feed document.
+
+Usage:
+    python benchmarks/bench_lineup_parser.py [iterations]
+"""
+import copy
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import statsapi
+
+import print_lineups
+
+# Stat fields statsapi.boxscore_data reads for every batter and pitcher
+BATTING_STATS = dict.fromkeys(['atBats', 'runs', 'hits', 'doubles', 'triples', 'homeRuns', 'rbi',
+                               'stolenBases', 'baseOnBalls', 'strikeOuts', 'leftOnBase'], 0)
+PITCHING_STATS = dict.fromkeys(['hits', 'runs', 'earnedRuns', 'baseOnBalls', 'strikeOuts',
+                                'homeRuns', 'numberOfPitches', 'strikes'], 0)
+SEASON_STATS = {
+    'batting': {'avg': '.250', 'ops': '.700', 'obp': '.320', 'slg': '.380'},
+    'pitching': {'era': '3.50'},
+}
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       'tests', 'fixtures', 'boxscore_response.json')
+
+
+def build_boxscore():
+    """Expand the fixture into a boxscore with full rosters and batting orders"""
+    with open(FIXTURE) as f:
+        boxscore = json.load(f)
+
+    for side, team in boxscore['teams'].items():
+        templates = list(team['players'].values())
+        batter = next(p for p in templates if p['position']['abbreviation'] != 'P')
+        pitcher = next((p for p in templates if p['position']['abbreviation'] == 'P'), batter)
+        players = {}
+        base_id = 100000 if side == 'home' else 200000
+        for i in range(26):
+            person_id = base_id + i
+            player = copy.deepcopy(pitcher if i >= 12 else batter)
+            player['person']['id'] = person_id
+            player['person']['fullName'] = f"Player {person_id}"
+            player['jerseyNumber'] = str(i)
+            player['stats'] = {'batting': dict(BATTING_STATS), 'fielding': {}}
+            player['seasonStats'] = copy.deepcopy(SEASON_STATS)
+            if i < 9:
+                player['battingOrder'] = str((i + 1) * 100)
+            elif i < 12:
+                player['battingOrder'] = str((i - 8) * 100 + 1)
+            else:
+                player['position'] = {'code': '1', 'name': 'Pitcher', 'type': 'Pitcher', 'abbreviation': 'P'}
+                player['stats']['pitching'] = dict(PITCHING_STATS, inningsPitched=str(6 - (i - 12) * 0.5))
+            players[f"ID{person_id}"] = player
+        team['players'] = players
+        team['battingOrder'] = [base_id + i for i in range(9)]
+        team['batters'] = [base_id + i for i in range(12)]
+        team['pitchers'] = [base_id + i for i in range(12, 26)]
+        team['teamStats'] = {
+            'batting': dict(BATTING_STATS),
+            'pitching': dict(PITCHING_STATS, inningsPitched='9.0'),
+        }
+        team['info'] = []
+        team['note'] = []
+        team['team'].setdefault('teamName', team['team']['name'].split()[-1])
+    return boxscore
+
+
+def build_live_feed(boxscore):
+    """Wrap a boxscore in the live feed document statsapi.boxscore_data reads"""
+    players = {}
+    for team in boxscore['teams'].values():
+        for key, player in team['players'].items():
+            players[key] = dict(player['person'], boxscoreName=player['person']['fullName'])
+    teams = {side: dict(team['team'], shortName=team['team']['name'])
+             for side, team in boxscore['teams'].items()}
+    return {
+        'gameData': {'game': {'id': 778518}, 'teams': teams, 'players': players},
+        'liveData': {'boxscore': boxscore},
+    }
+
+
+def statsapi_path(team_id):
+    """The lineup extraction get_lineup used to do on top of statsapi.boxscore_data"""
+    boxscore = statsapi.boxscore_data(778518)
+    is_home = boxscore['teamInfo']['home']['id'] == team_id
+    lineups = []
+    for batters in (boxscore['homeBatters'], boxscore['awayBatters']) if is_home else \
+            (boxscore['awayBatters'], boxscore['homeBatters']):
+        starters = [b for b in batters if b.get('personId', 0) > 0 and not b.get('substitution')]
+        starters.sort(key=lambda x: x.get('battingOrder', '999'))
+        lineups.append([{
+            'name': boxscore['playerInfo'].get(f"ID{b['personId']}", {}).get('fullName', b['name']),
+            'position': b['position'],
+            'batting_order': i + 1,
+        } for i, b in enumerate(starters)])
+    return lineups
+
+
+def direct_path(boxscore, team_id):
+    """The single-pass parser get_lineup uses now"""
+    return print_lineups.parse_boxscore(boxscore)
+
+
+def measure(label, func, iterations):
+    seconds = min(timeit.repeat(func, number=iterations, repeat=5)) / iterations
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<24} {seconds * 1e6:10.1f} us/game {peak / 1024:10.1f} KiB peak")
+    return seconds
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    boxscore = build_boxscore()
+    live_feed = build_live_feed(boxscore)
+    team_id = boxscore['teams']['away']['team']['id']
+
+    # statsapi fetches the live feed itself, so serve it the prepared document
+    with patch('statsapi.get', return_value=live_feed):
+        old = measure("statsapi.boxscore_data", lambda: statsapi_path(team_id), iterations)
+    new = measure("parse_boxscore", lambda: direct_path(boxscore, team_id), iterations)
+    print(f"speedup: {old / new:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
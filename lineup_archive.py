@@ -0,0 +1,317 @@
+"""
+Compact, memory-mapped archive of starting lineups
+
+Lineups are stored column by column in flat typed arrays rather than as
+nested dicts: integer person IDs, small-int batting slots, position codes
+into an interned position table, and name/jersey indexes into one shared
+string table. A season of both teams' lineups takes a few hundred
+kilobytes, and an archive file is read through mmap, so opening it is
+instant and every process reading the same file shares one copy of it in
+the page cache.
+
+File layout (all integers in native byte order, which is recorded in the
+header; each section starts on an 8-byte boundary):
+
+    header      magic, byte order, and the lineup/player/string/position counts
+    lineups     game_id (int64), team_id (int32), start (uint32, one extra
+                entry so lineup i's players are start[i]:start[i + 1])
+    players     person_id (int32), name (uint32), jersey (uint32),
+                position (uint8), batting_order (uint8)
+    positions   string index (uint32) of each position code
+    strings     offsets (uint32, one extra entry) and UTF-8 data
+
+Example:
+    python lineup_archive.py lineups-2024.sqlite3 lineups-2025.sqlite3 -o lineups.lna
+
+    with LineupArchive("lineups.lna") as archive:
+        lineup = archive.find(778518, 121)
+"""
+import argparse
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+MAGIC = b"MLBLNUP1"
+
+# magic, byte order ('l' or 'b'), then lineup, player, string and position counts
+HEADER = struct.Struct("<8sc7xQQQQ")
+
+# Column type codes, in file order
+LINEUP_COLUMNS = (("game_ids", "q"), ("team_ids", "i"), ("starts", "I"))
+PLAYER_COLUMNS = (("person_ids", "i"), ("names", "I"), ("jerseys", "I"),
+                  ("positions", "B"), ("batting_orders", "B"))
+TABLE_COLUMNS = (("_position_strings", "I"), ("_string_offsets", "I"))
+
+# Stand-in for a missing person ID
+NO_PERSON = -1
+
+
+def _padding(offset):
+    return -offset % 8
+
+
+class LineupArchiveBuilder:
+    """
+    Collects lineups and writes them as a LineupArchive file
+
+    Strings (names and jersey numbers) and positions are interned as they
+    are added, so each distinct value is stored once.
+    """
+
+    def __init__(self):
+        self._strings = {}
+        self._positions = {}
+        self._lineups = {}
+
+    def _intern(self, text):
+        return self._strings.setdefault(text, len(self._strings))
+
+    def _position(self, position):
+        if position not in self._positions:
+            if len(self._positions) == 255:
+                raise ValueError("Too many distinct positions for a one-byte code")
+            self._positions[position] = len(self._positions)
+        return self._positions[position]
+
+    def __len__(self):
+        return len(self._lineups)
+
+    def add_lineup(self, game_id, team_id, lineup):
+        """
+        Add (or replace) one team's lineup for a game
+
+        Args:
+            game_id (int): The game ID
+            team_id (int): The MLB team ID
+            lineup (list): Entries as returned by get_lineup (id, name, position,
+                batting_order, jersey)
+        """
+        self._lineups[(game_id, team_id)] = [(
+            NO_PERSON if player.get('id') is None else player['id'],
+            self._intern(player['name']),
+            self._intern(player.get('jersey') or ''),
+            self._position(player['position']),
+            player['batting_order'],
+        ) for player in lineup]
+
+    def add_game(self, game_id, teams):
+        """
+        Add both lineups of a game
+
+        Args:
+            game_id (int): The game ID
+            teams (dict): The game as parsed by parse_boxscore
+        """
+        for side in ('home', 'away'):
+            self.add_lineup(game_id, teams[side]['team_id'], teams[side]['lineup'])
+
+    def add_store(self, path):
+        """
+        Add every lineup from a backfill.py LineupStore database
+
+        Args:
+            path (str): Path to the store's SQLite file
+        """
+        conn = sqlite3.connect(path)
+        try:
+            rows = conn.execute(
+                "SELECT game_id, team_id, person_id, name, position, batting_order, jersey"
+                " FROM lineups ORDER BY game_id, team_id, batting_order"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        lineups = {}
+        for game_id, team_id, person_id, name, position, batting_order, jersey in rows:
+            lineups.setdefault((game_id, team_id), []).append({
+                'id': person_id, 'name': name, 'position': position,
+                'batting_order': batting_order, 'jersey': jersey,
+            })
+        for (game_id, team_id), lineup in lineups.items():
+            self.add_lineup(game_id, team_id, lineup)
+
+    def write(self, path):
+        """
+        Write the archive, replacing any existing file at path atomically
+
+        Args:
+            path (str): Where to write the archive
+        """
+        columns = {name: array(code) for name, code in LINEUP_COLUMNS + PLAYER_COLUMNS}
+        columns['starts'].append(0)
+        # Sorted by game and team so LineupArchive.find can binary search
+        for (game_id, team_id), players in sorted(self._lineups.items()):
+            columns['game_ids'].append(game_id)
+            columns['team_ids'].append(team_id)
+            for person_id, name, jersey, position, batting_order in players:
+                columns['person_ids'].append(person_id)
+                columns['names'].append(name)
+                columns['jerseys'].append(jersey)
+                columns['positions'].append(position)
+                columns['batting_orders'].append(batting_order)
+            columns['starts'].append(len(columns['person_ids']))
+
+        position_strings = array('I', (self._intern(position) for position in self._positions))
+
+        string_offsets = array('I', [0])
+        string_data = bytearray()
+        for text in self._strings:
+            string_data += text.encode('utf-8')
+            string_offsets.append(len(string_data))
+
+        sections = [columns[name] for name, _ in LINEUP_COLUMNS + PLAYER_COLUMNS]
+        sections += [position_strings, string_offsets, bytes(string_data)]
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, sys.byteorder[0].encode(), len(self._lineups),
+                                len(columns['person_ids']), len(self._strings), len(self._positions)))
+            for section in sections:
+                f.write(bytes(section) if isinstance(section, array) else section)
+                f.write(b"\0" * _padding(f.tell()))
+        os.replace(tmp_path, path)
+
+
+class LineupArchive:
+    """
+    Read-only view of a lineup archive file, backed by mmap
+
+    Columns are exposed as typed memoryviews over the mapped file, so no
+    data is copied or parsed when the archive is opened; lineups are only
+    turned into dicts when asked for.
+
+    Args:
+        path (str): Path to a file written by LineupArchiveBuilder
+
+    Raises:
+        ValueError: If the file is not a lineup archive or was written with
+            a different byte order
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        try:
+            magic, byteorder, n_lineups, n_players, n_strings, n_positions = HEADER.unpack_from(self._view)
+        except struct.error as e:
+            self.close()
+            raise ValueError(f"{path} is not a lineup archive") from e
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a lineup archive")
+        if byteorder != sys.byteorder[0].encode():
+            self.close()
+            raise ValueError(f"{path} was written on a machine with a different byte order")
+
+        counts = {'game_ids': n_lineups, 'team_ids': n_lineups, 'starts': n_lineups + 1,
+                  '_position_strings': n_positions, '_string_offsets': n_strings + 1}
+        counts.update({name: n_players for name, _ in PLAYER_COLUMNS})
+
+        offset = HEADER.size
+        for name, code in LINEUP_COLUMNS + PLAYER_COLUMNS + TABLE_COLUMNS:
+            nbytes = counts[name] * array(code).itemsize
+            setattr(self, name, self._view[offset:offset + nbytes].cast(code))
+            offset += nbytes + _padding(offset + nbytes)
+        self._string_data = self._view[offset:offset + self._string_offsets[-1]]
+
+        self.position_names = [self.string(index) for index in self._position_strings]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.game_ids)
+
+    def close(self):
+        """Release the views and unmap the file"""
+        for name, _ in LINEUP_COLUMNS + PLAYER_COLUMNS + TABLE_COLUMNS + (('_string_data', 'B'),):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._mmap.close()
+
+    def string(self, index):
+        """
+        Args:
+            index (int): An index into the shared string table
+
+        Returns:
+            str: The string
+        """
+        return str(self._string_data[self._string_offsets[index]:self._string_offsets[index + 1]],
+                   'utf-8')
+
+    def lineup(self, index):
+        """
+        Materialize one lineup
+
+        Args:
+            index (int): Position of the lineup in the archive
+
+        Returns:
+            dict: game_id, team_id and lineup (entries as returned by get_lineup)
+        """
+        players = range(self.starts[index], self.starts[index + 1])
+        return {
+            'game_id': self.game_ids[index],
+            'team_id': self.team_ids[index],
+            'lineup': [{
+                'id': None if self.person_ids[i] == NO_PERSON else self.person_ids[i],
+                'name': self.string(self.names[i]),
+                'position': self.position_names[self.positions[i]],
+                'batting_order': self.batting_orders[i],
+                'jersey': self.string(self.jerseys[i]),
+            } for i in players]
+        }
+
+    def find(self, game_id, team_id=None):
+        """
+        Look up a game's lineups by binary search
+
+        Args:
+            game_id (int): The game ID
+            team_id (int, optional): Only return this team's lineup
+
+        Returns:
+            dict or list: With team_id, the lineup as returned by lineup() or None;
+                otherwise a list of the game's lineups
+        """
+        index = bisect_left(self.game_ids, game_id)
+        found = []
+        while index < len(self) and self.game_ids[index] == game_id:
+            if team_id is None or self.team_ids[index] == team_id:
+                found.append(self.lineup(index))
+            index += 1
+        if team_id is not None:
+            return found[0] if found else None
+        return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a lineup archive from backfill stores')
+    parser.add_argument('stores', nargs='+', help='SQLite files written by backfill.py')
+    parser.add_argument('-o', '--output', required=True, help='Archive file to write')
+    args = parser.parse_args()
+
+    builder = LineupArchiveBuilder()
+    for store in args.stores:
+        builder.add_store(store)
+    builder.write(args.output)
+    print(f"Wrote {len(builder)} lineups to {args.output} ({os.path.getsize(args.output)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
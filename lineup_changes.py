@@ -0,0 +1,241 @@
+"""
+Change detection over successive lineup, pitcher and umpire snapshots
+
+A ChangeDetector remembers a digest of every section of a game it has
+seen (each side's lineup, each side's starting pitcher, the umpire crew).
+When a new snapshot comes in, only the sections whose digest moved are
+compared in detail, and each difference is reported as one small event
+dict. Polling a game that has not changed produces no events at all, so
+consumers can fan the events out without reprinting or re-parsing the
+full payloads.
+
+Example:
+    python lineup_changes.py --team NYM --interval 60
+"""
+import argparse
+import hashlib
+import json
+import sys
+import time
+
+from print_lineups import (
+    MLB_TEAMS,
+    fetch_game_details,
+    format_pitcher_info,
+    format_player_info,
+    get_team_game,
+)
+
+# Default seconds between polls
+DEFAULT_POLL_INTERVAL = 60
+
+SIDES = ('team', 'opponent')
+
+# Statuses after which nothing more will change
+FINAL_STATUSES = ("Final", "Game Over", "Completed Early")
+
+
+def section_digest(value):
+    """
+    Hash a section's JSON-compatible value
+
+    Args:
+        value: The section (dicts are hashed independent of key order)
+
+    Returns:
+        str: A hex digest that is equal for equal values
+    """
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def split_sections(pitchers, umpires, lineup_data):
+    """
+    Break one game's details into the sections compared by a ChangeDetector
+
+    Args:
+        pitchers (dict): Starting pitchers as returned by get_probable_pitchers
+        umpires (list): Umpires as returned by get_umpires
+        lineup_data (dict): Lineups as returned by get_lineup
+
+    Returns:
+        dict: Section values keyed by ('lineup' or 'pitcher', side) and ('umpires', None)
+    """
+    sections = {}
+    for side in SIDES:
+        lineup = lineup_data[side]['lineup'] if lineup_data else None
+        sections[('lineup', side)] = lineup or None
+        sections[('pitcher', side)] = pitchers.get(side) if pitchers else None
+    sections[('umpires', None)] = [
+        {'position': umpire.get('officialType'), 'name': umpire.get('official', {}).get('fullName')}
+        for umpire in umpires or []
+    ] or None
+    return sections
+
+
+def diff_lineup(before, after):
+    """
+    Compare two versions of one team's lineup slot by slot
+
+    Args:
+        before (list): The previous lineup entries, or None
+        after (list): The current lineup entries, or None
+
+    Returns:
+        list: {'batting_order', 'before', 'after'} for each slot that differs
+    """
+    old = {player['batting_order']: player for player in before or []}
+    new = {player['batting_order']: player for player in after or []}
+    return [
+        {'batting_order': slot, 'before': old.get(slot), 'after': new.get(slot)}
+        for slot in sorted(old.keys() | new.keys())
+        if old.get(slot) != new.get(slot)
+    ]
+
+
+def _change_type(before, after):
+    if before is None:
+        return 'posted'
+    if after is None:
+        return 'removed'
+    return 'changed'
+
+
+class ChangeDetector:
+    """
+    Compares each game's details with the last ones seen and reports the differences
+
+    The first snapshot of a game reports every section it already has as
+    posted. After that, a section only produces an event when its digest
+    changes.
+    """
+
+    def __init__(self):
+        # (game_id, team_id) -> {section: (digest, value)}
+        self._seen = {}
+
+    def forget(self, game_id, team_id):
+        """
+        Drop what is remembered about a game, e.g. once it is final
+
+        Args:
+            game_id (int): The game ID
+            team_id (int): The MLB team ID the details were fetched for
+        """
+        self._seen.pop((game_id, team_id), None)
+
+    def update(self, game_id, team_id, pitchers, umpires, lineup_data):
+        """
+        Record a game's current details and report what changed
+
+        Args:
+            game_id (int): The game ID
+            team_id (int): The MLB team ID the details were fetched for
+            pitchers (dict): Starting pitchers as returned by get_probable_pitchers
+            umpires (list): Umpires as returned by get_umpires
+            lineup_data (dict): Lineups as returned by get_lineup
+
+        Returns:
+            list: Change events; empty if nothing changed
+        """
+        seen = self._seen.setdefault((game_id, team_id), {})
+        events = []
+        for (section, side), value in split_sections(pitchers, umpires, lineup_data).items():
+            digest = section_digest(value)
+            previous_digest, previous = seen.get((section, side), (None, None))
+            if digest == previous_digest:
+                continue
+            seen[(section, side)] = (digest, value)
+            if previous is None and value is None:
+                continue
+
+            event = {'game_id': game_id, 'team_id': team_id, 'section': section,
+                     'type': _change_type(previous, value)}
+            if side is not None:
+                event['side'] = side
+            if section == 'lineup':
+                event['changes'] = diff_lineup(previous, value)
+            else:
+                event['before'] = previous
+                event['after'] = value
+            events.append(event)
+        return events
+
+    def poll(self, game_id, game_status, team_id):
+        """
+        Fetch a game's details and report what changed since the last poll
+
+        Args:
+            game_id (int): The game ID
+            game_status (str): The game status
+            team_id (int): The MLB team ID for the team of interest
+
+        Returns:
+            list: Change events; empty if nothing changed
+        """
+        pitchers, umpires, lineup_data, _ = fetch_game_details(game_id, game_status, team_id)
+        return self.update(game_id, team_id, pitchers, umpires, lineup_data)
+
+
+def format_event(event):
+    """
+    Format a change event as one line per change
+
+    Args:
+        event (dict): An event as returned by ChangeDetector.update
+
+    Returns:
+        str: A human-readable description
+    """
+    label = event['section'].upper()
+    if 'side' in event:
+        label += f" ({event['side']})"
+    label += f" {event['type']}"
+
+    if event['section'] == 'lineup':
+        lines = [label]
+        for change in event['changes']:
+            before = format_player_info(change['before']) if change['before'] else '-'
+            after = format_player_info(change['after']) if change['after'] else '-'
+            lines.append(f"  {before} -> {after}")
+        return "\n".join(lines)
+    if event['section'] == 'pitcher':
+        before = format_pitcher_info(event['before']) if event['before'] else '-'
+        after = format_pitcher_info(event['after']) if event['after'] else '-'
+        return f"{label}: {before} -> {after}"
+    crew = ", ".join(f"{umpire['position']}: {umpire['name']}" for umpire in event['after'] or [])
+    return f"{label}: {crew or '-'}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print changes to a team's lineups, pitchers and umpires")
+    parser.add_argument('--team', type=str, default='NYM', help='Team abbreviation (default: NYM)')
+    parser.add_argument('--date', type=str, help='Date in YYYY-MM-DD format (default: today)')
+    parser.add_argument('--interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help=f'Seconds between polls (default: {DEFAULT_POLL_INTERVAL})')
+    args = parser.parse_args()
+
+    team_abbr = args.team.upper()
+    if team_abbr not in MLB_TEAMS:
+        print(f"Error: Invalid team abbreviation '{team_abbr}'. Valid options are: {', '.join(sorted(MLB_TEAMS.keys()))}")
+        sys.exit(1)
+    team_id = MLB_TEAMS[team_abbr]
+
+    detector = ChangeDetector()
+    while True:
+        game_id, game_status, _, _, error = get_team_game(team_id, args.date)
+        if game_id is None:
+            print(error)
+            sys.exit(1)
+        for event in detector.poll(game_id, game_status, team_id):
+            print(format_event(event))
+        if game_status in FINAL_STATUSES:
+            return
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        sys.exit(0)
@@ -0,0 +1,278 @@
+"""
+Background helper that runs print_lineups.py invocations in a warm process
+
+Started once, the helper listens on a Unix domain socket and runs each
+forwarded command line through print_lineups.main() in its own process,
+where the HTTP session's connections, the person memo and the roster
+table survive from one run to the next. print_lineups.py tries the socket
+first and only runs in-process if no helper answers.
+
+The client half of this module uses the standard library only, so
+forwarding a command does not pay for importing print_lineups' own
+dependencies.
+
+Protocol: the client sends one JSON line {"argv": [...]}; the helper
+answers with JSON lines {"out": text} and {"err": text} as the run prints,
+then {"exit": code}. A helper already running another command (e.g. one
+with --watch) answers {"busy": true} instead, and the client runs the
+command in-process.
+
+Example:
+    python lineup_helper.py &
+    python print_lineups.py --team NYM
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+
+# Set to any non-empty value to keep print_lineups.py from using a helper
+NO_HELPER_ENV = 'MLB_LINEUPS_NO_HELPER'
+
+# Seconds to wait for the helper to accept a connection
+CONNECT_TIMEOUT = 0.5
+
+
+def get_default_socket_path():
+    """
+    Get the location of the helper's socket
+
+    The MLB_LINEUPS_SOCKET environment variable overrides the default of
+    $XDG_RUNTIME_DIR/mlb-lineups.sock (or ~/.cache/mlb-lineups/helper.sock).
+
+    Returns:
+        str: Path to the socket file
+    """
+    if os.environ.get('MLB_LINEUPS_SOCKET'):
+        return os.environ['MLB_LINEUPS_SOCKET']
+    if os.environ.get('XDG_RUNTIME_DIR'):
+        return os.path.join(os.environ['XDG_RUNTIME_DIR'], 'mlb-lineups.sock')
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'mlb-lineups', 'helper.sock')
+
+
+def forward_to_helper(argv, path=None, stdout=None, stderr=None):
+    """
+    Run a command line in the helper, if one is listening
+
+    Args:
+        argv (list): The arguments after the script name
+        path (str, optional): The helper's socket. Defaults to get_default_socket_path().
+        stdout (file, optional): Where the run's output goes. Defaults to sys.stdout.
+        stderr (file, optional): Where the run's errors go. Defaults to sys.stderr.
+
+    Returns:
+        int: The run's exit code, or None if no helper answered or it was busy (nothing was run)
+    """
+    if os.environ.get(NO_HELPER_ENV) or not hasattr(socket, 'AF_UNIX'):
+        return None
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    path = path or get_default_socket_path()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    started = False
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(path)
+        except OSError:
+            return None
+        # The run itself may take as long as it needs (e.g. with --watch)
+        sock.settimeout(None)
+        sock.sendall(json.dumps({'argv': list(argv)}).encode() + b"\n")
+
+        for line in sock.makefile('r', encoding='utf-8'):
+            message = json.loads(line)
+            if message.get('busy'):
+                return None
+            if 'exit' in message:
+                return message['exit']
+            started = True
+            if 'out' in message:
+                stdout.write(message['out'])
+                stdout.flush()
+            else:
+                stderr.write(message['err'])
+                stderr.flush()
+    except OSError as e:
+        if not started:
+            return None
+        stderr.write(f"Lost connection to the lineup helper: {e}\n")
+        return 1
+    finally:
+        sock.close()
+
+    # The helper went away before finishing; a run that printed nothing can safely be retried
+    if not started:
+        return None
+    stderr.write("Lost connection to the lineup helper\n")
+    return 1
+
+
+class _StreamWriter(io.TextIOBase):
+    """Text stream that sends everything written to it to the client as one kind of message"""
+
+    def __init__(self, send, kind):
+        self._send = send
+        self._kind = kind
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        if text:
+            self._send({self._kind: text})
+        return len(text)
+
+
+class HelperHandler(socketserver.StreamRequestHandler):
+    """Runs one forwarded command line, streaming its output back"""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            argv = [str(arg) for arg in request['argv']]
+        except (ValueError, KeyError, TypeError):
+            return
+
+        def send(message):
+            self.wfile.write(json.dumps(message).encode() + b"\n")
+
+        try:
+            # print_lineups writes to the process-wide sys.stdout, so only one run at a
+            # time; rather than queue behind a long one (--watch, a date range), send
+            # the client back to running in its own process
+            if not self.server.run_lock.acquire(blocking=False):
+                send({'busy': True})
+                return
+            try:
+                exit_code = self.server.run(argv, _StreamWriter(send, 'out'), _StreamWriter(send, 'err'))
+            finally:
+                self.server.run_lock.release()
+            send({'exit': exit_code})
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away mid-run
+            pass
+
+
+class HelperServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix socket server running print_lineups.main() for its clients
+
+    Args:
+        path (str): Where to create the socket
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path):
+        self.run_lock = threading.Lock()
+        self.runs = 0
+        super().__init__(path, HelperHandler)
+        # Only the user running the helper may use it
+        os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
+
+    def run(self, argv, stdout, stderr):
+        """
+        Run print_lineups.main() with a command line, as `python print_lineups.py` would
+
+        Args:
+            argv (list): The arguments after the script name
+            stdout (file): Receives the run's output
+            stderr (file): Receives the run's errors
+
+        Returns:
+            int: The exit code
+        """
+        import print_lineups
+
+        saved_argv = sys.argv
+        sys.argv = ['print_lineups.py', *argv]
+        self.runs += 1
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    print_lineups.main()
+                    return 0
+                except SystemExit as e:
+                    if e.code is None or isinstance(e.code, int):
+                        return e.code or 0
+                    print(e.code, file=sys.stderr)
+                    return 1
+                except Exception as e:
+                    print(f"Error: {e}")
+                    return 1
+        finally:
+            sys.argv = saved_argv
+            # Each run opens its own on-disk cache connection; close it rather than leak it
+            cache = print_lineups.get_cache()
+            if cache is not None:
+                cache.close()
+                print_lineups.set_cache(None)
+            # The next run may be for another date or other teams, so it loads its own table
+            print_lineups.set_roster_table(None)
+
+
+def remove_stale_socket(path):
+    """
+    Remove a socket file left behind by a helper that is no longer running
+
+    Args:
+        path (str): The socket path
+
+    Returns:
+        bool: False if a helper is still listening on it
+    """
+    if not os.path.exists(path):
+        return True
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        return False
+    except OSError:
+        os.unlink(path)
+        return True
+    finally:
+        sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keep a warm process that runs print_lineups.py commands')
+    parser.add_argument('--socket', type=str, default=None,
+                        help=f'Socket path (default: {get_default_socket_path()})')
+    args = parser.parse_args()
+
+    path = args.socket or get_default_socket_path()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if not remove_stale_socket(path):
+        print(f"A helper is already listening on {path}")
+        sys.exit(1)
+
+    # Pay for the imports once, before the first client arrives
+    import print_lineups  # noqa: F401
+
+    server = HelperServer(path)
+    print(f"Lineup helper listening on {path}")
+    # Stopping with kill should also remove the socket
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
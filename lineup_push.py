@@ -0,0 +1,242 @@
+"""
+Push of lineup, pitcher and umpire changes to any number of subscribers
+
+Each game being watched has exactly one GamePoller, which polls the MLB
+Stats API on its own schedule, runs the results through a ChangeDetector
+and hands each change event to every subscriber's queue. Upstream request
+volume therefore depends on the number of games watched, not on the
+number of clients. The server in lineup_server.py streams the events to
+HTTP clients as server-sent events:
+
+    GET /events/game/{game_id}    changes to one game
+    GET /events/team/{team}       changes to a team's games today
+
+A new subscriber first receives the game's current state as 'posted'
+events, then only changes.
+"""
+import queue
+import threading
+
+import requests
+
+from lineup_changes import FINAL_STATUSES, ChangeDetector
+from print_lineups import fetch_game_details, get_hydrated_schedule_game
+
+# Default seconds between upstream polls of a game
+DEFAULT_PUSH_INTERVAL = 30
+
+# Maximum events held for a subscriber that is not keeping up
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# The pollers fetch from the home team's perspective; events name the sides plainly
+SIDE_NAMES = {'team': 'home', 'opponent': 'away'}
+
+
+class Subscription:
+    """
+    One subscriber's queue of events from one or more games
+
+    Args:
+        maxsize (int, optional): Maximum number of undelivered events
+    """
+
+    def __init__(self, maxsize=SUBSCRIBER_QUEUE_SIZE):
+        self.events = queue.Queue(maxsize)
+        self.dropped = 0
+
+    def put(self, event):
+        """Queue an event, dropping it if the subscriber has fallen too far behind"""
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def get(self, timeout=None):
+        """
+        Args:
+            timeout (float, optional): Seconds to wait for an event
+
+        Returns:
+            dict: The next event, or None if none arrived in time
+        """
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+def relabel(event):
+    """
+    Name an event's side 'home' or 'away' instead of relative to the polled team
+
+    Args:
+        event (dict): An event as returned by ChangeDetector.update
+
+    Returns:
+        dict: The event, without the team_id the details were fetched for
+    """
+    event = {key: value for key, value in event.items() if key != 'team_id'}
+    if 'side' in event:
+        event['side'] = SIDE_NAMES[event['side']]
+    return event
+
+
+class GamePoller:
+    """
+    Polls one game in a background thread and fans its changes out to subscribers
+
+    The thread runs while the game has subscribers and stops on its own
+    once the game is final, after sending a 'final' event.
+
+    Args:
+        game_id (int): The game ID
+        interval (float, optional): Seconds between polls
+    """
+
+    def __init__(self, game_id, interval=DEFAULT_PUSH_INTERVAL):
+        self.game_id = game_id
+        self.interval = interval
+        self.polls = 0
+        self.status = None
+        self._details = None
+        self._detector = ChangeDetector()
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        """bool: Whether the polling thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, subscription):
+        """
+        Add a subscriber, sending it the game's current state and starting the poller if needed
+
+        Args:
+            subscription (Subscription): Where the events go
+        """
+        with self._lock:
+            self._subscribers.add(subscription)
+            if self._details is not None:
+                # A fresh detector reports everything known so far as posted
+                for event in ChangeDetector().update(self.game_id, None, *self._details):
+                    subscription.put(relabel(event))
+            if not self.running:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name=f"poller-{self.game_id}", daemon=True)
+                self._thread.start()
+
+    def unsubscribe(self, subscription):
+        """
+        Remove a subscriber, stopping the poller once none are left
+
+        Returns:
+            bool: True if the game has no subscribers left
+        """
+        with self._lock:
+            self._subscribers.discard(subscription)
+            if self._subscribers:
+                return False
+            self._stop.set()
+            return True
+
+    def publish(self, event):
+        """Hand an event to every current subscriber"""
+        with self._lock:
+            for subscription in self._subscribers:
+                subscription.put(event)
+
+    def poll(self):
+        """
+        Fetch the game once and publish whatever changed
+
+        Returns:
+            bool: True if the game is final
+        """
+        game = get_hydrated_schedule_game(self.game_id)
+        if game is None:
+            return False
+        self.status = game.get('status', {}).get('detailedState')
+        home_id = game['teams']['home']['team']['id']
+
+        pitchers, umpires, lineup_data, _ = fetch_game_details(self.game_id, self.status, home_id,
+                                                                concurrent=False, hydrated_game=game)
+        self.polls += 1
+        with self._lock:
+            self._details = (pitchers, umpires, lineup_data)
+            events = self._detector.update(self.game_id, home_id, pitchers, umpires, lineup_data)
+        for event in events:
+            self.publish(relabel(event))
+
+        if self.status in FINAL_STATUSES:
+            self.publish({'game_id': self.game_id, 'section': 'game', 'type': 'final'})
+            return True
+        return False
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self.poll():
+                    return
+            except (requests.exceptions.RequestException, KeyError) as e:
+                print(f"Error polling game {self.game_id}: {e}")
+            self._stop.wait(self.interval)
+
+
+class EventHub:
+    """
+    Registry of the GamePollers, so each game is polled once however many subscribe to it
+
+    Args:
+        interval (float, optional): Seconds between polls of each game
+    """
+
+    def __init__(self, interval=DEFAULT_PUSH_INTERVAL):
+        self.interval = interval
+        self._pollers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, game_ids, subscription=None):
+        """
+        Subscribe to the changes of one or more games
+
+        Args:
+            game_ids (list): The game IDs
+            subscription (Subscription, optional): An existing subscription to add them to
+
+        Returns:
+            Subscription: Receives the events of every listed game
+        """
+        if subscription is None:
+            subscription = Subscription()
+        with self._lock:
+            for game_id in game_ids:
+                poller = self._pollers.get(game_id)
+                if poller is None:
+                    poller = self._pollers[game_id] = GamePoller(game_id, self.interval)
+                poller.subscribe(subscription)
+        return subscription
+
+    def unsubscribe(self, game_ids, subscription):
+        """
+        Cancel a subscription, dropping the pollers nobody listens to any more
+
+        Args:
+            game_ids (list): The game IDs it was subscribed to
+            subscription (Subscription): The subscription
+        """
+        with self._lock:
+            for game_id in game_ids:
+                poller = self._pollers.get(game_id)
+                if poller is not None and poller.unsubscribe(subscription):
+                    del self._pollers[game_id]
+
+    def pollers(self):
+        """
+        Returns:
+            dict: The active GamePoller of each watched game ID
+        """
+        with self._lock:
+            return dict(self._pollers)
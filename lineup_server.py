@@ -0,0 +1,450 @@
+"""
+Local HTTP server answering lineup lookups as JSON from memory
+
+Tools that would otherwise run print_lineups.py and scrape its output can
+ask a long-running server instead, which keeps its connection pool, roster
+table and responses warm between requests:
+
+    GET /games/{date}            every game on a date
+    GET /lineup/{team}/{date}    a team's pitchers, umpires and lineups on a date
+    GET /game/{game_id}          one game's pitchers, umpires and lineups
+    GET /events/game/{game_id}   server-sent events as a game changes
+    GET /events/team/{team}      server-sent events as a team's games today change
+
+Dates are YYYY-MM-DD or "today". Encoded responses are kept in memory for
+as long as the data behind them can be cached (see ttl_for_status), and
+concurrent requests for the same path share one upstream fetch.
+
+Example:
+    python lineup_server.py --port 8080
+    curl http://127.0.0.1:8080/lineup/NYM/today
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from lineup_push import DEFAULT_PUSH_INTERVAL, EventHub
+from print_lineups import (
+    MLB_TEAMS,
+    TTL_FINAL,
+    TTL_PREGAME,
+    fetch_game_details,
+    fetch_games_details,
+    get_hydrated_schedule_game,
+    get_slate_games,
+    get_team_games,
+    get_today_date_eastern,
+    load_roster_table,
+    set_roster_table,
+    ttl_for_status,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# Maximum number of encoded responses kept in memory
+DEFAULT_MAX_ENTRIES = 1024
+
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Seconds between comments sent on an idle event stream, so proxies keep it open
+KEEPALIVE_INTERVAL = 15
+
+
+class CoalescingCache:
+    """
+    Bounded, thread-safe in-memory LRU cache in which concurrent misses share one fetch
+
+    The first caller to miss a key runs the fetch; callers asking for the
+    same key while it runs wait for its result instead of fetching again.
+
+    Args:
+        max_entries (int, optional): Maximum number of values to keep
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, fetch):
+        """
+        Look up a value, fetching it (once for all concurrent callers) if missing or expired
+
+        Args:
+            key (str): The cache key
+            fetch (callable): Returns (value, ttl); a ttl of 0 leaves the value uncached
+
+        Returns:
+            The cached or freshly fetched value
+
+        Raises:
+            Exception: Whatever fetch raised, in every caller waiting on it
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = Future()
+                leader = True
+                self.misses += 1
+            else:
+                leader = False
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            value, ttl = fetch()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            if ttl > 0:
+                self._entries[key] = (time.monotonic() + ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            del self._inflight[key]
+        future.set_result(value)
+        return value
+
+    def clear(self):
+        """Forget every value and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.coalesced = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def summarize_game(game):
+    """
+    Args:
+        game (dict): A statsapi schedule entry
+
+    Returns:
+        dict: The fields of the entry served by the API
+    """
+    return {
+        'game_id': game['game_id'],
+        'status': game['status'],
+        'game_datetime': game.get('game_datetime'),
+        'game_num': game.get('game_num', 1),
+        'venue_name': game.get('venue_name'),
+        'home_id': game.get('home_id'),
+        'home_name': game.get('home_name'),
+        'away_id': game.get('away_id'),
+        'away_name': game.get('away_name'),
+    }
+
+
+def date_ttl(date):
+    """
+    Args:
+        date (str): Date in YYYY-MM-DD format
+
+    Returns:
+        int: How long a schedule for the date can be cached, in seconds
+    """
+    return TTL_FINAL if date < get_today_date_eastern() else TTL_PREGAME
+
+
+def error_status(message):
+    # The fetch functions report upstream failures as "Error fetching ..." and empty results otherwise
+    return 502 if message.startswith("Error") else 404
+
+
+class LineupService:
+    """
+    The API's endpoints, answering from a CoalescingCache of encoded responses
+
+    Args:
+        cache (CoalescingCache, optional): Where responses are kept
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else CoalescingCache()
+
+    def handle(self, path):
+        """
+        Answer a GET request
+
+        Args:
+            path (str): The request path, without the query string
+
+        Returns:
+            tuple: (status, body) where body is the encoded JSON response
+        """
+        parts = [part for part in path.split('/') if part]
+        if len(parts) == 2 and parts[0] == 'game' and parts[1].isdigit():
+            return self._cached(self.game, int(parts[1]))
+        if len(parts) == 2 and parts[0] == 'games':
+            team_abbr = None
+        elif len(parts) == 3 and parts[0] == 'lineup':
+            team_abbr = parts[1].upper()
+        else:
+            return 404, encode({'error': f"Unknown path: {path}"})
+
+        date = parts[-1]
+        if date == 'today':
+            date = get_today_date_eastern()
+        elif not DATE_PATTERN.fullmatch(date):
+            return 400, encode({'error': f"Invalid date '{date}'; use YYYY-MM-DD or today"})
+
+        if team_abbr is None:
+            return self._cached(self.games, date)
+        if team_abbr not in MLB_TEAMS:
+            return 400, encode({'error': f"Invalid team abbreviation '{team_abbr}'"})
+        return self._cached(self.lineup, team_abbr, date)
+
+    def event_games(self, path):
+        """
+        Find the games an event stream path subscribes to
+
+        Args:
+            path (str): An /events/ request path
+
+        Returns:
+            tuple: (game_ids, None), or (None, (status, body)) for an error response
+        """
+        parts = [part for part in path.split('/') if part]
+        if len(parts) == 3 and parts[1] == 'game' and parts[2].isdigit():
+            return [int(parts[2])], None
+        if len(parts) != 3 or parts[1] != 'team':
+            return None, (404, encode({'error': f"Unknown path: {path}"}))
+
+        team_abbr = parts[2].upper()
+        if team_abbr not in MLB_TEAMS:
+            return None, (400, encode({'error': f"Invalid team abbreviation '{team_abbr}'"}))
+        games, error = get_team_games(MLB_TEAMS[team_abbr])
+        if error:
+            return None, (error_status(error), encode({'error': error}))
+        return [game['game_id'] for game in games], None
+
+    def _cached(self, endpoint, *args):
+        # Keyed by the resolved arguments so "today" and its date share an entry
+        key = '/'.join([endpoint.__name__, *map(str, args)])
+
+        def fetch():
+            status, payload, ttl = endpoint(*args)
+            # Errors are not kept, so the next request retries
+            return (status, encode(payload)), ttl if status == 200 else 0
+
+        return self.cache.get(key, fetch)
+
+    def games(self, date):
+        """
+        Returns:
+            tuple: (status, payload, ttl) for every game on a date
+        """
+        games, error = get_slate_games(date)
+        if error:
+            return error_status(error), {'error': error}, 0
+        return 200, {'date': date, 'games': [summarize_game(game) for game in games]}, date_ttl(date)
+
+    def lineup(self, team_abbr, date):
+        """
+        Returns:
+            tuple: (status, payload, ttl) for a team's games on a date
+        """
+        team_id = MLB_TEAMS[team_abbr]
+        games, error = get_team_games(team_id, date)
+        if error:
+            return error_status(error), {'error': error}, 0
+
+        # A doubleheader's games are fetched side by side
+        jobs = [(game, team_id) for game in games]
+        results = []
+        for game, _, (pitchers, umpires, lineup_data, lineup_error) in fetch_games_details(
+                jobs, max_workers=len(jobs), concurrent=True):
+            results.append(dict(summarize_game(game), pitchers=pitchers, umpires=umpires,
+                                lineup=lineup_data, lineup_error=lineup_error))
+        ttl = min(ttl_for_status(game['status']) for game in games)
+        return 200, {'team': team_abbr, 'date': date, 'games': results}, ttl
+
+    def game(self, game_id):
+        """
+        Returns:
+            tuple: (status, payload, ttl) for one game, from the home team's perspective
+        """
+        game = get_hydrated_schedule_game(game_id)
+        if game is None:
+            return 404, {'error': f"Game {game_id} not found"}, 0
+
+        status = game.get('status', {}).get('detailedState')
+        home_id = game['teams']['home']['team']['id']
+        pitchers, umpires, lineup_data, lineup_error = fetch_game_details(game_id, status, home_id,
+                                                                          hydrated_game=game)
+        return 200, {
+            'game_id': game_id,
+            'status': status,
+            'game_datetime': game.get('gameDate'),
+            'home_id': home_id,
+            'away_id': game['teams']['away']['team']['id'],
+            'pitchers': pitchers,
+            'umpires': umpires,
+            'lineup': lineup_data,
+            'lineup_error': lineup_error,
+        }, ttl_for_status(status)
+
+
+def encode(payload):
+    """
+    Args:
+        payload: A JSON-serializable value
+
+    Returns:
+        bytes: The compact UTF-8 JSON encoding
+    """
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+def format_event_stream(event):
+    """
+    Args:
+        event (dict): A change event
+
+    Returns:
+        bytes: The event in text/event-stream format, named after its section
+    """
+    return f"event: {event['section']}\ndata: ".encode() + encode(event) + b"\n\n"
+
+
+class LineupRequestHandler(BaseHTTPRequestHandler):
+    """Serves the LineupService of its server over HTTP/1.1 with keep-alive"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY each
+    # keep-alive response would stall on the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        game_ids = None
+        try:
+            if path.startswith('/events/'):
+                game_ids, response = self.server.service.event_games(path)
+                status, body = response or (200, None)
+            else:
+                status, body = self.server.service.handle(path)
+        except Exception as e:
+            game_ids = None
+            status, body = 500, encode({'error': str(e)})
+
+        if game_ids is not None:
+            self.stream_events(game_ids)
+        else:
+            self.send_json(status, body)
+
+    def send_json(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_events(self, game_ids):
+        """
+        Stream the games' change events as server-sent events until they are all final
+
+        Args:
+            game_ids (list): The game IDs to subscribe to
+        """
+        hub = self.server.hub
+        subscription = hub.subscribe(game_ids)
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            self.close_connection = True
+
+            final = set()
+            while len(final) < len(game_ids):
+                event = subscription.get(timeout=KEEPALIVE_INTERVAL)
+                if event is None:
+                    self.wfile.write(b": keepalive\n\n")
+                    continue
+                if event['type'] == 'final':
+                    final.add(event['game_id'])
+                self.wfile.write(format_event_stream(event))
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away
+            pass
+        finally:
+            hub.unsubscribe(game_ids, subscription)
+
+    def log_message(self, format, *args):
+        # Per-request logging to stderr would dominate the cost of a cached response
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, service=None, hub=None, verbose=False):
+    """
+    Create a threaded HTTP server for a LineupService
+
+    Args:
+        host (str, optional): Interface to listen on
+        port (int, optional): Port to listen on (0 picks a free one)
+        service (LineupService, optional): The service to expose
+        hub (EventHub, optional): Source of the event streams
+        verbose (bool, optional): Log each request to stderr
+
+    Returns:
+        ThreadingHTTPServer: The server, ready for serve_forever
+    """
+    server = ThreadingHTTPServer((host, port), LineupRequestHandler)
+    server.daemon_threads = True
+    server.service = service if service is not None else LineupService()
+    server.hub = hub if hub is not None else EventHub()
+    server.verbose = verbose
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve MLB lineups as JSON over HTTP')
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST, help=f'Interface to listen on (default: {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to listen on (default: {DEFAULT_PORT})')
+    parser.add_argument('--push-interval', type=float, default=DEFAULT_PUSH_INTERVAL,
+                        help=f'Seconds between polls of games with event subscribers (default: {DEFAULT_PUSH_INTERVAL})')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    # Player bios for the whole league come from one burst of roster requests
+    set_roster_table(load_roster_table())
+
+    server = create_server(args.host, args.port, hub=EventHub(args.push_interval), verbose=args.verbose)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Incremental tracking of in-progress games through the live feed's diffPatch endpoint
+
+A LiveGame downloads a game's full live feed once and from then on only
+asks the diffPatch endpoint for the JSON Patch operations (RFC 6902)
+made since the last update, applying them to its local copy. The live
+feed embeds the same boxscore the boxscore endpoint serves plus every
+player's bio, so a LiveGame can stand in for a GameSnapshot: the usual
+get_lineup, get_pitchers_from_boxscore and get_umpires run against it
+unchanged and without any further requests.
+
+Example:
+    game = LiveGame(778518)
+    for _ in game.follow(interval=15):
+        lineup_data, error = game.lineup(121)
+"""
+import copy
+import threading
+import time
+
+import requests
+
+from print_lineups import (
+    build_pitcher_details,
+    get_json,
+    get_lineup,
+    get_people_details,
+    get_pitchers_from_boxscore,
+    get_umpires,
+    parse_boxscore,
+)
+
+LIVE_FEED_URL = "https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live"
+DIFF_PATCH_URL = LIVE_FEED_URL + "/diffPatch"
+
+# Default seconds between diffPatch polls
+DEFAULT_POLL_INTERVAL = 10
+
+
+class PatchError(ValueError):
+    """A JSON Patch operation could not be applied to the document"""
+
+
+def _parse_pointer(pointer):
+    # RFC 6901: "/a/b~1c" -> ["a", "b/c"]
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise PatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _list_index(container, token, allow_end=False):
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit():
+        raise PatchError(f"Invalid list index: {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise PatchError(f"List index out of range: {index}")
+    return index
+
+
+def _resolve(doc, tokens):
+    target = doc
+    for token in tokens:
+        try:
+            target = target[_list_index(target, token) if isinstance(target, list) else token]
+        except (KeyError, TypeError) as e:
+            raise PatchError(f"Path not found: /{'/'.join(tokens)}") from e
+    return target
+
+
+def _add(doc, tokens, value):
+    if not tokens:
+        return value
+    parent = _resolve(doc, tokens[:-1])
+    if isinstance(parent, list):
+        parent.insert(_list_index(parent, tokens[-1], allow_end=True), value)
+    elif isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    else:
+        raise PatchError(f"Cannot add to /{'/'.join(tokens[:-1])}")
+    return doc
+
+
+def _remove(doc, tokens):
+    if not tokens:
+        raise PatchError("Cannot remove the whole document")
+    parent = _resolve(doc, tokens[:-1])
+    try:
+        if isinstance(parent, list):
+            return parent.pop(_list_index(parent, tokens[-1]))
+        return parent.pop(tokens[-1])
+    except (KeyError, TypeError, AttributeError) as e:
+        raise PatchError(f"Path not found: /{'/'.join(tokens)}") from e
+
+
+def apply_patch(doc, operations):
+    """
+    Apply JSON Patch operations to a document in place
+
+    Args:
+        doc: The parsed JSON document
+        operations (list): RFC 6902 operations (add, remove, replace, move, copy, test)
+
+    Returns:
+        The patched document (a new object only if the root itself was replaced)
+
+    Raises:
+        PatchError: If an operation does not apply to the document
+    """
+    for operation in operations:
+        op = operation.get('op')
+        tokens = _parse_pointer(operation.get('path', ''))
+        if op == 'add':
+            doc = _add(doc, tokens, operation['value'])
+        elif op == 'remove':
+            _remove(doc, tokens)
+        elif op == 'replace':
+            if tokens:
+                _remove(doc, tokens)
+            doc = _add(doc, tokens, operation['value'])
+        elif op == 'move':
+            value = _remove(doc, _parse_pointer(operation['from']))
+            doc = _add(doc, tokens, value)
+        elif op == 'copy':
+            value = copy.deepcopy(_resolve(doc, _parse_pointer(operation['from'])))
+            doc = _add(doc, tokens, value)
+        elif op == 'test':
+            if _resolve(doc, tokens) != operation.get('value'):
+                raise PatchError(f"Test failed at {operation.get('path')}")
+        else:
+            raise PatchError(f"Unknown patch operation: {op!r}")
+    return doc
+
+
+class LiveGame:
+    """
+    Local copy of a game's live feed, kept current with diffPatch updates
+
+    A LiveGame provides the boxscore, parsed_boxscore and get_person
+    members of GameSnapshot, so it can be passed as the snapshot to the
+    lookups in print_lineups.py. Access is serialized with a lock.
+
+    Args:
+        game_id (int): The game ID
+    """
+
+    def __init__(self, game_id):
+        self.game_id = game_id
+        self.state = None
+        self.updates = 0
+        self.resyncs = 0
+        self._parsed_boxscore = None
+        self._lock = threading.RLock()
+
+    @property
+    def timecode(self):
+        """str: Timestamp of the local copy in the API's YYYYMMDD_HHMMSS form, or None"""
+        with self._lock:
+            if self.state is None:
+                return None
+            return self.state.get('metaData', {}).get('timeStamp')
+
+    @property
+    def status(self):
+        """str: The game's abstract state ('Preview', 'Live' or 'Final'), or None"""
+        with self._lock:
+            if self.state is None:
+                return None
+            return self.state.get('gameData', {}).get('status', {}).get('abstractGameState')
+
+    def _resync(self):
+        self.state = get_json(LIVE_FEED_URL.format(game_id=self.game_id))
+        self._parsed_boxscore = None
+        self.resyncs += 1
+
+    def update(self):
+        """
+        Bring the local copy up to date
+
+        The first call downloads the full feed. Later calls only fetch the
+        patches since the local timecode; if they cannot be applied (or the
+        API answers with a full feed instead), the local copy is replaced.
+
+        Returns:
+            bool: True if anything changed
+
+        Raises:
+            requests.exceptions.RequestException: If a request failed
+        """
+        with self._lock:
+            if self.state is None or self.timecode is None:
+                self._resync()
+                return True
+
+            diffs = get_json(DIFF_PATCH_URL.format(game_id=self.game_id),
+                             params={'startTimecode': self.timecode})
+
+            # When too far behind, the endpoint sends the whole feed instead of patches
+            if isinstance(diffs, dict):
+                self.state = diffs
+                self._parsed_boxscore = None
+                self.resyncs += 1
+                return True
+
+            if not diffs:
+                return False
+
+            # Patches are applied in place; one that does not apply means the
+            # local copy has drifted, and it is replaced by a fresh download
+            try:
+                for diff in diffs:
+                    self.state = apply_patch(self.state, diff.get('diff', []))
+            except PatchError:
+                self.state = None
+                self._resync()
+                return True
+
+            self._parsed_boxscore = None
+            self.updates += 1
+            return True
+
+    def follow(self, interval=DEFAULT_POLL_INTERVAL, sleep=time.sleep):
+        """
+        Poll for changes until the game is final
+
+        Args:
+            interval (float, optional): Seconds between polls
+            sleep (callable, optional): Waits for the given number of seconds
+
+        Yields:
+            LiveGame: This game, each time its state has changed
+        """
+        while True:
+            try:
+                if self.update():
+                    yield self
+            except requests.exceptions.RequestException as e:
+                print(f"Error updating game {self.game_id}: {e}")
+            if self.status == 'Final':
+                return
+            sleep(interval)
+
+    @property
+    def boxscore(self):
+        """dict: The boxscore embedded in the live feed"""
+        with self._lock:
+            if self.state is None:
+                self.update()
+            return self.state.get('liveData', {}).get('boxscore', {})
+
+    @property
+    def parsed_boxscore(self):
+        """dict: The boxscore as extracted by parse_boxscore, recomputed after each change"""
+        with self._lock:
+            if self._parsed_boxscore is None:
+                self._parsed_boxscore = parse_boxscore(self.boxscore)
+            return self._parsed_boxscore
+
+    def get_person(self, person_id):
+        """
+        Get a person's details from the feed's player bios
+
+        Args:
+            person_id (int): The MLB ID of the person
+
+        Returns:
+            dict: Details as built by build_pitcher_details, or None
+        """
+        with self._lock:
+            person = (self.state or {}).get('gameData', {}).get('players', {}).get(f'ID{person_id}')
+        if person is not None:
+            return build_pitcher_details(person)
+        return get_people_details([person_id]).get(person_id)
+
+    def lineup(self, team_id):
+        """
+        Returns:
+            tuple: The current lineups as returned by get_lineup
+        """
+        return get_lineup(self.game_id, team_id, snapshot=self)
+
+    def starting_pitchers(self, team_id):
+        """
+        Returns:
+            dict: The starting pitchers as returned by get_pitchers_from_boxscore
+        """
+        return get_pitchers_from_boxscore(self.game_id, team_id, snapshot=self)
+
+    def umpires(self):
+        """
+        Returns:
+            list: The umpires as returned by get_umpires
+        """
+        return get_umpires(self.game_id, snapshot=self)
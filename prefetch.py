@@ -0,0 +1,284 @@
+"""
+Daemon that warms the shared response cache ahead of every game of the day
+
+Lineups are looked up in a burst just before first pitch. This daemon
+loads the day's schedule and, through the last hour before each game's
+first pitch, fetches the probable pitchers, umpires, lineups and boxscore
+through the same functions print_lineups.py uses, writing the responses
+to the on-disk cache it reads. The roster table is built once at start,
+and the schedule is refreshed just often enough that it never expires
+from the cache. A run of print_lineups.py close to first pitch is then
+answered from the cache.
+
+Example:
+    python prefetch.py --workers 4
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytz
+import requests
+
+from print_lineups import (
+    PREGAME_STATUSES,
+    TTL_PREGAME,
+    GameSnapshot,
+    fetch_game_details,
+    get_slate_games,
+    get_today_date_eastern,
+    load_roster_table,
+    set_cache,
+    set_roster_table,
+)
+from response_cache import ResponseCache, cache_key, get_default_cache_path
+
+# Within this many seconds of first pitch the data is kept continuously fresh...
+REFRESH_WINDOW = 60 * 60
+
+# ...by refetching it shortly before the cached copy expires
+REFRESH_INTERVAL = TTL_PREGAME - 60
+
+DEFAULT_WORKERS = 4
+
+
+class RefreshingCache:
+    """
+    Write-through view of a ResponseCache whose reads always miss
+
+    Installed with set_cache, it makes every fetch go to the network and
+    replace the cached entry, so the entries print_lineups.py reads are
+    renewed with a full time-to-live.
+
+    Args:
+        cache (ResponseCache): The cache to write to
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl):
+        self.cache.set(key, value, ttl)
+
+
+def parse_game_time(game):
+    """
+    Args:
+        game (dict): A statsapi schedule entry
+
+    Returns:
+        datetime: First pitch (timezone-aware), or None if not scheduled yet
+    """
+    game_time = game.get('game_datetime')
+    if not game_time:
+        return None
+    return datetime.strptime(game_time, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=pytz.utc)
+
+
+def prefetch_times(first_pitch):
+    """
+    Build the timetable of prefetches for a game
+
+    Prefetches start REFRESH_WINDOW before first pitch, each one landing
+    before the previous one's pregame entries expire. Earlier ones would
+    write entries that expire long before anyone reads them.
+
+    Args:
+        first_pitch (datetime): First pitch (timezone-aware)
+
+    Returns:
+        list: Times (timezone-aware datetimes) in ascending order, ending at first pitch
+    """
+    times = []
+    offset = REFRESH_WINDOW
+    while offset >= 0:
+        times.append(first_pitch - timedelta(seconds=offset))
+        offset -= REFRESH_INTERVAL
+    return times
+
+
+def warm_team_schedules(cache, date, games):
+    """
+    Store each team's schedule for a date under the key get_team_games reads
+
+    The per-team entries are cut from the one slate request instead of
+    being fetched team by team.
+
+    Args:
+        cache (ResponseCache): The cache to write to
+        date (str): Date in YYYY-MM-DD format
+        games (list): Every statsapi schedule entry on the date
+    """
+    schedules = {}
+    for game in games:
+        for side in ('home_id', 'away_id'):
+            if game.get(side) is not None:
+                schedules.setdefault(game[side], []).append(game)
+    for team_id, team_games in schedules.items():
+        cache.set(cache_key('statsapi.schedule', {'date': date, 'team': team_id}), team_games, TTL_PREGAME)
+
+
+def prefetch_game(game):
+    """
+    Fetch everything print_lineups.py needs for one game, from the home team's perspective
+
+    Args:
+        game (dict): The statsapi schedule entry for the game
+    """
+    snapshot = GameSnapshot(game['game_id'], game['status'])
+    fetch_game_details(game['game_id'], game['status'], game['home_id'],
+                       snapshot=snapshot, concurrent=False)
+    # Normally already read for the lineups above; fetched anyway in case that
+    # lookup failed, since a run for the other team (or a later one) reads it too
+    try:
+        _ = snapshot.boxscore
+    except requests.exceptions.RequestException as e:
+        print(f"Error prefetching boxscore for game {game['game_id']}: {e}")
+
+
+class PrefetchDaemon:
+    """
+    Keeps one day's game data warm in the response cache until the last first pitch
+
+    Args:
+        cache (ResponseCache): The cache print_lineups.py reads
+        date (str, optional): Date in YYYY-MM-DD format. Defaults to today's date.
+        max_workers (int, optional): Maximum number of games prefetched at once
+        sleep (callable, optional): Waits for the given number of seconds
+        now (callable, optional): Returns the current timezone-aware time
+    """
+
+    def __init__(self, cache, date=None, max_workers=DEFAULT_WORKERS, sleep=time.sleep, now=None):
+        self.cache = cache
+        self.date = date or get_today_date_eastern()
+        self.max_workers = max_workers
+        self.sleep = sleep
+        self.now = now or (lambda: datetime.now(pytz.utc))
+        self.games = []
+        self.prefetched = 0
+        self._last_prefetch = {}
+        self._next_schedule = None
+
+    def refresh_schedule(self):
+        """
+        Reload the day's schedule, picking up postponements and new start times
+
+        Returns:
+            bool: True if the schedule could be fetched
+        """
+        games, error = get_slate_games(self.date)
+        if error:
+            print(error)
+            return False
+        self.games = games
+        warm_team_schedules(self.cache, self.date, games)
+        return True
+
+    def due_games(self, current):
+        """
+        Args:
+            current (datetime): The current time
+
+        Returns:
+            list: Games with a prefetch scheduled since their last one
+        """
+        due = []
+        for game in self.games:
+            first_pitch = parse_game_time(game)
+            if first_pitch is None or game['status'] not in PREGAME_STATUSES:
+                continue
+            last = self._last_prefetch.get(game['game_id'])
+            if any((last is None or last < when) and when <= current for when in prefetch_times(first_pitch)):
+                due.append(game)
+        return due
+
+    def next_wakeup(self, current):
+        """
+        Args:
+            current (datetime): The current time
+
+        Returns:
+            datetime: When the next prefetch or schedule refresh is due, or None once
+                every game has started
+        """
+        upcoming = [when for game in self.games
+                    if game['status'] in PREGAME_STATUSES and parse_game_time(game) is not None
+                    for when in prefetch_times(parse_game_time(game)) if when > current]
+        if not upcoming:
+            return None
+        return min(min(upcoming), self._next_schedule)
+
+    def prefetch(self, games, current):
+        """
+        Prefetch several games on a thread pool
+
+        Args:
+            games (list): statsapi schedule entries
+            current (datetime): Recorded as the time of each game's prefetch
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(len(games), self.max_workers))) as executor:
+            list(executor.map(prefetch_game, games))
+        for game in games:
+            self._last_prefetch[game['game_id']] = current
+        self.prefetched += len(games)
+
+    def run(self):
+        """
+        Prefetch on schedule until every game of the day has started
+
+        Returns:
+            bool: False if the schedule could not be fetched at start
+        """
+        set_cache(RefreshingCache(self.cache))
+        try:
+            if not self.refresh_schedule():
+                return False
+            self._next_schedule = self.now() + timedelta(seconds=REFRESH_INTERVAL)
+            set_roster_table(load_roster_table(self.date))
+
+            while True:
+                current = self.now()
+                if current >= self._next_schedule:
+                    self.refresh_schedule()
+                    self._next_schedule = current + timedelta(seconds=REFRESH_INTERVAL)
+
+                due = self.due_games(current)
+                if due:
+                    print(f"{current:%H:%M:%S} Prefetching {len(due)} game(s)")
+                    self.prefetch(due, current)
+
+                wakeup = self.next_wakeup(current)
+                if wakeup is None:
+                    return True
+                self.sleep(max(1.0, (wakeup - self.now()).total_seconds()))
+        finally:
+            set_cache(None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep the day's lineup data warm in the response cache")
+    parser.add_argument('--date', type=str, help='Date in YYYY-MM-DD format (default: today)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Maximum number of games prefetched at once (default: {DEFAULT_WORKERS})')
+    args = parser.parse_args()
+
+    cache = ResponseCache(get_default_cache_path())
+    try:
+        daemon = PrefetchDaemon(cache, args.date, args.workers)
+        ok = daemon.run()
+        print(f"Prefetched {daemon.prefetched} game(s)")
+    finally:
+        cache.close()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        sys.exit(0)
@@ -1,9 +1,55 @@
-import requests
 from datetime import datetime
-import pytz
 import argparse
+import importlib
 import sys
-import statsapi
+import threading
+import time
+from collections import OrderedDict
+
+
+class _LazyModule:
+    """
+    Stand-in for a module that is only imported when one of its attributes is first used
+    
+    requests, pytz and statsapi take most of the script's start-up time, and
+    runs that end early (--help, an invalid team) never need them. The same
+    goes, on a smaller scale, for response_cache (with sqlite3 and json) and
+    concurrent.futures.
+    
+    Args:
+        name (str): The module to import
+        on_import (callable, optional): Called with the module right after it is imported
+    """
+
+    def __init__(self, name, on_import=None):
+        self._name = name
+        self._on_import = on_import
+        self._module = None
+        self._lock = threading.RLock()
+
+    def _load(self):
+        with self._lock:
+            if self._module is None:
+                module = importlib.import_module(self._name)
+                if self._on_import is not None:
+                    self._on_import(module)
+                self._module = module
+            return self._module
+
+    def __getattr__(self, name):
+        return getattr(self._module or self._load(), name)
+
+
+def _install_statsapi_transport(module):
+    # Route the statsapi library's requests through the shared session as well
+    module.requests = _StatsapiTransport()
+
+
+requests = _LazyModule('requests')
+pytz = _LazyModule('pytz')
+statsapi = _LazyModule('statsapi', on_import=_install_statsapi_transport)
+response_cache = _LazyModule('response_cache')
+concurrent_futures = _LazyModule('concurrent.futures')
 
 # MLB team abbreviations to team IDs mapping
 MLB_TEAMS = {
@@ -39,6 +85,752 @@ MLB_TEAMS = {
     "WSH": 120,  # Washington Nationals
 }
 
+BOXSCORE_URL = "https://statsapi.mlb.com/api/v1/game/{game_id}/boxscore"
+SCHEDULE_URL = "https://statsapi.mlb.com/api/v1/schedule"
+PEOPLE_URL = "https://statsapi.mlb.com/api/v1/people"
+PERSON_URL = "https://statsapi.mlb.com/api/v1/people/{person_id}"
+ROSTER_URL = "https://statsapi.mlb.com/api/v1/teams/{team_id}/roster"
+
+# Only the fields we read are requested; the API drops everything else server-side
+BOXSCORE_FIELDS = ("teams,home,away,team,id,name,teamName,battingOrder,players,person,fullName,"
+                   "jerseyNumber,position,abbreviation,stats,pitching,inningsPitched,"
+                   "officials,official,officialType")
+PEOPLE_FIELDS = "people,id,fullName,primaryNumber,pitchHand,code"
+ROSTER_FIELDS = "roster,jerseyNumber,person,id,fullName,primaryNumber,pitchHand,batSide,code"
+
+# The 40-man roster also covers players called up during the day
+ROSTER_TYPE = "40Man"
+
+# Compressed encodings we ask the API for
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# How long cached responses stay fresh (seconds), by game state
+TTL_FINAL = 30 * 24 * 60 * 60
+TTL_LIVE = 30
+TTL_PREGAME = 5 * 60
+TTL_PEOPLE = 24 * 60 * 60
+
+# Game states for which a single hydrated schedule request can fill in the pitchers and umpires.
+# Lineups always come from the boxscore, which has game positions (the schedule's
+# lineups only carry each player's primary position, so no DH and no moves).
+PREGAME_STATUSES = ("Scheduled", "Pre-Game", "Warmup")
+SCHEDULE_HYDRATIONS = "probablePitcher,officials,person"
+
+# Just enough of the boxscore to tell whether both lineups have been posted
+LINEUP_CHECK_FIELDS = "teams,home,away,battingOrder"
+
+# Just enough of the schedule to follow a game's status and start time while watching
+GAME_STATE_FIELDS = "dates,games,status,detailedState,gameDate"
+
+# --watch poll intervals (seconds), by time remaining until first pitch (seconds)
+WATCH_INTERVALS = (
+    (6 * 60 * 60, 30 * 60),
+    (3 * 60 * 60, 10 * 60),
+    (60 * 60, 3 * 60),
+    (0, 60),
+)
+
+# How long after first pitch --watch keeps waiting for lineups
+WATCH_GRACE = 60 * 60
+
+# Longest --watch waits for lineups in any case (e.g. a game without a start time)
+WATCH_MAX_WAIT = 12 * 60 * 60
+
+# Default number of games fetched at once in slate mode
+DEFAULT_SLATE_WORKERS = 8
+
+# Number of people kept in the in-process memo of player and pitcher bios
+PERSON_MEMO_SIZE = 2048
+
+# MLB team IDs to team abbreviations
+TEAM_ABBRS = {team_id: abbr for abbr, team_id in MLB_TEAMS.items()}
+
+# Map of throwing hand codes to descriptive text
+THROWS_MAP = {
+    'R': 'RHP',
+    'L': 'LHP'
+}
+
+
+_session = None
+
+
+def create_session(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE):
+    """
+    Create a requests session with pooled keep-alive connections
+    
+    Args:
+        pool_connections (int, optional): Number of hosts to keep connection pools for
+        pool_maxsize (int, optional): Maximum connections kept open per host
+        
+    Returns:
+        requests.Session: A session ready to be shared by every fetch function
+    """
+    session = requests.Session()
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session():
+    """
+    Get the shared HTTP session, creating it on first use
+    
+    Returns:
+        requests.Session: The session used for all MLB Stats API requests
+    """
+    global _session
+    if _session is None:
+        _session = create_session()
+    return _session
+
+
+def set_session(session):
+    """
+    Replace the shared HTTP session, e.g. with a differently sized pool or a test double
+    
+    Args:
+        session (requests.Session): The session to use for all MLB Stats API requests.
+            Pass None to go back to a default session on next use.
+    """
+    global _session
+    _session = session
+
+
+class TransferCounter:
+    """
+    Thread-safe tally of how much data the MLB Stats API sent us
+    
+    wire_bytes counts what came over the network (compressed, when the API
+    compressed it) and decoded_bytes counts the JSON after decompression.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self._lock = threading.Lock()
+
+    def record(self, response):
+        """
+        Count a response whose body has been read
+        
+        Args:
+            response (requests.Response): The response to count
+        """
+        decoded = len(response.content)
+        # urllib3 reports how many bytes were read off the socket before decoding
+        wire = getattr(response.raw, 'tell', None)
+        wire = wire() if callable(wire) else None
+        if not isinstance(wire, int) or wire <= 0:
+            wire = decoded
+        with self._lock:
+            self.requests += 1
+            self.wire_bytes += wire
+            self.decoded_bytes += decoded
+
+    def reset(self):
+        """Set every count back to zero"""
+        with self._lock:
+            self.requests = 0
+            self.wire_bytes = 0
+            self.decoded_bytes = 0
+
+    def summary(self):
+        """
+        Describe the counts in one line
+        
+        Returns:
+            str: e.g. "Downloaded 12.3 KB (48.1 KB decoded) in 3 requests"
+        """
+        return (f"Downloaded {self.wire_bytes / 1024:.1f} KB "
+                f"({self.decoded_bytes / 1024:.1f} KB decoded) in {self.requests} requests")
+
+
+_transfer_counter = TransferCounter()
+
+
+def get_transfer_counter():
+    """
+    Get the counter of bytes downloaded from the MLB Stats API
+    
+    Returns:
+        TransferCounter: The counter shared by every fetch function
+    """
+    return _transfer_counter
+
+
+_cache = None
+
+
+def get_cache():
+    """
+    Get the response cache in use, if any
+    
+    Returns:
+        ResponseCache: The cache read through by the fetch functions, or None
+    """
+    return _cache
+
+
+def set_cache(cache):
+    """
+    Set the response cache read through by the fetch functions
+    
+    Args:
+        cache (ResponseCache): The cache to use, or None to disable caching
+    """
+    global _cache
+    _cache = cache
+
+
+def ttl_for_status(status):
+    """
+    Choose how long to cache a game's data based on its status
+    
+    Args:
+        status (str): The game status, if known
+        
+    Returns:
+        int: Time-to-live in seconds
+    """
+    if status == "Final":
+        return TTL_FINAL
+    if status == "In Progress":
+        return TTL_LIVE
+    return TTL_PREGAME
+
+
+def cached_fetch(key, ttl, fetch):
+    """
+    Read a value through the response cache, calling fetch on a miss
+    
+    Args:
+        key (str): The cache key
+        ttl (int): Time-to-live in seconds for a newly fetched value
+        fetch (callable): Produces the value when it is not cached
+        
+    Returns:
+        The cached or freshly fetched value
+    """
+    cache = get_cache()
+    if cache is None:
+        return fetch()
+    
+    value = cache.get(key)
+    if value is None:
+        value = fetch()
+        cache.set(key, value, ttl)
+    return value
+
+
+def fetch_json(url, params=None, ttl=TTL_PREGAME):
+    """
+    Fetch a JSON document from the MLB Stats API through the cache and shared session
+    
+    Args:
+        url (str): The URL to fetch
+        params (dict, optional): Query string parameters
+        ttl (int, optional): Time-to-live in seconds if the response is cached
+        
+    Returns:
+        dict: The decoded JSON response
+        
+    Raises:
+        requests.exceptions.RequestException: If the request failed
+    """
+    return cached_fetch(response_cache.cache_key(url, params), ttl, lambda: get_json(url, params))
+
+
+def get_json(url, params=None):
+    """
+    Fetch a JSON document from the MLB Stats API through the shared session, bypassing the cache
+    
+    Args:
+        url (str): The URL to fetch
+        params (dict, optional): Query string parameters
+        
+    Returns:
+        dict: The decoded JSON response
+        
+    Raises:
+        requests.exceptions.RequestException: If the request failed
+    """
+    if params:
+        response = get_session().get(url, params=params)
+    else:
+        response = get_session().get(url)
+    get_transfer_counter().record(response)
+    response.raise_for_status()
+    return response.json()
+
+
+class PersonMemo:
+    """
+    Bounded, thread-safe LRU memo of person details keyed by person ID
+    
+    Entries hold the pitcher form of the details (name, jersey, throws,
+    throws_desc), which is a superset of what get_player_details returns,
+    so both lookups share one entry per person.
+    
+    Args:
+        maxsize (int, optional): Maximum number of people to remember
+    """
+
+    def __init__(self, maxsize=PERSON_MEMO_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, person_id):
+        """
+        Look up a person, counting the hit or miss
+        
+        Args:
+            person_id (int): The MLB ID of the person
+            
+        Returns:
+            dict: A copy of the remembered details, or None
+        """
+        with self._lock:
+            details = self._entries.get(person_id)
+            if details is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(person_id)
+            self.hits += 1
+            return dict(details)
+
+    def put(self, person_id, details):
+        """
+        Remember a person's details, evicting the least recently used person if full
+        
+        Args:
+            person_id (int): The MLB ID of the person
+            details (dict): Details as built by build_pitcher_details
+        """
+        with self._lock:
+            self._entries[person_id] = dict(details)
+            self._entries.move_to_end(person_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every person and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_person_memo = PersonMemo()
+
+
+def get_person_memo():
+    """
+    Get the in-process memo shared by the player and pitcher lookups
+    
+    Returns:
+        PersonMemo: The shared memo
+    """
+    return _person_memo
+
+
+class ConditionalFetcher:
+    """
+    Repeated fetches of the same URLs using conditional requests
+    
+    The validators (ETag and Last-Modified) of each response are sent back
+    on the next fetch of the same URL, so an unchanged resource costs a
+    bodiless 304 Not Modified instead of a full download. Responses are
+    never read from the response cache, since polls need fresh data.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None):
+        """
+        Fetch a JSON document, reusing the previous body if it has not changed
+        
+        Args:
+            url (str): The URL to fetch
+            params (dict, optional): Query string parameters
+            
+        Returns:
+            dict: The decoded JSON response
+            
+        Raises:
+            requests.exceptions.RequestException: If the request failed
+        """
+        key = response_cache.cache_key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+        
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = get_session().get(url, params=params, headers=headers)
+        get_transfer_counter().record(response)
+        if response.status_code == 304 and entry is not None:
+            return entry['data']
+        response.raise_for_status()
+        data = response.json()
+        
+        with self._lock:
+            self._entries[key] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'data': data,
+            }
+        return data
+
+
+class RosterTable:
+    """
+    Compact table of every player on the MLB rosters on one date
+    
+    Each row is a (name, jersey, pitch hand code, bat side code) tuple keyed
+    by person ID, so the whole league fits in well under a megabyte and each
+    team's rows can be stored in the response cache as one small entry.
+    
+    Args:
+        rows (dict, optional): Rows keyed by person ID
+    """
+
+    def __init__(self, rows=None):
+        self._rows = rows or {}
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, person_id):
+        return person_id in self._rows
+
+    def add_roster(self, roster):
+        """
+        Add the players from a team roster response
+        
+        Args:
+            roster (dict): The JSON from the team roster endpoint, hydrated with person
+        """
+        for entry in roster.get('roster', []):
+            person = entry.get('person', {})
+            if 'id' not in person:
+                continue
+            self._rows[person['id']] = (
+                person.get('fullName', ''),
+                entry.get('jerseyNumber') or person.get('primaryNumber', ''),
+                person.get('pitchHand', {}).get('code', ''),
+                person.get('batSide', {}).get('code', ''),
+            )
+
+    def update(self, other):
+        """
+        Add every player from another table
+        
+        Args:
+            other (RosterTable): The table to copy rows from
+        """
+        self._rows.update(other._rows)
+
+    def get(self, person_id):
+        """
+        Look up a player
+        
+        Args:
+            person_id (int): The MLB ID of the player
+            
+        Returns:
+            dict: Details as built by build_pitcher_details, or None if not on a roster
+        """
+        row = self._rows.get(person_id)
+        if row is None:
+            return None
+        name, jersey, throws_code, _ = row
+        return {
+            'name': name,
+            'jersey': jersey,
+            'throws': throws_code,
+            'throws_desc': THROWS_MAP.get(throws_code, 'Unknown')
+        }
+
+    def bat_side(self, person_id):
+        """
+        Look up which side a player bats from
+        
+        Args:
+            person_id (int): The MLB ID of the player
+            
+        Returns:
+            str: 'R', 'L' or 'S', or None if the player is not on a roster
+        """
+        row = self._rows.get(person_id)
+        return row[3] if row else None
+
+    def to_json(self):
+        """
+        Returns:
+            dict: The rows in a JSON-serializable form, for from_json
+        """
+        return {str(person_id): list(row) for person_id, row in self._rows.items()}
+
+    @classmethod
+    def from_json(cls, data):
+        """
+        Args:
+            data (dict): Rows as returned by to_json
+            
+        Returns:
+            RosterTable: The rebuilt table
+        """
+        return cls({int(person_id): tuple(row) for person_id, row in data.items()})
+
+
+_roster_table = None
+
+
+def get_roster_table():
+    """
+    Get the roster table consulted before per-person lookups, if any
+    
+    Returns:
+        RosterTable: The table, or None
+    """
+    return _roster_table
+
+
+def set_roster_table(table):
+    """
+    Set the roster table consulted before per-person lookups
+    
+    Args:
+        table (RosterTable): The table to use, or None to always ask the people endpoint
+    """
+    global _roster_table
+    _roster_table = table
+
+
+def load_roster_table(date=None, team_ids=None):
+    """
+    Build the table of every player on the MLB rosters on a date
+    
+    Each team's roster is kept in the response cache for a day as its own
+    entry, so a table for any set of teams (one game's two, or the whole
+    league as the prefetch daemon loads it) is assembled from the entries
+    earlier runs left, and only the missing rosters are requested, in
+    parallel. A roster whose request failed is not cached.
+    
+    Args:
+        date (str, optional): Date in YYYY-MM-DD format. Defaults to today's date.
+        team_ids (list, optional): Teams to include. Defaults to every team in MLB_TEAMS.
+        
+    Returns:
+        RosterTable: The players on the rosters
+    """
+    if date is None:
+        date = get_today_date_eastern()
+    if team_ids is None:
+        team_ids = list(MLB_TEAMS.values())
+    
+    def roster_key(team_id):
+        return response_cache.cache_key('roster-table', {'date': date, 'rosterType': ROSTER_TYPE, 'team': team_id})
+    
+    table = RosterTable()
+    cache = get_cache()
+    missing = []
+    for team_id in team_ids:
+        data = cache.get(roster_key(team_id)) if cache is not None else None
+        if data is None:
+            missing.append(team_id)
+        else:
+            table.update(RosterTable.from_json(data))
+    if not missing:
+        return table
+    
+    params = {'rosterType': ROSTER_TYPE, 'date': date, 'hydrate': 'person', 'fields': ROSTER_FIELDS}
+    
+    def fetch_roster(team_id):
+        try:
+            return get_json(ROSTER_URL.format(team_id=team_id), params=params), None
+        except requests.exceptions.RequestException as e:
+            return None, e
+    
+    with concurrent_futures.ThreadPoolExecutor(max_workers=min(len(missing), POOL_MAXSIZE)) as executor:
+        rosters = list(executor.map(fetch_roster, missing))
+    
+    failed = []
+    for team_id, (roster, error) in zip(missing, rosters):
+        if roster is None:
+            failed.append((team_id, error))
+            continue
+        team_table = RosterTable()
+        team_table.add_roster(roster)
+        if cache is not None:
+            cache.set(roster_key(team_id), team_table.to_json(), TTL_PEOPLE)
+        table.update(team_table)
+    
+    # Players on the missing rosters are still looked up one by one, so one line is enough
+    if failed:
+        teams = ', '.join(TEAM_ABBRS.get(team_id, str(team_id)) for team_id, _ in failed)
+        print(f"Error fetching rosters for {teams}: {failed[0][1]}", file=sys.stderr)
+    
+    return table
+
+
+def find_person(person_id):
+    """
+    Look up a person in the memo, then in the roster table, without any requests
+    
+    Args:
+        person_id (int): The MLB ID of the person
+        
+    Returns:
+        dict: Details as built by build_pitcher_details, or None if neither knows the person
+    """
+    details = get_person_memo().get(person_id)
+    if details is None and get_roster_table() is not None:
+        details = get_roster_table().get(person_id)
+    return details
+
+
+class _StatsapiTransport:
+    """
+    Stand-in for the requests module inside statsapi so its calls share our session
+    """
+
+    def get(self, url, **kwargs):
+        response = get_session().get(url, **kwargs)
+        get_transfer_counter().record(response)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+class GameSnapshot:
+    """
+    Per-game view of the boxscore and the people in it, each downloaded at most once
+
+    The raw boxscore (and its parsed form) is shared by the lineup, pitcher
+    and umpire lookups, so the boxscore is requested once per game no matter
+    how many of them read from it. The starting pitchers' details take one
+    more request, and pre-game lookups also read the hydrated schedule. A failed download is remembered
+    and re-raised rather than retried by every consumer. Access is serialized
+    with a lock so the lookups can safely run in parallel threads.
+
+    Args:
+        game_id (int): The game ID
+        status (str, optional): The game status, used to decide how long to cache data
+    """
+
+    def __init__(self, game_id, status=None):
+        self.game_id = game_id
+        self.status = status
+        self._boxscore = None
+        self._boxscore_error = None
+        self._parsed_boxscore = None
+        self._people = {}
+        self._lock = threading.RLock()
+
+    @property
+    def boxscore(self):
+        """
+        dict: The raw boxscore JSON for the game
+
+        Raises:
+            requests.exceptions.RequestException: If the download failed
+        """
+        with self._lock:
+            if self._boxscore is None:
+                if self._boxscore_error is not None:
+                    raise self._boxscore_error
+                try:
+                    self._boxscore = fetch_json(BOXSCORE_URL.format(game_id=self.game_id),
+                                                params={'fields': BOXSCORE_FIELDS},
+                                                ttl=ttl_for_status(self.status))
+                except requests.exceptions.RequestException as e:
+                    self._boxscore_error = e
+                    raise
+            return self._boxscore
+
+    @property
+    def parsed_boxscore(self):
+        """
+        dict: The boxscore as extracted by parse_boxscore, computed once
+
+        Raises:
+            requests.exceptions.RequestException: If the download failed
+        """
+        with self._lock:
+            if self._parsed_boxscore is None:
+                self._parsed_boxscore = parse_boxscore(self.boxscore)
+            return self._parsed_boxscore
+
+    def person_ids(self):
+        """
+        Collect the IDs of everyone whose details are not in the boxscore itself
+
+        Returns:
+            list: Person IDs of both starting pitchers
+        """
+        teams = self.parsed_boxscore
+        return [teams[side]['starting_pitcher'] for side in ('away', 'home')
+                if teams[side]['starting_pitcher']]
+
+    def resolve_people(self, person_ids=()):
+        """
+        Resolve both starting pitchers plus any extra IDs with a single request
+
+        Args:
+            person_ids (iterable, optional): Extra person IDs needed by the caller
+        """
+        with self._lock:
+            try:
+                wanted = self.person_ids()
+            except requests.exceptions.RequestException:
+                wanted = []
+            wanted = [pid for pid in dict.fromkeys(list(wanted) + list(person_ids))
+                      if pid not in self._people]
+            if not wanted:
+                return
+            resolved = get_people_details(wanted)
+            # Remember misses too so they are not requested again
+            for pid in wanted:
+                self._people[pid] = resolved.get(pid)
+
+    def get_person(self, person_id):
+        """
+        Get a person's details, resolving both starting pitchers in one request on first use
+
+        Args:
+            person_id (int): The MLB ID of the person
+
+        Returns:
+            dict: Person details as returned by get_people_details, or None
+        """
+        with self._lock:
+            if person_id not in self._people:
+                self.resolve_people([person_id])
+            return self._people[person_id]
+
+
 def get_today_date_eastern():
     """
     Get today's date in Eastern time, formatted as YYYY-MM-DD
@@ -50,10 +842,96 @@ def get_today_date_eastern():
     return datetime.now(eastern).strftime('%Y-%m-%d')
 
 
+def parse_schedule_game(game):
+    """
+    Extract the fields main() needs from a statsapi schedule entry
+    
+    Args:
+        game (dict): One game as returned by statsapi.schedule
+        
+    Returns:
+        tuple: (game_id, game_status, venue_name, team_names, game_time)
+    """
+    game_id = game['game_id']
+    game_status = game['status']
+    
+    # Get team names for both teams
+    team_names = {
+        'home': game['home_name'],
+        'away': game['away_name']
+    }
+    
+    # Get venue information if available
+    venue_name = game.get('venue_name')
+    
+    # Get game time information
+    game_time = game.get('game_datetime', '')
+    
+    return game_id, game_status, venue_name, team_names, game_time
+
+def _fetch_schedule(key_params, call, sort_key=lambda game: game.get('game_datetime', '')):
+    """
+    Fetch statsapi schedule entries through the response cache, one per game_id
+    
+    Args:
+        key_params (dict): The request's parameters, including 'date' or
+            'end_date', identifying it in the cache
+        call (callable): Makes the statsapi.schedule request
+        sort_key (callable, optional): Orders the games. Defaults to first pitch.
+        
+    Returns:
+        tuple: (games, error_message) where games may be empty without an error
+    """
+    try:
+        # Past dates will not change any more, so they can be cached for longer
+        last_date = key_params.get('end_date', key_params.get('date'))
+        ttl = TTL_FINAL if last_date < get_today_date_eastern() else TTL_PREGAME
+        schedule_data = cached_fetch(response_cache.cache_key('statsapi.schedule', key_params), ttl, call)
+    except Exception as e:
+        return [], f"Error fetching game data: {e}"
+    
+    # A game can be listed more than once (e.g. when it was rescheduled), so keep the first entry
+    games = {}
+    for game in schedule_data or []:
+        games.setdefault(game['game_id'], game)
+    
+    return sorted(games.values(), key=sort_key), None
+
+def _team_game_order(game):
+    # The second game of a doubleheader may not have a start time yet, so order by game number
+    return game.get('game_num', 1), game.get('game_datetime', '')
+
+def get_team_games(team_id, date=None):
+    """
+    Fetch all of a team's games on a date (two for a doubleheader) with one schedule request
+    
+    Args:
+        team_id (int): The MLB team ID
+        date (str, optional): Date in YYYY-MM-DD format. Defaults to today's date.
+        
+    Returns:
+        tuple: (games, error_message) where games is a list of statsapi schedule
+            entries in the order they are played
+    """
+    # Get today's date in the format required by the API (YYYY-MM-DD) if not provided
+    if date is None:
+        date = get_today_date_eastern()
+    
+    games, error = _fetch_schedule(
+        {'date': date, 'team': team_id}, lambda: statsapi.schedule(date=date, team=team_id, sportId=1),
+        sort_key=_team_game_order)
+    
+    # Check if there are any games for the specified date
+    if not games and not error:
+        error = "No game scheduled for the selected team on this date."
+    return games, error
+
 def get_team_game(team_id, date=None):
     """
     Fetch a team's game information from the MLB Stats API for a specific date using statsapi
     
+    For a doubleheader this is the first game; use get_team_games to get both.
+    
     Args:
         team_id (int): The MLB team ID
         date (str, optional): Date in YYYY-MM-DD format. Defaults to today's date.
@@ -61,38 +939,131 @@ def get_team_game(team_id, date=None):
     Returns:
         tuple: (game_id, game_status, venue_name, team_names, game_time) or (None, None, None, None, error_message)
     """
-    # Get today's date in the format required by the API (YYYY-MM-DD) if not provided
+    games, error = get_team_games(team_id, date)
+    if not games:
+        return None, None, None, None, error
+    
+    return parse_schedule_game(games[0])
+
+def get_teams_games(team_ids, date=None):
+    """
+    Fetch the games of several teams on a date from the one schedule request for the whole slate
+    
+    A game between two of the teams is only returned once, for whichever
+    of them comes first in team_ids.
+    
+    Args:
+        team_ids (list): MLB team IDs, in the order their games should be listed
+        date (str, optional): Date in YYYY-MM-DD format. Defaults to today's date.
+        
+    Returns:
+        tuple: (games, errors) where games is a list of (game, team_id) pairs and
+            errors maps the ID of each team without games to the reason
+    """
     if date is None:
         date = get_today_date_eastern()
     
-    try:
-        # Use the MLB-StatsAPI library to get schedule data
-        schedule_data = statsapi.schedule(date=date, team=team_id, sportId=1)
+    # The same request (and cache entry) as get_slate_games, filtered here
+    slate, error = _fetch_schedule({'date': date}, lambda: statsapi.schedule(date=date, sportId=1))
+    if error:
+        return [], {team_id: error for team_id in team_ids}
+    
+    games = []
+    errors = {}
+    seen = set()
+    for team_id in team_ids:
+        team_games = sorted((game for game in slate if team_id in (game.get('home_id'), game.get('away_id'))),
+                            key=_team_game_order)
+        if not team_games:
+            errors[team_id] = "No game scheduled for the selected team on this date."
+        for game in team_games:
+            if game['game_id'] not in seen:
+                seen.add(game['game_id'])
+                games.append((game, team_id))
+    
+    return games, errors
+
+def get_slate_games(date=None):
+    """
+    Fetch every MLB game on a date with a single schedule request
+    
+    Args:
+        date (str, optional): Date in YYYY-MM-DD format. Defaults to today's date.
         
-        # Check if there are any games for the specified date
-        if not schedule_data or len(schedule_data) == 0:
-            return None, None, None, None, "No game scheduled for the selected team on this date."
+    Returns:
+        tuple: (games, error_message) where games is a list of statsapi schedule
+            entries, one per game_id, in first-pitch order
+    """
+    if date is None:
+        date = get_today_date_eastern()
+    
+    games, error = _fetch_schedule({'date': date}, lambda: statsapi.schedule(date=date, sportId=1))
+    if not games and not error:
+        error = "No games scheduled on this date."
+    return games, error
+
+def get_games_in_range(start_date, end_date, team_ids=None):
+    """
+    Fetch every game between two dates with a single ranged schedule request
+    
+    Args:
+        start_date (str): First date in YYYY-MM-DD format
+        end_date (str): Last date in YYYY-MM-DD format (inclusive)
+        team_ids (list, optional): Only fetch these teams' games. Defaults to every team.
         
-        # Get the game information from the first (and likely only) game
-        game = schedule_data[0]
-        game_id = game['game_id']
-        game_status = game['status']
+    Returns:
+        tuple: (games, error_message) where games is a list of statsapi schedule
+            entries, one per game_id, in first-pitch order
+    """
+    params = {'start_date': start_date, 'end_date': end_date, 'sportId': 1}
+    if team_ids:
+        # The schedule endpoint takes a comma-separated list of team IDs
+        params['team'] = ','.join(str(team_id) for team_id in team_ids)
+    
+    games, error = _fetch_schedule(params, lambda: statsapi.schedule(**params))
+    if not games and not error:
+        error = f"No games scheduled between {start_date} and {end_date}."
+    return games, error
+
+def build_player_details(person):
+    """
+    Build the player details dictionary from a person record
+    
+    Args:
+        person (dict): A person entry from the people endpoint
         
-        # Get team names for both teams
-        team_names = {
-            'home': game['home_name'],
-            'away': game['away_name']
-        }
+    Returns:
+        dict: Player details including name and jersey number
+    """
+    return {
+        'name': person.get('fullName', ''),
+        'jersey': person.get('primaryNumber', '')
+    }
+
+def lookup_person(person_id):
+    """
+    Get a person's details through the in-process memo and roster table, fetching them on a miss
+    
+    Args:
+        person_id (int): The MLB ID of the person
+        
+    Returns:
+        dict: Details as built by build_pitcher_details, or None if the person is unknown
         
-        # Get venue information if available
-        venue_name = game.get('venue_name')
+    Raises:
+        requests.exceptions.RequestException: If the request failed
+    """
+    details = find_person(person_id)
+    if details is None:
+        data = fetch_json(PERSON_URL.format(person_id=person_id),
+                          params={'fields': PEOPLE_FIELDS}, ttl=TTL_PEOPLE)
         
-        # Get game time information
-        game_time = game.get('game_datetime', '')
+        if not data.get('people'):
+            return None
         
-        return game_id, game_status, venue_name, team_names, game_time
-    except Exception as e:
-        return None, None, None, None, f"Error fetching game data: {e}"
+        details = build_pitcher_details(data['people'][0])
+        get_person_memo().put(person_id, details)
+    return details
 
 def get_player_details(player_id):
     """
@@ -104,97 +1075,129 @@ def get_player_details(player_id):
     Returns:
         dict: Player details including name and jersey number
     """
-    url = f"https://statsapi.mlb.com/api/v1/people/{player_id}"
-    
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        
-        if not data.get('people'):
-            return None
-            
-        person = data['people'][0]
-        
-        details = {
-            'name': person.get('fullName', ''),
-            'jersey': person.get('primaryNumber', '')
-        }
-            
-        return details
+        details = lookup_person(player_id)
     except requests.exceptions.RequestException as e:
         print(f"Error fetching player details: {e}")
         return None
+    
+    if details is None:
+        return None
+    
+    return {'name': details['name'], 'jersey': details['jersey']}
 
-def get_pitcher_details(pitcher_id):
+def build_pitcher_details(person):
     """
-    Fetch detailed information about a pitcher from the MLB Stats API
+    Build the pitcher details dictionary from a person record
     
     Args:
-        pitcher_id (int): The MLB ID of the pitcher
+        person (dict): A person entry from the people endpoint
         
     Returns:
         dict: Pitcher details including name, jersey number, and handedness
     """
-    # Map of throwing hand codes to descriptive text
-    THROWS_MAP = {
-        'R': 'RHP',
-        'L': 'LHP'
+    # Get throwing hand code
+    throws_code = person.get('pitchHand', {}).get('code', '')
+    
+    return {
+        'name': person.get('fullName', ''),
+        'jersey': person.get('primaryNumber', ''),
+        'throws': throws_code,
+        'throws_desc': THROWS_MAP.get(throws_code, 'Unknown')
     }
+
+def get_people_details(person_ids):
+    """
+    Fetch details for many people with a single request to the people endpoint
+    
+    Args:
+        person_ids (list): MLB IDs of the players and pitchers to look up
+        
+    Returns:
+        dict: Person details (name, jersey, throws, throws_desc) keyed by person ID
+    """
+    memo = get_person_memo()
+    people = {}
+    missing = []
+    
+    # Only ask the API for people we have not seen yet and who are not on a roster
+    for pid in person_ids:
+        details = find_person(pid)
+        if details is None:
+            missing.append(pid)
+        else:
+            people[pid] = details
+    
+    if not missing:
+        return people
     
-    url = f"https://statsapi.mlb.com/api/v1/people/{pitcher_id}"
+    params = {'personIds': ','.join(str(pid) for pid in missing), 'fields': PEOPLE_FIELDS}
     
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        
-        if not data.get('people'):
-            return None
-            
-        person = data['people'][0]
+        data = fetch_json(PEOPLE_URL, params=params, ttl=TTL_PEOPLE)
         
-        # Get throwing hand code
-        throws_code = person.get('pitchHand', {}).get('code', '')
+        for person in data.get('people', []):
+            if 'id' in person:
+                details = build_pitcher_details(person)
+                memo.put(person['id'], details)
+                people[person['id']] = details
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching player details: {e}")
+    
+    return people
+
+def get_pitcher_details(pitcher_id):
+    """
+    Fetch detailed information about a pitcher from the MLB Stats API
+    
+    Args:
+        pitcher_id (int): The MLB ID of the pitcher
         
-        details = {
-            'name': person.get('fullName', ''),
-            'jersey': person.get('primaryNumber', ''),
-            'throws': throws_code,
-            'throws_desc': THROWS_MAP.get(throws_code, 'Unknown')
-        }
-            
-        return details
+    Returns:
+        dict: Pitcher details including name, jersey number, and handedness
+    """
+    try:
+        return lookup_person(pitcher_id)
     except requests.exceptions.RequestException as e:
         print(f"Error fetching pitcher details: {e}")
         return None
 
-def get_umpires(game_id):
+def parse_umpires(boxscore):
+    """
+    Extract the umpire crew from a raw boxscore
+    
+    Args:
+        boxscore (dict): The raw boxscore JSON for a game
+        
+    Returns:
+        list: Umpire information including names and positions, or None
+    """
+    if 'officials' in boxscore and boxscore['officials']:
+        return boxscore['officials']
+    else:
+        return None
+
+def get_umpires(game_id, snapshot=None):
     """
     Fetch umpire information for a game
     
     Args:
         game_id (int): The game ID
+        snapshot (GameSnapshot, optional): Shared per-game data to read from
         
     Returns:
         list: Umpire information including names and positions
     """
-    url = f"https://statsapi.mlb.com/api/v1/game/{game_id}/boxscore"
+    if snapshot is None:
+        snapshot = GameSnapshot(game_id)
     
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        
-        if 'officials' in data and data['officials']:
-            return data['officials']
-        else:
-            return None
+        return parse_umpires(snapshot.boxscore)
     except requests.exceptions.RequestException as e:
         print(f"Error fetching umpire data: {e}")
         return None
 
-def get_probable_pitchers(game_id, status, team_id):
+def get_probable_pitchers(game_id, status, team_id, snapshot=None):
     """
     Fetch the probable starting pitchers for a game
     
@@ -202,6 +1205,7 @@ def get_probable_pitchers(game_id, status, team_id):
         game_id (int): The game ID
         status (str): The game status
         team_id (int): The MLB team ID for the team of interest
+        snapshot (GameSnapshot, optional): Shared per-game data to read from
         
     Returns:
         dict: Pitcher information for both teams
@@ -209,11 +1213,65 @@ def get_probable_pitchers(game_id, status, team_id):
     # Use different endpoints based on game status
     if status in ["Final", "In Progress"]:
         # For completed or in-progress games, use boxscore to find who actually pitched
-        return get_pitchers_from_boxscore(game_id, team_id)
+        return get_pitchers_from_boxscore(game_id, team_id, snapshot=snapshot)
     else:
         # For upcoming games, use schedule endpoint which has probable pitchers
         return get_pitchers_from_schedule(game_id, team_id)
 
+def parse_schedule_pitchers(game, team_id):
+    """
+    Build the probable pitcher information from a statsapi schedule entry
+    
+    Args:
+        game (dict): One game as returned by statsapi.schedule
+        team_id (int): The MLB team ID for the team of interest
+        
+    Returns:
+        dict: Pitcher information for both teams
+    """
+    # Find which team is ours and which is the opponent
+    home_team_id = game.get('home_id')
+    
+    if team_id == home_team_id:
+        team_side = 'home'
+        opponent_side = 'away'
+    else:
+        team_side = 'away'
+        opponent_side = 'home'
+    
+    # Initialize pitcher data with team names
+    pitchers = {
+        'team': None,
+        'opponent': None,
+        'team_name': game.get(f'{team_side}_name'),
+        'opponent_team': game.get(f'{opponent_side}_name')
+    }
+    
+    # Create a simple pitcher info dictionary function 
+    def create_pitcher_info(name):
+        return {
+            'name': name,
+            'jersey': '',  # We don't have this info from the direct API
+            'throws': '',
+            'throws_desc': ''
+        } if name else None
+    
+    # Get probable pitcher names
+    home_probable_pitcher = game.get('home_probable_pitcher')
+    away_probable_pitcher = game.get('away_probable_pitcher')
+    
+    # Assign pitcher data based on which side the team is on
+    pitcher_map = {
+        'home': home_probable_pitcher,
+        'away': away_probable_pitcher
+    }
+    
+    # Create pitcher objects for both sides
+    pitchers['team'] = create_pitcher_info(pitcher_map.get(team_side))
+    pitchers['opponent'] = create_pitcher_info(pitcher_map.get(opponent_side))
+    
+    return pitchers
+
 def get_pitchers_from_schedule(game_id, team_id):
     """
     Fetch probable pitchers from the schedule endpoint for upcoming games using statsapi
@@ -227,309 +1285,299 @@ def get_pitchers_from_schedule(game_id, team_id):
     """
     try:
         # Use the MLB-StatsAPI library to get schedule data with probable pitchers
-        schedule_data = statsapi.schedule(game_id=game_id, sportId=1)
+        schedule_data = cached_fetch(
+            response_cache.cache_key('statsapi.schedule', {'game_id': game_id}), TTL_PREGAME,
+            lambda: statsapi.schedule(game_id=game_id, sportId=1))
         
         # Check if we have game data
         if not schedule_data or len(schedule_data) == 0:
             return None
             
-        game = schedule_data[0]
-        
-        # Find which team is ours and which is the opponent
-        home_team_id = game.get('home_id')
-        
-        if team_id == home_team_id:
-            team_side = 'home'
-            opponent_side = 'away'
-        else:
-            team_side = 'away'
-            opponent_side = 'home'
-        
-        # Initialize pitcher data with team names
-        pitchers = {
-            'team': None,
-            'opponent': None,
-            'team_name': game.get(f'{team_side}_name'),
-            'opponent_team': game.get(f'{opponent_side}_name')
-        }
+        return parse_schedule_pitchers(schedule_data[0], team_id)
+    except Exception as e:
+        print(f"Error fetching probable pitchers from schedule: {e}")
+        return None
+
+def parse_boxscore(boxscore):
+    """
+    Extract starters, positions, jersey numbers and starting pitchers from a raw boxscore
+    
+    Each team's players are visited once. Starters are the players whose
+    batting order is a whole slot ("100", "200", ...); substitutes take the
+    slot they replaced plus one ("101", "102", ...).
+    
+    Args:
+        boxscore (dict): The raw boxscore JSON for a game
         
-        # Create a simple pitcher info dictionary function 
-        def create_pitcher_info(name):
-            return {
-                'name': name,
-                'jersey': '',  # We don't have this info from the direct API
-                'throws': '',
-                'throws_desc': ''
-            } if name else None
-        
-        # Get probable pitcher names
-        home_probable_pitcher = game.get('home_probable_pitcher')
-        away_probable_pitcher = game.get('away_probable_pitcher')
-        
-        # Assign pitcher data based on which side the team is on
-        pitcher_map = {
-            'home': home_probable_pitcher,
-            'away': away_probable_pitcher
+    Returns:
+        dict: For 'home' and 'away', a dict with team_id, team_name, short_name,
+            lineup (entries as returned by get_lineup, in batting order) and
+            starting_pitcher (person ID or None)
+    """
+    teams = {}
+    
+    for side in ('home', 'away'):
+        team = boxscore.get('teams', {}).get(side, {})
+        team_info = team.get('team', {})
+        starters = []
+        
+        # Find pitcher with the most innings pitched (likely the starter)
+        max_innings = 0
+        pitcher_id = None
+        
+        for player in team.get('players', {}).values():
+            person = player.get('person') or {}
+            position = player.get('position', {}).get('abbreviation', '')
+            batting_order = str(player.get('battingOrder', ''))
+            
+            if batting_order.endswith('00') and position:
+                starters.append((int(batting_order), {
+                    'id': person.get('id'),
+                    'name': person.get('fullName', ''),
+                    'position': position,
+                    'batting_order': None,
+                    'jersey': player.get('jerseyNumber', '')
+                }))
+            
+            if position == 'P' and 'pitching' in player.get('stats', {}):
+                try:
+                    # Try to parse innings pitched (could be a string like "6.0" or an int)
+                    innings = float(player['stats']['pitching'].get('inningsPitched', 0))
+                    if innings > max_innings:
+                        max_innings = innings
+                        pitcher_id = person.get('id')
+                except (ValueError, TypeError):
+                    pass
+        
+        # Number the starters by their place in the batting order
+        starters.sort(key=lambda starter: starter[0])
+        lineup = []
+        for i, (_, entry) in enumerate(starters):
+            entry['batting_order'] = i + 1
+            lineup.append(entry)
+        
+        teams[side] = {
+            'team_id': team_info.get('id'),
+            'team_name': team_info.get('name', ''),
+            'short_name': team_info.get('teamName') or team_info.get('name', ''),
+            'lineup': lineup,
+            'starting_pitcher': pitcher_id
         }
+    
+    return teams
+
+def find_starting_pitchers(boxscore, parsed=None):
+    """
+    Find the starting pitcher for each side of a raw boxscore
+    
+    Args:
+        boxscore (dict): The raw boxscore JSON for a game
+        parsed (dict, optional): The boxscore as already extracted by parse_boxscore
         
-        # Create pitcher objects for both sides
-        pitchers['team'] = create_pitcher_info(pitcher_map.get(team_side))
-        pitchers['opponent'] = create_pitcher_info(pitcher_map.get(opponent_side))
+    Returns:
+        dict: Pitcher person ID (or None) keyed by 'home' and 'away'
+    """
+    teams = parsed if parsed is not None else parse_boxscore(boxscore)
+    return {side: teams[side]['starting_pitcher'] for side in ('home', 'away')}
+
+def parse_boxscore_pitchers(boxscore, team_id, parsed=None):
+    """
+    Build the pitcher information skeleton for a game from its raw boxscore
+    
+    Args:
+        boxscore (dict): The raw boxscore JSON for a game
+        team_id (int): The MLB team ID for the team of interest
+        parsed (dict, optional): The boxscore as already extracted by parse_boxscore
         
-        return pitchers
-    except Exception as e:
-        print(f"Error fetching probable pitchers from schedule: {e}")
-        return None
+    Returns:
+        tuple: (pitchers, starter_ids) where pitchers has empty 'team'/'opponent'
+            entries and starter_ids maps 'team'/'opponent' to a person ID or None
+    """
+    teams = parsed if parsed is not None else parse_boxscore(boxscore)
+    
+    # Find which side our team is on (home or away)
+    team_side = 'home' if teams['home']['team_id'] == team_id else 'away'
+    opponent_side = 'away' if team_side == 'home' else 'home'
+    
+    # Initialize pitcher data
+    pitchers = {
+        'team': None,
+        'opponent': None,
+        'team_name': teams[team_side]['team_name'],
+        'opponent_team': teams[opponent_side]['team_name']
+    }
+    
+    starter_ids = {'team': teams[team_side]['starting_pitcher'],
+                   'opponent': teams[opponent_side]['starting_pitcher']}
+    
+    return pitchers, starter_ids
 
-def get_pitchers_from_boxscore(game_id, team_id):
+def get_pitchers_from_boxscore(game_id, team_id, snapshot=None):
     """
     Fetch pitchers from the boxscore endpoint for completed games
     
     Args:
         game_id (int): The game ID
         team_id (int): The MLB team ID for the team of interest
+        snapshot (GameSnapshot, optional): Shared per-game data to read from
         
     Returns:
         dict: Pitcher information for both teams
     """
-    url = f"https://statsapi.mlb.com/api/v1/game/{game_id}/boxscore"
+    if snapshot is None:
+        snapshot = GameSnapshot(game_id)
     
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        # The snapshot parses the boxscore once for the pitchers and the lineups alike
+        pitchers, starter_ids = parse_boxscore_pitchers(snapshot.boxscore, team_id,
+                                                        parsed=snapshot.parsed_boxscore)
         
-        # Get the teams data
-        teams = data['teams']
-        
-        # Find which side our team is on (home or away)
-        team_side = 'home' if teams['home']['team']['id'] == team_id else 'away'
-        opponent_side = 'away' if team_side == 'home' else 'home'
-        
-        # Initialize pitcher data
-        pitchers = {
-            'team': None,
-            'opponent': None,
-            'team_name': teams[team_side]['team']['name'],
-            'opponent_team': teams[opponent_side]['team']['name']
-        }
-        
-        # For each team, try to find the starting pitcher
-        sides = {'team': team_side, 'opponent': opponent_side}
-        
-        for team_key, side in sides.items():
-            # Find pitcher with the most innings pitched (likely the starter)
-            max_innings = 0
-            pitcher_id = None
-            
-            for player_id, player in teams[side]['players'].items():
-                if player['position']['abbreviation'] == 'P':
-                    # Look for the pitcher who pitched the most innings
-                    if 'stats' in player and 'pitching' in player['stats']:
-                        try:
-                            # Try to parse innings pitched (could be a string like "6.0" or an int)
-                            innings = float(player['stats']['pitching'].get('inningsPitched', 0))
-                            if innings > max_innings:
-                                max_innings = innings
-                                pitcher_id = player['person']['id']
-                        except (ValueError, TypeError):
-                            pass
-            
-            # If we found a pitcher, get their details
+        # If we found a pitcher, get their details
+        for team_key, pitcher_id in starter_ids.items():
             if pitcher_id:
-                pitchers[team_key] = get_pitcher_details(pitcher_id)
+                pitchers[team_key] = snapshot.get_person(pitcher_id)
                 
         return pitchers
     except requests.exceptions.RequestException as e:
         print(f"Error fetching pitchers from boxscore: {e}")
         return None
 
-def get_lineup(game_id, team_id):
+def get_lineup(game_id, team_id, snapshot=None):
     """
     Fetch the starting lineup for a specific game
     
     Args:
         game_id (int): The game ID
         team_id (int): The MLB team ID for the team of interest
+        snapshot (GameSnapshot, optional): Shared per-game data to read from
         
     Returns:
         tuple: (lineup_data, error_message)
     """
-    # Use boxscore_data method to get starting lineup
-    # First try using the boxscore_data method from statsapi to get starting lineup
+    if snapshot is None:
+        snapshot = GameSnapshot(game_id)
+    
     try:
-        # Get boxscore data which includes starting lineup information
-        boxscore = statsapi.boxscore_data(game_id)
-        
-        # Determine if our team is home or away
-        team_info = boxscore['teamInfo']
-        is_home = team_info['home']['id'] == team_id
-        
-        # Get the correct batters list based on home/away
-        our_batters = boxscore['homeBatters'] if is_home else boxscore['awayBatters'] 
-        opponent_batters = boxscore['awayBatters'] if is_home else boxscore['homeBatters']
-        
-        # Get team names
-        our_team_name = team_info['home']['teamName'] if is_home else team_info['away']['teamName']
-        opponent_team_name = team_info['away']['teamName'] if is_home else team_info['home']['teamName']
-        
-        # Extract starting lineups (filter out substitutions and header rows)
-        team_lineup = []
-        opponent_lineup = []
-        
-        # Process our team's lineup - only include starters (non-substitutes)
-        # The substitution field should be False for starters
-        starters = [b for b in our_batters 
-                   if b.get('personId', 0) > 0 and not b.get('substitution')]
-        
-        # Sort starters by batting order
-        starters.sort(key=lambda x: x.get('battingOrder', '999'))
-        
-        # Process starters sorted by batting order
-        
-        # Create lineup entries
-        for i, player in enumerate(starters):
-            if 'position' not in player or not player['position']:
-                continue
-                
-            # Get full name from player info if available
-            player_id_key = f"ID{player['personId']}"
-            full_name = boxscore['playerInfo'].get(player_id_key, {}).get('fullName', player['name'])
-            
-            # Fetch jersey number using player ID
-            player_details = get_player_details(player['personId'])
-            jersey_number = player_details.get('jersey', '') if player_details else ''
-            
-            team_lineup.append({
-                'name': full_name,
-                'position': player['position'],
-                'batting_order': i + 1,
-                'jersey': jersey_number
-            })
-        
-        # Process opponent's lineup - only include starters
-        opponent_starters = [b for b in opponent_batters 
-                           if b.get('personId', 0) > 0 and not b.get('substitution')]
-        
-        # Sort opponent starters by batting order
-        opponent_starters.sort(key=lambda x: x.get('battingOrder', '999'))
-        
-        # Create opponent lineup entries
-        for i, player in enumerate(opponent_starters):
-            if 'position' not in player or not player['position']:
-                continue
-                
-            # Get full name from player info if available
-            player_id_key = f"ID{player['personId']}"
-            full_name = boxscore['playerInfo'].get(player_id_key, {}).get('fullName', player['name'])
-            
-            # Fetch jersey number using player ID
-            player_details = get_player_details(player['personId'])
-            jersey_number = player_details.get('jersey', '') if player_details else ''
-            
-            opponent_lineup.append({
-                'name': full_name,
-                'position': player['position'],
-                'batting_order': i + 1,
-                'jersey': jersey_number
-            })
-        
-        # Check if we have valid lineups
-        if not team_lineup or not opponent_lineup:
-            # Fall back to the old method if needed
-            return fallback_get_lineup(game_id, team_id)
+        # Starters, positions and jersey numbers all come from one pass over the boxscore
+        teams = snapshot.parsed_boxscore
+    except requests.exceptions.RequestException as e:
+        return None, f"Error fetching lineup data: {e}"
+    except (KeyError, TypeError, ValueError):
+        # A malformed boxscore may still have usable batting order lists
+        return fallback_get_lineup(game_id, team_id, snapshot=snapshot)
+    
+    # Determine if our team is home or away
+    team_side = 'home' if teams['home']['team_id'] == team_id else 'away'
+    opponent_side = 'away' if team_side == 'home' else 'home'
+    our_team = teams[team_side]
+    opponent_team = teams[opponent_side]
+    
+    # Check if we have valid lineups
+    if not our_team['lineup'] or not opponent_team['lineup']:
+        # Fall back to the team batting order lists if the players carry no batting order
+        return fallback_get_lineup(game_id, team_id, snapshot=snapshot)
+    
+    return {
+        'team': {
+            'name': our_team['team_name'],
+            'lineup': our_team['lineup']
+        },
+        'opponent': {
+            'team': opponent_team['short_name'],
+            'lineup': opponent_team['lineup']
+        }
+    }, None
+
+
+def parse_boxscore_lineup(boxscore, team_id):
+    """
+    Extract both starting lineups from a raw boxscore
+    
+    Args:
+        boxscore (dict): The raw boxscore JSON for a game
+        team_id (int): The MLB team ID for the team of interest
         
-        return {
-            'team': {
-                'name': our_team_name,
-                'lineup': team_lineup
-            },
-            'opponent': {
-                'team': opponent_team_name,
-                'lineup': opponent_lineup
-            }
-        }, None
+    Returns:
+        tuple: (lineup_data, error_message)
         
-    except Exception:
-        # Fall back to old method if the statsapi approach fails
-        # If there's an error with the boxscore_data method, fall back to direct API call
-        return fallback_get_lineup(game_id, team_id)
-
+    Raises:
+        KeyError: If the boxscore is missing lineup data
+    """
+    # Get the teams data
+    teams = boxscore['teams']
+    
+    # Find which side our team is on (home or away)
+    team_side = 'home' if teams['home']['team']['id'] == team_id else 'away'
+    opponent_side = 'away' if team_side == 'home' else 'home'
+    
+    # Get the team info for both sides
+    our_team = teams[team_side]
+    opponent_team = teams[opponent_side]
+    
+    # Extract lineups if available
+    team_lineup = []
+    opponent_lineup = []
+    
+    # Check if lineups are available
+    if 'battingOrder' not in our_team or not our_team['battingOrder']:
+        return None, f"Lineup not yet available for this game against {opponent_team['team']['name']}"
+    
+    # Get our team's lineup
+    for player_id in our_team['battingOrder']:
+        if player_id == 0:  # Sometimes there are zeros in the batting order
+            continue
+        player = our_team['players'][f'ID{player_id}']
+        position = player['position']['abbreviation']
+        team_lineup.append({
+            'id': player['person'].get('id'),
+            'name': player['person']['fullName'],
+            'position': position,
+            'batting_order': len(team_lineup) + 1,
+            'jersey': player.get('jerseyNumber', '')
+        })
+    
+    # Get opponent lineup
+    for player_id in opponent_team['battingOrder']:
+        if player_id == 0:
+            continue
+        player = opponent_team['players'][f'ID{player_id}']
+        position = player['position']['abbreviation']
+        opponent_lineup.append({
+            'id': player['person'].get('id'),
+            'name': player['person']['fullName'],
+            'position': position,
+            'batting_order': len(opponent_lineup) + 1,
+            'jersey': player.get('jerseyNumber', '')
+        })
+    
+    return {
+        'team': {
+            'name': our_team['team']['name'],
+            'lineup': team_lineup
+        },
+        'opponent': {
+            'team': opponent_team['team']['name'],
+            'lineup': opponent_lineup
+        }
+    }, None
 
-def fallback_get_lineup(game_id, team_id):
+def fallback_get_lineup(game_id, team_id, snapshot=None):
     """
     Fallback method to fetch lineup using direct API call
     
     Args:
         game_id (int): The game ID
         team_id (int): The MLB team ID for the team of interest
+        snapshot (GameSnapshot, optional): Shared per-game data to read from
         
     Returns:
         tuple: (lineup_data, error_message)
     """
-    # Fallback method for lineup retrieval
-    url = f"https://statsapi.mlb.com/api/v1/game/{game_id}/boxscore"
+    if snapshot is None:
+        snapshot = GameSnapshot(game_id)
     
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Get the teams data
-        teams = data['teams']
-        
-        # Find which side our team is on (home or away)
-        team_side = 'home' if teams['home']['team']['id'] == team_id else 'away'
-        opponent_side = 'away' if team_side == 'home' else 'home'
-        
-        # Get the team info for both sides
-        our_team = teams[team_side]
-        opponent_team = teams[opponent_side]
-        
-        # Extract lineups if available
-        team_lineup = []
-        opponent_lineup = []
-        
-        # Check if lineups are available
-        if 'battingOrder' not in our_team or not our_team['battingOrder']:
-            return None, f"Lineup not yet available for this game against {opponent_team['team']['name']}"
-        
-        # Get our team's lineup
-        for player_id in our_team['battingOrder']:
-            if player_id == 0:  # Sometimes there are zeros in the batting order
-                continue
-            player = our_team['players'][f'ID{player_id}']
-            position = player['position']['abbreviation']
-            team_lineup.append({
-                'name': player['person']['fullName'],
-                'position': position,
-                'batting_order': len(team_lineup) + 1,
-                'jersey': player.get('jerseyNumber', '')
-            })
-        
-        # Get opponent lineup
-        for player_id in opponent_team['battingOrder']:
-            if player_id == 0:
-                continue
-            player = opponent_team['players'][f'ID{player_id}']
-            position = player['position']['abbreviation']
-            opponent_lineup.append({
-                'name': player['person']['fullName'],
-                'position': position,
-                'batting_order': len(opponent_lineup) + 1,
-                'jersey': player.get('jerseyNumber', '')
-            })
-        
-        return {
-            'team': {
-                'name': our_team['team']['name'],
-                'lineup': team_lineup
-            },
-            'opponent': {
-                'team': opponent_team['team']['name'],
-                'lineup': opponent_lineup
-            }
-        }, None
+        return parse_boxscore_lineup(snapshot.boxscore, team_id)
     except requests.exceptions.RequestException as e:
         return None, f"Error fetching lineup data: {e}"
     except KeyError as e:
@@ -594,53 +1642,401 @@ def convert_utc_to_edt(utc_time_str):
         print(f"Error converting time: {e}")
         return ''
 
-def main():
-    # Set up command line argument parsing
-    parser = argparse.ArgumentParser(description='Fetch MLB lineup information')
-    parser.add_argument('--date', type=str, help='Game date in YYYY-MM-DD format (default: today)')
-    parser.add_argument('--team', type=str, default='NYM', 
-                       help='Team abbreviation (default: NYM). Examples: NYM, STL, LAD, NYY, etc.')
-    args = parser.parse_args()
+def get_hydrated_schedule_game(game_id):
+    """
+    Fetch a game's schedule entry with probable pitchers and officials hydrated
     
-    # Convert team abbreviation to uppercase and validate
-    team_abbr = args.team.upper()
-    if team_abbr not in MLB_TEAMS:
-        print(f"Error: Invalid team abbreviation '{team_abbr}'. Valid options are: {', '.join(sorted(MLB_TEAMS.keys()))}")
-        sys.exit(1)
+    Args:
+        game_id (int): The game ID
+        
+    Returns:
+        dict: The raw schedule entry for the game, or None if unavailable
+    """
+    params = {'sportId': 1, 'gamePk': game_id, 'hydrate': SCHEDULE_HYDRATIONS}
     
-    team_id = MLB_TEAMS[team_abbr]
+    try:
+        data = fetch_json(SCHEDULE_URL, params=params, ttl=TTL_PREGAME)
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching hydrated schedule: {e}")
+        return None
     
-    date_str = "today's" if args.date is None else f"the {args.date}"
-    print(f"Fetching {date_str} {team_abbr} game information...")
-    game_id, game_status, venue_name, team_names, game_time = get_team_game(team_id, args.date)
+    for date in data.get('dates', []):
+        for game in date.get('games', []):
+            return game
+    return None
+
+def parse_hydrated_game(game, team_id, people=None):
+    """
+    Extract pitchers and umpires from a hydrated schedule entry
     
-    if game_id is None:
-        print(game_status)
-        sys.exit(1)
+    Args:
+        game (dict): A raw schedule entry from get_hydrated_schedule_game
+        team_id (int): The MLB team ID for the team of interest
+        people (dict, optional): Person details keyed by ID for people the
+            hydration returned without a jersey number or throwing hand
+        
+    Returns:
+        dict: Any of 'pitchers' and 'umpires' that the hydration contained
+    """
+    people = people or {}
+    teams = game['teams']
+    
+    # Find which side our team is on (home or away)
+    team_side = 'home' if teams['home']['team']['id'] == team_id else 'away'
+    opponent_side = 'away' if team_side == 'home' else 'home'
+    sides = {'team': team_side, 'opponent': opponent_side}
+    
+    def person_details(person):
+        # Prefer the hydrated fields, filling gaps from the bulk people lookup
+        details = build_pitcher_details(person)
+        known = people.get(person.get('id')) or {}
+        if not details['jersey']:
+            details['jersey'] = known.get('jersey', '')
+        if not person.get('pitchHand'):
+            # Without a known hand, print no "(Unknown)" suffix, as the schedule path never did
+            details['throws'] = known.get('throws', '')
+            details['throws_desc'] = known.get('throws_desc', '')
+        return details
+    
+    details = {}
+    
+    # Probable pitchers
+    if any(teams[side].get('probablePitcher') for side in sides.values()):
+        pitchers = {
+            'team': None,
+            'opponent': None,
+            'team_name': teams[team_side]['team']['name'],
+            'opponent_team': teams[opponent_side]['team']['name']
+        }
+        for team_key, side in sides.items():
+            pitcher = teams[side].get('probablePitcher')
+            if pitcher:
+                pitchers[team_key] = person_details(pitcher)
+        details['pitchers'] = pitchers
+    
+    # Umpires (same shape as the boxscore officials)
+    if game.get('officials'):
+        details['umpires'] = game['officials']
+    
+    return details
+
+def get_details_from_hydrated_schedule(game_id, team_id, game=None):
+    """
+    Get as much of a pre-game's pitchers and umpires as one schedule request provides
+    
+    Args:
+        game_id (int): The game ID
+        team_id (int): The MLB team ID for the team of interest
+        game (dict, optional): The entry from get_hydrated_schedule_game, if the
+            caller already has it
+        
+    Returns:
+        dict: Any of 'pitchers' and 'umpires' that were available
+    """
+    if game is None:
+        game = get_hydrated_schedule_game(game_id)
+    if game is None:
+        return {}
+    
+    # Resolve any jersey numbers and throwing hands the hydration left out in one request
+    people = [game['teams'][side].get('probablePitcher') for side in ('home', 'away')]
+    missing = [person['id'] for person in people
+               if person and 'id' in person and not person.get('primaryNumber')]
+    
+    try:
+        return parse_hydrated_game(game, team_id, get_people_details(missing))
+    except KeyError as e:
+        print(f"Error reading hydrated schedule: {e}")
+        return {}
+
+def fetch_game_details(game_id, game_status, team_id, snapshot=None, concurrent=True, hydrated_game=None):
+    """
+    Fetch the starting pitchers, umpires and lineups for a game
     
-    print(f"Found game (ID: {game_id}), Status: {game_status}")
+    For games that have not started, a single hydrated schedule request is
+    tried first for the pitchers and umpires; the boxscore-based lookups
+    run for the lineups and whatever else it did not contain.
     
-    if game_status not in ["Final", "In Progress", "Warmup", "Pre-Game", "Scheduled"]:
-        print(f"Game status is '{game_status}'. Lineup may not be available.")
+    Args:
+        game_id (int): The game ID
+        game_status (str): The game status
+        team_id (int): The MLB team ID for the team of interest
+        snapshot (GameSnapshot, optional): Shared per-game data to read from
+        concurrent (bool, optional): Run the remaining lookups in parallel threads. Defaults to True.
+        hydrated_game (dict, optional): The game's entry from get_hydrated_schedule_game,
+            if already fetched, so it is not requested again
         
-    if game_status == "Final":
-        print("Note: This is a completed game. If lineups aren't available, the API may not have stored them.")
+    Returns:
+        tuple: (pitchers, umpires, lineup_data, lineup_error)
+    """
+    if snapshot is None:
+        snapshot = GameSnapshot(game_id, game_status)
     
-    # Get starting pitchers (do this first as it's more likely to be available)
-    print("Fetching starting pitchers...")
-    pitchers = get_probable_pitchers(game_id, game_status, team_id)
+    results = {}
+    if game_status in PREGAME_STATUSES:
+        results = get_details_from_hydrated_schedule(game_id, team_id, game=hydrated_game)
     
-    # Get umpire information
-    print("Fetching umpire information...")
-    umpires = get_umpires(game_id)
+    lookups = {
+        'pitchers': lambda: get_probable_pitchers(game_id, game_status, team_id, snapshot=snapshot),
+        'umpires': lambda: get_umpires(game_id, snapshot=snapshot),
+        'lineup': lambda: get_lineup(game_id, team_id, snapshot=snapshot),
+    }
+    missing = {name: lookup for name, lookup in lookups.items() if name not in results}
     
-    # Fetch lineup information last (as it may not be available yet)
-    print("Fetching lineup information...")
-    lineup_data, error = get_lineup(game_id, team_id)
+    if not concurrent or len(missing) < 2:
+        for name, lookup in missing.items():
+            results[name] = lookup()
+    else:
+        # The lookups are independent once the game is known, so start them all at once
+        with concurrent_futures.ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            futures = {name: executor.submit(lookup) for name, lookup in missing.items()}
+            for name, future in futures.items():
+                results[name] = future.result()
+    
+    lineup_data, error = results['lineup']
+    return results['pitchers'], results['umpires'], lineup_data, error
+
+def lineups_posted(game_id, fetcher):
+    """
+    Check whether both teams' lineups are in a game's boxscore, with a minimal request
+    
+    Args:
+        game_id (int): The game ID
+        fetcher (ConditionalFetcher): Used to poll without re-downloading unchanged data
+        
+    Returns:
+        bool: True if both batting orders are filled in
+        
+    Raises:
+        requests.exceptions.RequestException: If the request failed
+    """
+    boxscore = fetcher.get(BOXSCORE_URL.format(game_id=game_id), params={'fields': LINEUP_CHECK_FIELDS})
+    teams = boxscore.get('teams', {})
+    return all(teams.get(side, {}).get('battingOrder') for side in ('home', 'away'))
+
+def get_game_state(game_id, fetcher):
+    """
+    Check a game's status and scheduled start, with a minimal request
+    
+    Args:
+        game_id (int): The game ID
+        fetcher (ConditionalFetcher): Used to poll without re-downloading unchanged data
+        
+    Returns:
+        tuple: (detailed_state, game_date), either of which may be None if not known
+        
+    Raises:
+        requests.exceptions.RequestException: If the request failed
+    """
+    params = {'sportId': 1, 'gamePk': game_id, 'fields': GAME_STATE_FIELDS}
+    data = fetcher.get(SCHEDULE_URL, params=params)
+    for date in data.get('dates', []):
+        for game in date.get('games', []):
+            return game.get('status', {}).get('detailedState'), game.get('gameDate')
+    return None, None
+
+def watch_interval(game_time, now):
+    """
+    Choose how long to wait before the next poll for lineups
+    
+    Args:
+        game_time (datetime): First pitch (timezone-aware), or None if unknown
+        now (datetime): The current time (timezone-aware)
+        
+    Returns:
+        int: Seconds until the next poll
+    """
+    if game_time is None:
+        return WATCH_INTERVALS[1][1]
+    
+    remaining = (game_time - now).total_seconds()
+    for threshold, interval in WATCH_INTERVALS:
+        if remaining > threshold:
+            # Never sleep past the point where polling should speed up
+            return max(WATCH_INTERVALS[-1][1], min(interval, int(remaining - threshold)))
+    return WATCH_INTERVALS[-1][1]
+
+def watch_for_lineups(game_id, game_time, fetcher=None, sleep=time.sleep, now=None):
+    """
+    Poll a game until both lineups are posted
+    
+    Polls are rare far from first pitch and frequent close to it. Each poll
+    asks only for the batting orders and the game's status and start time,
+    as conditional requests. Watching stops once the game is no longer
+    pre-game (e.g. postponed, cancelled or under way) or after WATCH_MAX_WAIT.
+    
+    Args:
+        game_id (int): The game ID
+        game_time (str): First pitch as an ISO 8601 UTC time string, if known
+        fetcher (ConditionalFetcher, optional): Used to make the polls
+        sleep (callable, optional): Waits for the given number of seconds
+        now (callable, optional): Returns the current timezone-aware time
+        
+    Returns:
+        bool: True once both lineups are posted, False if they never will be or
+            the wait ran out
+    """
+    if fetcher is None:
+        fetcher = ConditionalFetcher()
+    if now is None:
+        def now():
+            return datetime.now(pytz.utc)
+    
+    started = now()
+    while True:
+        try:
+            if lineups_posted(game_id, fetcher):
+                return True
+        except requests.exceptions.RequestException as e:
+            print(f"Error checking for lineups: {e}")
+        
+        # A postponed or cancelled game never posts lineups, and a start time may be set later
+        try:
+            status, game_date = get_game_state(game_id, fetcher)
+        except requests.exceptions.RequestException as e:
+            print(f"Error checking game status: {e}")
+            status, game_date = None, None
+        if status is not None and status not in PREGAME_STATUSES:
+            print(f"Game {game_id} is {status}")
+            return False
+        game_time = game_date or game_time
+        first_pitch = datetime.strptime(game_time, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=pytz.utc) if game_time else None
+        
+        current = now()
+        if first_pitch is not None and (current - first_pitch).total_seconds() > WATCH_GRACE:
+            return False
+        if (current - started).total_seconds() > WATCH_MAX_WAIT:
+            return False
+        
+        interval = watch_interval(first_pitch, current)
+        print(f"Lineups not yet posted for game {game_id}; checking again in {interval // 60}m {interval % 60:02d}s")
+        sleep(interval)
+
+def fetch_games_details(jobs, max_workers=DEFAULT_SLATE_WORKERS, concurrent=False, ordered=True):
+    """
+    Fetch the details of many games, several at a time
+    
+    By default each game's own lookups run one after another on its worker,
+    so max_workers bounds the number of requests in flight.
+    
+    Args:
+        jobs (list): (game, team_id) pairs, where game is a statsapi schedule entry
+            and team_id is the team whose perspective the details are fetched from
+        max_workers (int, optional): Maximum number of games fetched at once
+        concurrent (bool, optional): Also run each game's lookups in parallel. Defaults to False.
+        ordered (bool, optional): Yield games in the order of jobs rather than as soon as
+            each one completes. Defaults to True.
+        
+    Yields:
+        tuple: (game, team_id, details), where details is
+            (pitchers, umpires, lineup_data, lineup_error) as from fetch_game_details
+    """
+    def fetch(job):
+        game, team_id = job
+        snapshot = GameSnapshot(game['game_id'], game['status'])
+        return fetch_game_details(game['game_id'], game['status'], team_id,
+                                  snapshot=snapshot, concurrent=concurrent)
+    
+    with concurrent_futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        if ordered:
+            # map keeps the jobs' order while yielding each game as soon as it and those before it are done
+            for (game, team_id), details in zip(jobs, executor.map(fetch, jobs)):
+                yield game, team_id, details
+        else:
+            futures = {executor.submit(fetch, job): job for job in jobs}
+            for future in concurrent_futures.as_completed(futures):
+                game, team_id = futures[future]
+                yield game, team_id, future.result()
+
+def print_slate(date=None, max_workers=DEFAULT_SLATE_WORKERS):
+    """
+    Print every game on a date, each once, in first-pitch order
+    
+    Args:
+        date (str, optional): Date in YYYY-MM-DD format. Defaults to today's date.
+        max_workers (int, optional): Maximum number of games fetched at once
+        
+    Returns:
+        bool: True if the schedule could be fetched and had games
+    """
+    date_str = "today's" if date is None else f"the {date}"
+    print(f"Fetching {date_str} slate...")
+    games, error = get_slate_games(date)
+    
+    if error:
+        print(error)
+        return False
+    
+    print(f"Found {len(games)} games")
+    
+    # Details are fetched from the home team's perspective
+    jobs = [(game, game['home_id']) for game in games]
+    for number, (game, team_id, details) in enumerate(fetch_games_details(jobs, max_workers), 1):
+        _, game_status, venue_name, team_names, game_time = parse_schedule_game(game)
+        pitchers, umpires, lineup_data, error = details
+        print_game(f"GAME {number} OF {len(games)} ({game_status})",
+                   TEAM_ABBRS.get(team_id, team_names['home']), venue_name, team_names,
+                   game_time, pitchers, umpires, lineup_data, error)
+    
+    return True
+
+def print_date_range(start_date, end_date, team_ids=None, max_workers=DEFAULT_SLATE_WORKERS):
+    """
+    Print every game between two dates, each as soon as its details arrive
+    
+    Args:
+        start_date (str): First date in YYYY-MM-DD format
+        end_date (str): Last date in YYYY-MM-DD format (inclusive)
+        team_ids (list, optional): Only print these teams' games. Defaults to every team.
+        max_workers (int, optional): Maximum number of games fetched at once
+        
+    Returns:
+        bool: True if the schedule could be fetched and had games
+    """
+    who = "every team's" if not team_ids else ', '.join(TEAM_ABBRS[team_id] for team_id in team_ids)
+    print(f"Fetching {who} games from {start_date} to {end_date}...")
+    games, error = get_games_in_range(start_date, end_date, team_ids)
+    
+    if error:
+        print(error)
+        return False
+    
+    print(f"Found {len(games)} games")
     
+    # Details are fetched from the first requested team that plays in the game, else the home team
+    jobs = []
+    for game in games:
+        playing = [team_id for team_id in team_ids or [] if team_id in (game.get('home_id'), game.get('away_id'))]
+        jobs.append((game, playing[0] if playing else game['home_id']))
+    for game, game_team_id, details in fetch_games_details(jobs, max_workers, ordered=False):
+        _, game_status, venue_name, team_names, game_time = parse_schedule_game(game)
+        pitchers, umpires, lineup_data, error = details
+        header = f"GAME FOR {game.get('game_date', '')} ({game_status})"
+        if game.get('doubleheader', 'N') != 'N':
+            header = f"{header} (GAME {game.get('game_num', 1)})"
+        print_game(header, TEAM_ABBRS.get(game_team_id, team_names['home']), venue_name,
+                   team_names, game_time, pitchers, umpires, lineup_data, error)
+    
+    return True
+
+def print_game(header, team_abbr, venue_name, team_names, game_time,
+               pitchers, umpires, lineup_data, error):
+    """
+    Print one game's details in the standard layout
+    
+    Args:
+        header (str): Text for the game's heading line
+        team_abbr (str): Abbreviation of the team whose lineup is labeled by abbreviation
+        venue_name (str): The ballpark, if known
+        team_names (dict): Full 'home' and 'away' team names
+        game_time (str): First pitch as an ISO 8601 UTC time string, if known
+        pitchers (dict): Starting pitchers as returned by get_probable_pitchers
+        umpires (list): Umpires as returned by get_umpires
+        lineup_data (dict): Lineups as returned by get_lineup
+        error (str): Why lineup_data is missing, if it is
+    """
     # Print the game information header
-    date_header = "TODAY'S GAME" if args.date is None else f"GAME FOR {args.date}"
-    print(f"\n===== {date_header} =====")
+    print(f"\n===== {header} =====")
     
     # Determine team names from either lineup data or team_names
     # Convention: visiting team (away) listed first, then home team
@@ -730,7 +2126,151 @@ def main():
                 position = umpire['officialType']
                 print(f"{position}: {name}")
 
+def main():
+    # Set up command line argument parsing
+    parser = argparse.ArgumentParser(description='Fetch MLB lineup information')
+    parser.add_argument('--date', type=str, help='Game date in YYYY-MM-DD format (default: today)')
+    parser.add_argument('--team', type=str, default='NYM', 
+                       help='Team abbreviation, or several separated by commas (default: NYM). Examples: NYM, STL, LAD, NYY,BOS, etc.')
+    parser.add_argument('--start-date', type=str,
+                       help='First date of a range of games in YYYY-MM-DD format (use with --end-date)')
+    parser.add_argument('--end-date', type=str,
+                       help='Last date of a range of games in YYYY-MM-DD format (use with --start-date)')
+    parser.add_argument('--all', action='store_true',
+                       help='Show every game on the date instead of a single team\'s game')
+    parser.add_argument('--workers', type=int, default=DEFAULT_SLATE_WORKERS,
+                       help=f'Maximum number of games fetched at once with --all or a date range (default: {DEFAULT_SLATE_WORKERS})')
+    parser.add_argument('--watch', action='store_true',
+                       help='Wait for the lineups to be posted, polling more often as first pitch approaches')
+    parser.add_argument('--sequential', action='store_true',
+                       help='Fetch pitchers, umpires and lineups one after another instead of in parallel')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write the on-disk response cache')
+    parser.add_argument('--stats', action='store_true',
+                       help='Report how many bytes were downloaded from the MLB Stats API')
+    args = parser.parse_args()
+    
+    date_range = args.start_date is not None or args.end_date is not None
+    if date_range and (args.start_date is None or args.end_date is None):
+        parser.error("--start-date and --end-date must be used together")
+    if date_range and args.date is not None:
+        parser.error("--date cannot be combined with --start-date/--end-date")
+    if args.watch and (date_range or args.all):
+        parser.error("--watch cannot be combined with --all or --start-date/--end-date")
+    
+    # Convert team abbreviations to uppercase and validate (--all does not use them)
+    team_abbrs = [abbr.strip().upper() for abbr in args.team.split(',') if abbr.strip()]
+    if not args.all:
+        for team_abbr in team_abbrs or [args.team.upper()]:
+            if team_abbr not in MLB_TEAMS:
+                print(f"Error: Invalid team abbreviation '{team_abbr}'. Valid options are: {', '.join(sorted(MLB_TEAMS.keys()))}")
+                sys.exit(1)
+    
+    # Read through the on-disk cache so repeat runs can skip the network
+    if not args.no_cache:
+        set_cache(response_cache.ResponseCache(response_cache.get_default_cache_path()))
+    
+    # Date ranges and whole slates are fetched game by game on a bounded pool
+    if date_range or args.all:
+        workers = 1 if args.sequential else args.workers
+        if not args.no_cache:
+            set_roster_table(load_roster_table(args.end_date if date_range else args.date))
+        if date_range:
+            found = print_date_range(args.start_date, args.end_date,
+                                     None if args.all else [MLB_TEAMS[abbr] for abbr in team_abbrs], workers)
+        else:
+            found = print_slate(args.date, workers)
+        if args.stats:
+            print(f"\n{get_transfer_counter().summary()}")
+        sys.exit(0 if found else 1)
+    
+    # Drop repeated teams, keeping the order they were given in
+    team_ids = list(dict.fromkeys(MLB_TEAMS[abbr] for abbr in team_abbrs))
+    
+    date_str = "today's" if args.date is None else f"the {args.date}"
+    print(f"Fetching {date_str} {', '.join(TEAM_ABBRS[team_id] for team_id in team_ids)} game information...")
+    if len(team_ids) == 1:
+        games, error = get_team_games(team_ids[0], args.date)
+        jobs = [(game, team_ids[0]) for game in games]
+        errors = {team_ids[0]: error} if error else {}
+    else:
+        jobs, errors = get_teams_games(team_ids, args.date)
+    
+    if not jobs:
+        for error in errors.values():
+            print(error)
+        sys.exit(1)
+    
+    # Player bios come from the rosters of the teams playing, fetched in
+    # one batch; with the on-disk cache only the first such run of the day does so
+    if not args.no_cache:
+        playing = dict.fromkeys(game.get(side) for game, _ in jobs for side in ('home_id', 'away_id'))
+        playing.pop(None, None)
+        set_roster_table(load_roster_table(args.date, team_ids=list(playing)))
+    
+    if args.watch:
+        fetcher = ConditionalFetcher()
+        for game, _ in jobs:
+            print(f"Watching game {game['game_id']} for lineups...")
+            if not watch_for_lineups(game['game_id'], game.get('game_datetime'), fetcher):
+                print(f"Gave up waiting for the lineups of game {game['game_id']}")
+        # Responses cached before the lineups were posted are stale now
+        set_cache(None)
+    
+    if len(team_ids) > 1:
+        for team_id, error in errors.items():
+            print(f"{TEAM_ABBRS[team_id]}: {error}")
+    elif len(jobs) > 1:
+        print(f"Found {len(jobs)} games (doubleheader)")
+    
+    for game, _ in jobs:
+        game_id, game_status, _, _, _ = parse_schedule_game(game)
+        print(f"Found game (ID: {game_id}), Status: {game_status}")
+        
+        if game_status not in ["Final", "In Progress", "Warmup", "Pre-Game", "Scheduled"]:
+            print(f"Game status is '{game_status}'. Lineup may not be available.")
+            
+        if game_status == "Final":
+            print("Note: This is a completed game. If lineups aren't available, the API may not have stored them.")
+    
+    # Label each game with the requested teams playing in it and, for a doubleheader, its number
+    date_header = "TODAY'S GAME" if args.date is None else f"GAME FOR {args.date}"
+    headers = []
+    for game, team_id in jobs:
+        header = date_header
+        if len(team_ids) > 1:
+            playing = [TEAM_ABBRS[other] for other in team_ids if other in (game.get('home_id'), game.get('away_id'))]
+            header = f"{header} - {'/'.join(playing or [TEAM_ABBRS[team_id]])}"
+        team_games = [other_game for other_game, other_team_id in jobs if other_team_id == team_id]
+        if len(team_games) > 1:
+            header = f"{header} (GAME {team_games.index(game) + 1} OF {len(team_games)})"
+        headers.append(header)
+    
+    # Get starting pitchers, umpires and lineups (in parallel unless --sequential).
+    # Each game shares one download of its boxscore between all of its lookups,
+    # and the games (of a doubleheader, or of several teams) are fetched side by side.
+    print("Fetching starting pitchers...")
+    print("Fetching umpire information...")
+    print("Fetching lineup information...")
+    results = fetch_games_details(jobs, max_workers=1 if args.sequential else min(len(jobs), args.workers),
+                                  concurrent=not args.sequential)
+    
+    for header, (game, team_id, details) in zip(headers, results):
+        _, _, venue_name, team_names, game_time = parse_schedule_game(game)
+        pitchers, umpires, lineup_data, error = details
+        print_game(header, TEAM_ABBRS[team_id], venue_name, team_names, game_time,
+                   pitchers, umpires, lineup_data, error)
+    
+    if args.stats:
+        print(f"\n{get_transfer_counter().summary()}")
+
 if __name__ == "__main__":
+    # A running lineup_helper.py answers from its warm process; otherwise run here
+    from lineup_helper import forward_to_helper
+    exit_code = forward_to_helper(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+    
     try:
         main()
         sys.exit(0)
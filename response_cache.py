@@ -0,0 +1,152 @@
+"""
+Persistent on-disk cache for MLB Stats API responses
+
+Responses are stored as JSON in a small SQLite database so that repeated
+runs for the same game can be answered without touching the network. Each
+entry carries its own time-to-live, and the total size of the cache is
+capped by evicting the least recently used entries.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode
+
+# Default cap on the total size of cached response bodies (bytes)
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+
+def get_default_cache_path():
+    """
+    Get the location of the on-disk cache
+
+    The MLB_LINEUPS_CACHE environment variable overrides the default of
+    ~/.cache/mlb-lineups/responses.sqlite3 (or $XDG_CACHE_HOME/mlb-lineups/...).
+
+    Returns:
+        str: Path to the cache database file
+    """
+    if os.environ.get('MLB_LINEUPS_CACHE'):
+        return os.environ['MLB_LINEUPS_CACHE']
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'mlb-lineups', 'responses.sqlite3')
+
+
+def cache_key(endpoint, params=None):
+    """
+    Build a cache key from an endpoint and its parameters
+
+    Args:
+        endpoint (str): URL or name of the endpoint
+        params (dict, optional): Request parameters
+
+    Returns:
+        str: A key that is the same for equal endpoint/parameter combinations
+    """
+    if not params:
+        return endpoint
+    return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+
+class ResponseCache:
+    """
+    SQLite-backed JSON cache with per-entry TTLs and LRU eviction
+
+    The cache is safe to share between threads, and between processes
+    through SQLite's own file locking.
+
+    Args:
+        path (str): Path to the cache database file
+        max_bytes (int, optional): Maximum total size of cached values
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires REAL NOT NULL,"
+            " accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._conn.commit()
+
+    def get(self, key):
+        """
+        Look up a cached value
+
+        Args:
+            key (str): The cache key
+
+        Returns:
+            The cached value, or None if it is missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl):
+        """
+        Store a value, evicting least recently used entries if over the size cap
+
+        Args:
+            key (str): The cache key
+            value: A JSON-serializable value
+            ttl (float): Seconds until the entry expires
+        """
+        encoded = json.dumps(value, separators=(',', ':'))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, expires, accessed)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, encoded, len(encoded), now + ttl, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        # Expired entries go first, then the least recently used until under the cap
+        self._conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self):
+        """Remove every entry from the cache"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
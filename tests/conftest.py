@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+# Add the parent directory to the path to allow importing the main script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import print_lineups
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep every test away from the user's on-disk cache and from earlier tests' memoized people and rosters"""
+    monkeypatch.setenv('MLB_LINEUPS_CACHE', str(tmp_path / 'responses.sqlite3'))
+    print_lineups.set_cache(None)
+    print_lineups.set_roster_table(None)
+    print_lineups.get_person_memo().clear()
+    yield
+    print_lineups.set_cache(None)
+    print_lineups.set_roster_table(None)
+    print_lineups.get_person_memo().clear()
@@ -2,12 +2,15 @@ import pytest
 import os
 import sys
 from unittest.mock import patch, MagicMock
+import http.client
 import json
+import threading
 from io import StringIO
 
 # Add the parent directory to the path to allow importing the main script
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import print_lineups
+import lineup_server
 
 # Fixtures for test data
 @pytest.fixture
@@ -32,11 +35,11 @@ def mock_player_response():
 class TestCommandLineOptions:
     """Integration tests for command line options"""
     
-    @patch('print_lineups.get_team_game')
-    def test_default_team_option(self, mock_get_team_game):
+    @patch('print_lineups.get_team_games')
+    def test_default_team_option(self, mock_get_team_games):
         """Test default team (NYM) is used when no --team option is provided"""
         # Configure the mock to return None values to short-circuit the function
-        mock_get_team_game.return_value = (None, None, None, None, "No games")
+        mock_get_team_games.return_value = ([], "No games")
         
         # Set up sys.argv
         sys.argv = ['print_lineups.py']
@@ -47,15 +50,15 @@ class TestCommandLineOptions:
                 print_lineups.main()
             
             # Check that mock was called with NYM team ID (121)
-            mock_get_team_game.assert_called_once()
-            args, kwargs = mock_get_team_game.call_args
+            mock_get_team_games.assert_called_once()
+            args, kwargs = mock_get_team_games.call_args
             assert args[0] == 121
     
-    @patch('print_lineups.get_team_game')
-    def test_specified_team_option(self, mock_get_team_game):
+    @patch('print_lineups.get_team_games')
+    def test_specified_team_option(self, mock_get_team_games):
         """Test specified team is used when --team option is provided"""
         # Configure the mock
-        mock_get_team_game.return_value = (None, None, None, None, "No games")
+        mock_get_team_games.return_value = ([], "No games")
         
         # Test with different teams
         test_cases = [
@@ -74,13 +77,13 @@ class TestCommandLineOptions:
                     print_lineups.main()
                 
                 # Check that mock was called with the correct team ID
-                mock_get_team_game.assert_called_with(team_id, None)
+                mock_get_team_games.assert_called_with(team_id, None)
     
-    @patch('print_lineups.get_team_game')
-    def test_date_option(self, mock_get_team_game):
+    @patch('print_lineups.get_team_games')
+    def test_date_option(self, mock_get_team_games):
         """Test specified date is used when --date option is provided"""
         # Configure the mock
-        mock_get_team_game.return_value = (None, None, None, None, "No games")
+        mock_get_team_games.return_value = ([], "No games")
         
         # Set up sys.argv with a date
         sys.argv = ['print_lineups.py', '--date', '2025-04-15']
@@ -91,7 +94,7 @@ class TestCommandLineOptions:
                 print_lineups.main()
             
             # Check that mock was called with the correct date
-            mock_get_team_game.assert_called_with(121, '2025-04-15')
+            mock_get_team_games.assert_called_with(121, '2025-04-15')
     
     @patch('sys.stdout', new_callable=StringIO)
     def test_invalid_team_error(self, mock_stdout):
@@ -107,6 +110,30 @@ class TestCommandLineOptions:
         output = mock_stdout.getvalue()
         assert "Invalid team abbreviation" in output
         assert "Valid options are" in output
+    
+    @patch('print_lineups.fetch_game_details', return_value=(None, None, None, "Lineup not yet available"))
+    @patch('print_lineups.load_roster_table')
+    @patch('print_lineups.get_team_games')
+    def test_roster_table_limited_to_teams_playing(self, mock_get_team_games, mock_load_roster_table,
+                                                   mock_fetch_game_details):
+        """Test that a single-team run only fetches the rosters of the two teams in its game"""
+        mock_get_team_games.return_value = ([{
+            'game_id': 778518,
+            'status': "Scheduled",
+            'home_id': 121,
+            'away_id': 142,
+            'home_name': 'New York Mets',
+            'away_name': 'Minnesota Twins',
+            'game_datetime': "2025-04-15T18:10:00Z"
+        }], None)
+        
+        sys.argv = ['print_lineups.py', '--team', 'NYM', '--date', '2025-04-15']
+        
+        with patch('sys.stdout', new=StringIO()):
+            print_lineups.main()
+        
+        # Assertions
+        mock_load_roster_table.assert_called_once_with("2025-04-15", team_ids=[121, 142])
 
 class TestEndToEndWithMocks:
     """Integration tests mocking API responses to simulate end-to-end behavior"""
@@ -118,6 +145,13 @@ class TestEndToEndWithMocks:
         mock_args = MagicMock()
         mock_args.date = None
         mock_args.team = 'NYM'
+        mock_args.sequential = False
+        mock_args.stats = False
+        mock_args.all = False
+        mock_args.watch = False
+        mock_args.workers = print_lineups.DEFAULT_SLATE_WORKERS
+        mock_args.start_date = None
+        mock_args.end_date = None
         
         # Create a mock parser that returns our predefined args
         mock_parser = MagicMock()
@@ -129,19 +163,20 @@ class TestEndToEndWithMocks:
     @patch('print_lineups.get_umpires')
     @patch('print_lineups.get_probable_pitchers')
     @patch('print_lineups.get_lineup')
-    @patch('print_lineups.get_team_game')
+    @patch('print_lineups.get_team_games')
     @patch('sys.exit')  # Mock sys.exit to prevent actual exit
-    def test_successful_lineup_display(self, mock_exit, mock_get_team_game, mock_get_lineup, 
+    def test_successful_lineup_display(self, mock_exit, mock_get_team_games, mock_get_lineup, 
                                        mock_get_probable_pitchers, mock_get_umpires):
         """Test successful end-to-end flow with mocked responses"""
         # Configure mocks
-        mock_get_team_game.return_value = (
-            778518,  # game_id
-            "Final",  # game_status
-            "Test Ballpark",  # venue_name
-            {'home': 'New York Mets', 'away': 'Test Opponent'},  # team_names
-            "2025-04-15T18:10:00Z"  # game_time
-        )
+        mock_get_team_games.return_value = ([{
+            'game_id': 778518,
+            'status': "Final",
+            'venue_name': "Test Ballpark",
+            'home_name': 'New York Mets',
+            'away_name': 'Test Opponent',
+            'game_datetime': "2025-04-15T18:10:00Z"
+        }], None)
         
         mock_get_lineup.return_value = (
             {
@@ -219,13 +254,13 @@ class TestEndToEndWithMocks:
             assert "Ump One" in output
             assert "Home Plate" in output
     
-    @patch('print_lineups.get_team_game')
+    @patch('print_lineups.get_team_games')
     @patch('sys.exit')  # Mock sys.exit to prevent actual exit
-    def test_no_games_scheduled(self, mock_exit, mock_get_team_game):
+    def test_no_games_scheduled(self, mock_exit, mock_get_team_games):
         """Test behavior when no games are scheduled"""
         # Configure mock to return None values that trigger exit
         message = "None"
-        mock_get_team_game.return_value = (None, None, None, None, message)
+        mock_get_team_games.return_value = ([], message)
         
         # Set up an exit handler to capture the exit
         def side_effect(code):
@@ -247,22 +282,24 @@ class TestEndToEndWithMocks:
             output = fake_output.getvalue()
             assert message in output
             
+    @patch('print_lineups.get_details_from_hydrated_schedule', return_value={})
     @patch('print_lineups.get_umpires')
     @patch('print_lineups.get_probable_pitchers')
     @patch('print_lineups.get_lineup')
-    @patch('print_lineups.get_team_game')
+    @patch('print_lineups.get_team_games')
     @patch('sys.exit')  # Mock sys.exit to prevent actual exit
-    def test_lineup_not_available(self, mock_exit, mock_get_team_game, mock_get_lineup, 
-                                 mock_get_probable_pitchers, mock_get_umpires):
+    def test_lineup_not_available(self, mock_exit, mock_get_team_games, mock_get_lineup, 
+                                 mock_get_probable_pitchers, mock_get_umpires, mock_hydrated):
         """Test behavior when lineup is not available"""
         # Configure mocks
-        mock_get_team_game.return_value = (
-            778518,  # game_id
-            "Scheduled",  # game_status
-            "Test Ballpark",  # venue_name
-            {'home': 'New York Mets', 'away': 'Test Opponent'},  # team_names
-            "2025-04-15T18:10:00Z"  # game_time
-        )
+        mock_get_team_games.return_value = ([{
+            'game_id': 778518,
+            'status': "Scheduled",
+            'venue_name': "Test Ballpark",
+            'home_name': 'New York Mets',
+            'away_name': 'Test Opponent',
+            'game_datetime': "2025-04-15T18:10:00Z"
+        }], None)
         
         error_message = "Lineup not yet available for this game against Test Opponent"
         mock_get_lineup.return_value = (None, error_message)
@@ -300,4 +337,318 @@ class TestEndToEndWithMocks:
             assert "Test Opponent vs. New York Mets" in output
             assert "STARTING PITCHERS" in output
             assert "Test Pitcher" in output
-            assert "Lineups not yet available" in output
\ No newline at end of file
+            assert "Lineups not yet available" in output
+
+class TestSlateMode:
+    """Integration tests for printing a whole day's slate"""
+    
+    @patch('print_lineups.fetch_game_details')
+    @patch('statsapi.schedule')
+    def test_all_prints_each_game_once_in_order(self, mock_schedule, mock_fetch_game_details):
+        """Test that --all prints every game once, in first-pitch order"""
+        # Two games, listed out of order and with one duplicate
+        late = {'game_id': 2, 'status': 'Scheduled', 'home_id': 147, 'home_name': 'New York Yankees',
+                'away_name': 'Boston Red Sox', 'venue_name': 'Yankee Stadium',
+                'game_datetime': '2025-04-15T23:05:00Z'}
+        early = {'game_id': 1, 'status': 'Final', 'home_id': 121, 'home_name': 'New York Mets',
+                 'away_name': 'Atlanta Braves', 'venue_name': 'Citi Field',
+                 'game_datetime': '2025-04-15T17:10:00Z'}
+        mock_schedule.return_value = [late, early, late]
+        mock_fetch_game_details.return_value = (None, None, None, "Lineup not yet available")
+        
+        # Set up sys.argv
+        sys.argv = ['print_lineups.py', '--all', '--date', '2025-04-15', '--no-cache']
+        
+        # Run main function with patched stdout
+        with patch('sys.stdout', new=StringIO()) as fake_output:
+            with pytest.raises(SystemExit) as exit_info:
+                print_lineups.main()
+            output = fake_output.getvalue()
+        
+        # Assertions
+        assert exit_info.value.code == 0
+        mock_schedule.assert_called_once_with(date='2025-04-15', sportId=1)
+        assert mock_fetch_game_details.call_count == 2
+        assert output.count("Atlanta Braves vs. New York Mets") == 1
+        assert output.count("Boston Red Sox vs. New York Yankees") == 1
+        assert output.index("GAME 1 OF 2 (Final)") < output.index("GAME 2 OF 2 (Scheduled)")
+
+
+class TestDoubleheader:
+    """Integration tests for a team playing twice on one date"""
+    
+    @patch('print_lineups.fetch_game_details')
+    @patch('print_lineups.get_team_games')
+    def test_both_games_printed_with_labels(self, mock_get_team_games, mock_fetch_game_details):
+        """Test that both games are fetched side by side and printed with a game number"""
+        games = [
+            {'game_id': 1, 'game_num': 1, 'status': 'Final', 'venue_name': 'Citi Field',
+             'home_name': 'New York Mets', 'away_name': 'Atlanta Braves',
+             'game_datetime': '2025-04-15T17:10:00Z'},
+            {'game_id': 2, 'game_num': 2, 'status': 'In Progress', 'venue_name': 'Citi Field',
+             'home_name': 'New York Mets', 'away_name': 'Atlanta Braves',
+             'game_datetime': '2025-04-15T21:40:00Z'},
+        ]
+        mock_get_team_games.return_value = (games, None)
+        
+        # Both fetches must be in flight at once for either to finish
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def side_effect(game_id, game_status, team_id, snapshot=None, concurrent=True):
+            barrier.wait()
+            return (None, None, None, f"Lineup not yet available for game {game_id}")
+        
+        mock_fetch_game_details.side_effect = side_effect
+        
+        # Set up sys.argv
+        sys.argv = ['print_lineups.py', '--team', 'NYM', '--date', '2025-04-15', '--no-cache']
+        
+        # Run main function with patched stdout
+        with patch('sys.stdout', new=StringIO()) as fake_output:
+            print_lineups.main()
+            output = fake_output.getvalue()
+        
+        # Assertions
+        assert "Found 2 games (doubleheader)" in output
+        assert output.index("GAME FOR 2025-04-15 (GAME 1 OF 2)") < output.index("GAME FOR 2025-04-15 (GAME 2 OF 2)")
+        assert mock_fetch_game_details.call_count == 2
+
+
+class TestDateRangeMode:
+    """Integration tests for printing a team's games over several dates"""
+    
+    @patch('print_lineups.fetch_game_details')
+    @patch('statsapi.schedule')
+    def test_range_uses_one_schedule_request(self, mock_schedule, mock_fetch_game_details):
+        """Test that --start-date/--end-date prints each game from one ranged request"""
+        mock_schedule.return_value = [
+            {'game_id': day, 'game_date': f'2025-04-{day:02d}', 'status': 'Final',
+             'home_id': 121, 'home_name': 'New York Mets', 'away_name': 'Atlanta Braves',
+             'venue_name': 'Citi Field', 'game_datetime': f'2025-04-{day:02d}T23:10:00Z'}
+            for day in (14, 15, 16)
+        ]
+        mock_fetch_game_details.return_value = (None, None, None, "Lineup not yet available")
+        
+        # Set up sys.argv
+        sys.argv = ['print_lineups.py', '--team', 'NYM', '--start-date', '2025-04-14',
+                    '--end-date', '2025-04-16', '--no-cache']
+        
+        # Run main function with patched stdout
+        with patch('sys.stdout', new=StringIO()) as fake_output:
+            with pytest.raises(SystemExit) as exit_info:
+                print_lineups.main()
+            output = fake_output.getvalue()
+        
+        # Assertions
+        assert exit_info.value.code == 0
+        mock_schedule.assert_called_once_with(start_date='2025-04-14', end_date='2025-04-16',
+                                              sportId=1, team='121')
+        for day in (14, 15, 16):
+            assert f"GAME FOR 2025-04-{day} (Final)" in output
+    
+    def test_range_needs_both_dates(self):
+        """Test that a range with only one end is rejected"""
+        sys.argv = ['print_lineups.py', '--start-date', '2025-04-14']
+        
+        with patch('sys.stderr', new=StringIO()) as fake_error, pytest.raises(SystemExit) as exit_info:
+            print_lineups.main()
+        
+        # Assertions
+        assert exit_info.value.code == 2
+        assert "--start-date and --end-date must be used together" in fake_error.getvalue()
+
+
+class TestMultipleTeams:
+    """Integration tests for several teams in one run"""
+    
+    @patch('print_lineups.fetch_game_details')
+    @patch('statsapi.schedule')
+    def test_shared_game_fetched_once(self, mock_schedule, mock_fetch_game_details):
+        """Test that a game between two requested teams is fetched and printed once"""
+        subway_series = {'game_id': 1, 'status': 'Final', 'home_id': 147, 'away_id': 121,
+                         'home_name': 'New York Yankees', 'away_name': 'New York Mets',
+                         'venue_name': 'Yankee Stadium', 'game_datetime': '2025-04-15T23:05:00Z'}
+        red_sox_game = {'game_id': 2, 'status': 'Final', 'home_id': 111, 'away_id': 110,
+                        'home_name': 'Boston Red Sox', 'away_name': 'Baltimore Orioles',
+                        'venue_name': 'Fenway Park', 'game_datetime': '2025-04-15T23:10:00Z'}
+        mock_schedule.return_value = [subway_series, red_sox_game]
+        mock_fetch_game_details.return_value = (None, None, None, "Lineup not yet available")
+        
+        # Set up sys.argv
+        sys.argv = ['print_lineups.py', '--team', 'nym, NYY,BOS', '--date', '2025-04-15', '--no-cache']
+        
+        # Run main function with patched stdout
+        with patch('sys.stdout', new=StringIO()) as fake_output:
+            print_lineups.main()
+            output = fake_output.getvalue()
+        
+        # Assertions
+        mock_schedule.assert_called_once_with(date='2025-04-15', sportId=1)
+        assert mock_fetch_game_details.call_count == 2
+        assert output.count("New York Mets vs. New York Yankees") == 1
+        assert "GAME FOR 2025-04-15 - NYM/NYY" in output
+        assert "GAME FOR 2025-04-15 - BOS" in output
+    
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_invalid_team_in_list(self, mock_stdout):
+        """Test that one bad abbreviation in a list is reported"""
+        sys.argv = ['print_lineups.py', '--team', 'NYM,XYZ']
+        
+        with pytest.raises(SystemExit):
+            print_lineups.main()
+        
+        assert "Invalid team abbreviation 'XYZ'" in mock_stdout.getvalue()
+
+
+class TestServerMode:
+    """Integration tests for the JSON server over real HTTP"""
+    
+    @patch('lineup_server.get_slate_games')
+    def test_games_over_http(self, mock_get_slate_games):
+        """Test a keep-alive client getting the same cached response twice"""
+        mock_get_slate_games.return_value = ([{'game_id': 778518, 'status': 'Scheduled',
+                                               'home_name': 'New York Mets', 'away_name': 'Atlanta Braves'}], None)
+        server = lineup_server.create_server(port=0)
+        thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=5)
+            bodies = []
+            for _ in range(2):
+                conn.request('GET', '/games/2025-04-15')
+                response = conn.getresponse()
+                assert response.status == 200
+                assert response.getheader('Content-Type') == 'application/json'
+                bodies.append(json.loads(response.read()))
+            conn.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        # Assertions
+        assert bodies[0] == bodies[1]
+        assert bodies[0]['games'][0]['home_name'] == 'New York Mets'
+        mock_get_slate_games.assert_called_once()
+    
+    @patch('lineup_push.fetch_game_details')
+    @patch('lineup_push.get_hydrated_schedule_game')
+    def test_event_stream(self, mock_hydrated, mock_fetch_game_details):
+        """Test a client receiving a game's changes as server-sent events until it is final"""
+        mock_hydrated.return_value = {'status': {'detailedState': 'Final'},
+                                      'teams': {'home': {'team': {'id': 121}}, 'away': {'team': {'id': 144}}}}
+        umpires = [{'official': {'fullName': 'Angel Hernandez'}, 'officialType': 'Home Plate'}]
+        mock_fetch_game_details.return_value = (None, umpires, None, "Lineup not yet available")
+        server = lineup_server.create_server(port=0)
+        thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=5)
+            conn.request('GET', '/events/game/778518')
+            response = conn.getresponse()
+            content_type = response.getheader('Content-Type')
+            # The stream ends by itself once the game is final
+            stream = response.read().decode()
+            conn.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        # Assertions
+        assert content_type == 'text/event-stream'
+        events = [block.split('\n') for block in stream.strip().split('\n\n')]
+        assert [lines[0] for lines in events] == ['event: umpires', 'event: game']
+        assert json.loads(events[0][1][len('data: '):])['after'][0]['name'] == 'Angel Hernandez'
+        assert server.hub.pollers() == {}
+
+
+class TestHelperMode:
+    """Integration tests for forwarding command lines to the background helper"""
+    
+    @pytest.fixture
+    def helper(self, tmp_path):
+        """Fixture for a helper listening on a temporary socket"""
+        import lineup_helper
+        
+        path = str(tmp_path / 'helper.sock')
+        server = lineup_helper.HelperServer(path)
+        thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        yield server, path
+        server.shutdown()
+        server.server_close()
+    
+    def test_falls_back_without_helper(self, tmp_path):
+        """Test that nothing is run when no helper is listening"""
+        from lineup_helper import forward_to_helper
+        
+        assert forward_to_helper(['--team', 'NYM'], path=str(tmp_path / 'missing.sock')) is None
+    
+    @patch('print_lineups.get_team_games')
+    def test_runs_forwarded_in_helper(self, mock_get_team_games, helper):
+        """Test that forwarded runs print through the client and return their exit codes"""
+        from lineup_helper import forward_to_helper
+        
+        server, path = helper
+        mock_get_team_games.return_value = ([], "No game scheduled for the selected team on this date.")
+        
+        outputs = []
+        exit_codes = []
+        for argv in (['--team', 'XYZ'], ['--team', 'NYM', '--date', '2025-04-15'], ['--date']):
+            stdout, stderr = StringIO(), StringIO()
+            exit_codes.append(forward_to_helper(argv, path=path, stdout=stdout, stderr=stderr))
+            outputs.append((stdout.getvalue(), stderr.getvalue()))
+        
+        # Assertions
+        assert exit_codes == [1, 1, 2]
+        assert "Invalid team abbreviation 'XYZ'" in outputs[0][0]
+        assert "No game scheduled" in outputs[1][0]
+        assert "expected one argument" in outputs[2][1]
+        mock_get_team_games.assert_called_once_with(121, '2025-04-15')
+        assert server.runs == 3
+        assert print_lineups.get_cache() is None
+        assert print_lineups.get_roster_table() is None
+    
+    def test_no_helper_environment_variable(self, helper, monkeypatch):
+        """Test that forwarding can be switched off"""
+        from lineup_helper import forward_to_helper
+        
+        monkeypatch.setenv('MLB_LINEUPS_NO_HELPER', '1')
+        
+        assert forward_to_helper(['--team', 'NYM'], path=helper[1]) is None
+        assert helper[0].runs == 0
+    
+    def test_busy_helper_sends_client_back(self, helper):
+        """Test that a run arriving while another is in progress is not queued behind it"""
+        from lineup_helper import forward_to_helper
+        
+        server, path = helper
+        server.run_lock.acquire()
+        try:
+            exit_code = forward_to_helper(['--team', 'NYM'], path=path)
+        finally:
+            server.run_lock.release()
+        
+        # Assertions
+        assert exit_code is None
+        assert server.runs == 0
+
+
+class TestStartup:
+    """Integration tests for the runs that end before any request"""
+    
+    @pytest.mark.parametrize("argv", [['--help'], ['--team', 'XYZ']])
+    def test_fast_paths_skip_heavy_imports(self, argv):
+        """Test that --help and an invalid team never import the modules print_lineups defers"""
+        import subprocess
+        
+        script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'print_lineups.py')
+        env = dict(os.environ, MLB_LINEUPS_NO_HELPER='1')
+        result = subprocess.run([sys.executable, '-X', 'importtime', script, *argv],
+                                capture_output=True, text=True, env=env, check=False)
+        imported = {line.split('|')[-1].strip() for line in result.stderr.splitlines()
+                    if line.startswith('import time:')}
+        
+        # Assertions
+        assert result.returncode == (0 if argv == ['--help'] else 1)
+        assert imported.isdisjoint({'requests', 'pytz', 'statsapi', 'response_cache', 'sqlite3',
+                                    'concurrent.futures'})
@@ -1,5 +1,13 @@
 import pytest
+import asyncio
+import io
 import json
+from datetime import datetime, timedelta
+from itertools import pairwise
+import pytz
+import requests
+import threading
+import time
 from unittest.mock import patch, MagicMock
 import sys
 import os
@@ -7,13 +15,51 @@ import os
 # Add the parent directory to the path to allow importing the main script
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from print_lineups import (
+    BOXSCORE_FIELDS,
     MLB_TEAMS,
+    PEOPLE_FIELDS,
+    PersonMemo,
+    RosterTable,
+    TransferCounter,
     get_team_game,
+    get_team_games,
+    get_teams_games,
     get_lineup,
+    get_player_details,
     get_pitcher_details,
+    get_people_details,
     get_probable_pitchers,
-    get_umpires
+    get_pitchers_from_boxscore,
+    get_umpires,
+    fallback_get_lineup,
+    GameSnapshot,
+    create_session,
+    get_session,
+    set_session,
+    fetch_game_details,
+    fetch_games_details,
+    get_slate_games,
+    get_games_in_range,
+    get_details_from_hydrated_schedule,
+    parse_hydrated_game,
+    format_pitcher_info,
+    parse_boxscore,
+    load_roster_table,
+    set_roster_table,
+    ConditionalFetcher,
+    watch_for_lineups,
+    watch_interval
 )
+from async_lineups import AsyncMLBClient
+from backfill import LineupStore, RateLimiter, backfill, get_backfill_games
+from lineup_archive import LineupArchive, LineupArchiveBuilder
+from lineup_changes import ChangeDetector, format_event, section_digest
+from lineup_push import EventHub, GamePoller, Subscription
+from lineup_server import CoalescingCache, LineupService
+from live_feed import LiveGame, PatchError, apply_patch
+from prefetch import PrefetchDaemon, RefreshingCache, prefetch_times, warm_team_schedules
+from response_cache import ResponseCache
+import print_lineups
 
 # Sample data for mocking responses
 @pytest.fixture
@@ -35,113 +81,43 @@ def mock_player_response():
         return json.load(f)
 
 @pytest.fixture
-def mock_boxscore_data_with_substitutes():
-    """Fixture for mock boxscore data containing substitutes"""
+def mock_boxscore_with_substitutes():
+    """Fixture for a mock raw boxscore containing substitutes"""
+    def player(person_id, full_name, jersey, position, batting_order):
+        return {
+            "person": {"id": person_id, "fullName": full_name},
+            "jerseyNumber": jersey,
+            "position": {"abbreviation": position},
+            "battingOrder": batting_order
+        }
+    
     return {
-        "teamInfo": {
+        "teams": {
             "away": {
-                "id": 141,
-                "abbreviation": "TOR",
-                "teamName": "Blue Jays",
-                "shortName": "Toronto"
+                "team": {"id": 141, "name": "Toronto Blue Jays", "teamName": "Blue Jays"},
+                "players": {
+                    # Regular starter
+                    "ID666182": player(666182, "Bo Bichette", "11", "SS", "100"),
+                    # Substitute player
+                    "ID672386": player(672386, "Alejandro Kirk", "30", "PH", "501")
+                }
             },
             "home": {
-                "id": 121,
-                "abbreviation": "NYM",
-                "teamName": "Mets",
-                "shortName": "NY Mets"
-            }
-        },
-        "homeBatters": [
-            # Header row
-            {
-                "namefield": "Mets Batters",
-                "position": "",
-                "battingOrder": "",
-                "personId": 0,
-                "substitution": False
-            },
-            # Regular starter
-            {
-                "namefield": "1 Lindor SS",
-                "name": "Lindor",
-                "position": "SS",
-                "battingOrder": "100",
-                "personId": 596019,
-                "substitution": False
-            },
-            # Another starter
-            {
-                "namefield": "7 Baty 2B",
-                "name": "Baty",
-                "position": "2B",
-                "battingOrder": "700",
-                "personId": 683146,
-                "substitution": False
-            },
-            # Substitute that replaced Baty at 2B
-            {
-                "namefield": "2 Acuña 2B",
-                "name": "Acuña",
-                "position": "2B",
-                "battingOrder": "701",
-                "personId": 682551,
-                "substitution": True
-            }
-        ],
-        "awayBatters": [
-            # Header row
-            {
-                "namefield": "Blue Jays Batters",
-                "position": "",
-                "battingOrder": "",
-                "personId": 0,
-                "substitution": False
-            },
-            # Regular starter
-            {
-                "namefield": "1 Bichette SS",
-                "name": "Bichette",
-                "position": "SS",
-                "battingOrder": "100",
-                "personId": 666182,
-                "substitution": False
-            },
-            # Substitute player
-            {
-                "namefield": "a-Kirk PH",
-                "name": "Kirk",
-                "position": "PH",
-                "battingOrder": "501",
-                "personId": 672386,
-                "substitution": True
-            }
-        ],
-        "playerInfo": {
-            "ID596019": {
-                "id": 596019,
-                "fullName": "Francisco Lindor",
-                "boxscoreName": "Lindor"
-            },
-            "ID683146": {
-                "id": 683146,
-                "fullName": "Brett Baty",
-                "boxscoreName": "Baty"
-            },
-            "ID682551": {
-                "id": 682551,
-                "fullName": "Luisangel Acuña",
-                "boxscoreName": "Acuña"
-            },
-            "ID666182": {
-                "id": 666182,
-                "fullName": "Bo Bichette",
-                "boxscoreName": "Bichette"
-            },
-            "ID672386": {
-                "id": 672386,
-                "fullName": "Alejandro Kirk",
-                "boxscoreName": "Kirk"
+                "team": {"id": 121, "name": "New York Mets", "teamName": "Mets"},
+                "players": {
+                    # Substitute that replaced Baty at 2B
+                    "ID682551": player(682551, "Luisangel Acuña", "2", "2B", "701"),
+                    # Another starter
+                    "ID683146": player(683146, "Brett Baty", "22", "2B", "700"),
+                    # Regular starter
+                    "ID596019": player(596019, "Francisco Lindor", "12", "SS", "100"),
+                    # Bench player who did not appear
+                    "ID624413": {
+                        "person": {"id": 624413, "fullName": "Pete Alonso"},
+                        "jerseyNumber": "20",
+                        "position": {"abbreviation": "1B"}
+                    }
+                }
             }
         }
     }
@@ -234,10 +210,65 @@ class TestGetTeamGame:
         assert venue_name is None
         assert "Error" in error_msg
 
+class TestGetTeamGames:
+    """Tests for fetching every game a team plays on a date"""
+    
+    @patch('statsapi.schedule')
+    def test_doubleheader_returns_both_games(self, mock_schedule):
+        """Test that both games of a doubleheader are returned, in game number order"""
+        # The second game has no start time yet and is listed first
+        mock_schedule.return_value = [
+            {'game_id': 2, 'game_num': 2, 'status': 'Scheduled', 'home_name': 'New York Mets',
+             'away_name': 'Test Opponent', 'game_datetime': ''},
+            {'game_id': 1, 'game_num': 1, 'status': 'Final', 'home_name': 'New York Mets',
+             'away_name': 'Test Opponent', 'game_datetime': '2025-04-15T17:10:00Z'},
+        ]
+        
+        # Call the functions
+        games, error = get_team_games(121, "2025-04-15")
+        first_game = get_team_game(121, "2025-04-15")
+        
+        # Assertions
+        assert error is None
+        assert [game['game_id'] for game in games] == [1, 2]
+        assert first_game[0] == 1
+        mock_schedule.assert_called_with(date="2025-04-15", team=121, sportId=1)
+
+
+class TestGetTeamsGames:
+    """Tests for fetching the games of several teams at once"""
+    
+    @patch('statsapi.schedule')
+    def test_game_between_requested_teams_listed_once(self, mock_schedule):
+        """Test that one slate request serves every team and a game between two of them is listed once"""
+        subway_series = {'game_id': 1, 'home_id': 147, 'away_id': 121, 'game_datetime': '2025-04-15T23:05:00Z'}
+        red_sox_game = {'game_id': 2, 'home_id': 111, 'away_id': 110, 'game_datetime': '2025-04-15T22:10:00Z'}
+        other_game = {'game_id': 3, 'home_id': 119, 'away_id': 144, 'game_datetime': '2025-04-16T02:10:00Z'}
+        mock_schedule.return_value = [subway_series, red_sox_game, other_game]
+        
+        # Call the function
+        games, errors = get_teams_games([121, 147, 111, 136], "2025-04-15")
+        
+        # Assertions
+        mock_schedule.assert_called_once_with(date="2025-04-15", sportId=1)
+        assert [(game['game_id'], team_id) for game, team_id in games] == [(1, 121), (2, 111)]
+        assert list(errors) == [136]
+        
+    @patch('statsapi.schedule', side_effect=Exception("Network down"))
+    def test_failed_request_reported_for_every_team(self, mock_schedule):
+        """Test that a failed schedule request is the reason given for each team"""
+        games, errors = get_teams_games([121, 147], "2025-04-15")
+        
+        # Assertions
+        assert games == []
+        assert all("Network down" in error for error in errors.values())
+        assert list(errors) == [121, 147]
+
+
 class TestGetLineup:
     """Tests for the get_lineup function"""
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_lineup_success(self, mock_get, mock_boxscore_response):
         """Test successful lineup retrieval"""
         # Create a custom response with necessary structure
@@ -309,7 +340,7 @@ class TestGetLineup:
         assert len(lineup_data['team']['lineup']) > 0
         assert len(lineup_data['opponent']['lineup']) > 0
         
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_lineup_no_batting_order(self, mock_get, mock_boxscore_response):
         """Test handling when batting order isn't available"""
         # Modify the response to remove batting order
@@ -333,7 +364,7 @@ class TestGetLineup:
 class TestGetPitcherDetails:
     """Tests for the get_pitcher_details function"""
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pitcher_details_success(self, mock_get, mock_player_response):
         """Test successful pitcher details retrieval"""
         # Configure the mock
@@ -351,7 +382,7 @@ class TestGetPitcherDetails:
         assert pitcher_details['throws'] == "R"
         assert pitcher_details['throws_desc'] == "RHP"
         
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_pitcher_details_left_handed(self, mock_get, mock_player_response):
         """Test for left-handed pitcher"""
         # Modify response for left-handed pitcher
@@ -389,7 +420,7 @@ class TestGetProbablePitchers:
         pitchers = get_probable_pitchers(778518, "Final", 121)
         
         # Verify boxscore method was called and results returned
-        mock_get_pitchers_from_boxscore.assert_called_once_with(778518, 121)
+        mock_get_pitchers_from_boxscore.assert_called_once_with(778518, 121, snapshot=None)
         assert pitchers == expected_pitchers
     
     @patch('print_lineups.get_pitchers_from_schedule')
@@ -436,7 +467,7 @@ class TestGetProbablePitchers:
         pitchers = get_probable_pitchers(778518, "Final", 121)
         
         # Verify get_pitchers_from_boxscore was called
-        mock_boxscore.assert_called_once_with(778518, 121)
+        mock_boxscore.assert_called_once_with(778518, 121, snapshot=None)
         assert pitchers == expected_result
     
     @patch('print_lineups.get_pitchers_from_schedule')
@@ -481,7 +512,7 @@ class TestGetProbablePitchers:
 class TestGetUmpires:
     """Tests for the get_umpires function"""
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_umpires_success(self, mock_get, mock_boxscore_response):
         """Test successful umpire information retrieval"""
         # Make sure boxscore response includes officials
@@ -511,7 +542,7 @@ class TestGetUmpires:
         assert umpires[0]['officialType'] == 'Home Plate'
         assert umpires[0]['official']['fullName'] == 'John Smith'
         
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_umpires_no_officials(self, mock_get):
         """Test handling when no officials data is available"""
         # Configure response with no officials
@@ -526,14 +557,944 @@ class TestGetUmpires:
         assert umpires is None
 
 
+class TestGameSnapshot:
+    """Tests for sharing one boxscore download across lookups"""
+    
+    @patch('print_lineups.get_people_details')
+    @patch('requests.Session.get')
+    def test_boxscore_fetched_once(self, mock_get, mock_get_people_details, mock_boxscore_response):
+        """Test that lineup, pitcher and umpire lookups share one boxscore request"""
+        # Configure the mock
+        mock_response = MagicMock()
+        mock_response.json.return_value = mock_boxscore_response
+        mock_get.return_value = mock_response
+        mock_get_people_details.return_value = {}
+        
+        # Read everything from one snapshot
+        snapshot = GameSnapshot(778518)
+        umpires = get_umpires(778518, snapshot=snapshot)
+        pitchers = get_pitchers_from_boxscore(778518, 121, snapshot=snapshot)
+        fallback_get_lineup(778518, 121, snapshot=snapshot)
+        
+        # Assertions
+        assert umpires is not None
+        assert pitchers['team_name'] == 'New York Mets'
+        mock_get.assert_called_once_with("https://statsapi.mlb.com/api/v1/game/778518/boxscore",
+                                         params={'fields': BOXSCORE_FIELDS})
+        
+    @patch('print_lineups.get_people_details', return_value={})
+    @patch('requests.Session.get')
+    def test_boxscore_parsed_once(self, mock_get, mock_get_people_details, mock_boxscore_response):
+        """Test that the pitcher and lineup lookups share one parse of the boxscore"""
+        mock_get.return_value.json.return_value = mock_boxscore_response
+        
+        snapshot = GameSnapshot(778518)
+        with patch('print_lineups.parse_boxscore', wraps=parse_boxscore) as mock_parse_boxscore:
+            get_pitchers_from_boxscore(778518, 121, snapshot=snapshot)
+            get_lineup(778518, 121, snapshot=snapshot)
+        
+        # Assertions
+        mock_parse_boxscore.assert_called_once()
+        
+    @patch('requests.Session.get')
+    def test_failed_download_not_retried(self, mock_get):
+        """Test that a failed boxscore download is remembered by the snapshot"""
+        # Configure the mock to fail
+        mock_get.side_effect = requests.exceptions.ConnectionError("Network down")
+        
+        # Call two consumers with the same snapshot
+        snapshot = GameSnapshot(778518)
+        assert get_umpires(778518, snapshot=snapshot) is None
+        lineup_data, error = fallback_get_lineup(778518, 121, snapshot=snapshot)
+        
+        # Assertions
+        assert lineup_data is None
+        assert "Network down" in error
+        assert mock_get.call_count == 1
+
+
+class TestBulkPeopleLookup:
+    """Tests for resolving a game's players with one people request"""
+    
+    @patch('requests.Session.get')
+    def test_get_people_details_single_request(self, mock_get, mock_player_response):
+        """Test that several people are resolved with one request"""
+        # Configure the mock with two people
+        second = dict(mock_player_response['people'][0], id=654321, fullName="Second Pitcher",
+                      primaryNumber="48", pitchHand={"code": "L", "description": "Left"})
+        mock_response = MagicMock()
+        mock_response.json.return_value = {'people': mock_player_response['people'] + [second]}
+        mock_get.return_value = mock_response
+        
+        # Call the function
+        people = get_people_details([123456, 654321])
+        
+        # Assertions
+        mock_get.assert_called_once_with("https://statsapi.mlb.com/api/v1/people",
+                                         params={'personIds': '123456,654321',
+                                                 'fields': PEOPLE_FIELDS})
+        assert people[123456]['jersey'] == "21"
+        assert people[123456]['throws_desc'] == "RHP"
+        assert people[654321]['name'] == "Second Pitcher"
+        assert people[654321]['throws_desc'] == "LHP"
+        
+    def test_get_people_details_empty(self):
+        """Test that no request is made when there is nobody to look up"""
+        with patch('requests.Session.get') as mock_get:
+            assert get_people_details([]) == {}
+            mock_get.assert_not_called()
+    
+    @patch('requests.Session.get')
+    def test_get_lineup_needs_no_people_requests(self, mock_get, mock_boxscore_with_substitutes):
+        """Test that lineup jersey numbers come straight from the boxscore"""
+        mock_get.return_value.json.return_value = mock_boxscore_with_substitutes
+        
+        # Call the function
+        lineup_data, error = get_lineup(778518, 121)
+        
+        # Assertions
+        assert error is None
+        mock_get.assert_called_once_with("https://statsapi.mlb.com/api/v1/game/778518/boxscore",
+                                         params={'fields': BOXSCORE_FIELDS})
+        assert [player['jersey'] for player in lineup_data['team']['lineup']] == ['12', '22']
+        assert lineup_data['opponent']['lineup'][0]['jersey'] == '11'
+
+
+class TestHTTPSession:
+    """Tests for the shared pooled HTTP session"""
+    
+    def test_create_session_sizes_pool(self):
+        """Test that the session mounts an adapter with the requested pool size"""
+        session = create_session(pool_connections=2, pool_maxsize=7)
+        adapter = session.get_adapter("https://statsapi.mlb.com/api/v1/people")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 7
+        
+    def test_set_session_is_used_by_fetches(self, mock_player_response):
+        """Test that an injected session receives every request"""
+        mock_session = MagicMock()
+        mock_session.get.return_value.json.return_value = mock_player_response
+        
+        set_session(mock_session)
+        try:
+            assert get_session() is mock_session
+            pitcher_details = get_pitcher_details(123456)
+        finally:
+            set_session(None)
+        
+        # Assertions
+        assert pitcher_details['name'] == "Test Pitcher"
+        mock_session.get.assert_called_once_with("https://statsapi.mlb.com/api/v1/people/123456",
+                                                 params={'fields': PEOPLE_FIELDS})
+        
+    @patch('requests.Session.get')
+    def test_statsapi_uses_shared_session(self, mock_get):
+        """Test that statsapi library calls go through the shared session"""
+        mock_get.return_value.json.return_value = {'dates': []}
+        
+        # Call the function
+        get_team_game(121, "2025-04-01")
+        
+        # The schedule request should have been made through the session
+        assert mock_get.called
+        assert "schedule" in mock_get.call_args.args[0]
+        
+    def test_session_negotiates_compression(self):
+        """Test that the session explicitly asks for compressed responses"""
+        session = create_session()
+        assert session.headers['Accept-Encoding'] == "gzip, deflate"
+
+
+class TestTransferCounter:
+    """Tests for counting downloaded bytes"""
+    
+    def test_counts_wire_and_decoded_bytes(self):
+        """Test that compressed and decompressed sizes are tallied separately"""
+        counter = TransferCounter()
+        response = MagicMock()
+        response.content = b"x" * 1000
+        response.raw.tell.return_value = 200
+        
+        counter.record(response)
+        counter.record(response)
+        
+        # Assertions
+        assert counter.requests == 2
+        assert counter.wire_bytes == 400
+        assert counter.decoded_bytes == 2000
+        
+    def test_falls_back_to_decoded_size(self):
+        """Test that a response without a wire byte count is counted by its body"""
+        counter = TransferCounter()
+        response = MagicMock()
+        response.content = b"{}"
+        response.raw = None
+        
+        counter.record(response)
+        
+        # Assertions
+        assert counter.wire_bytes == 2
+        counter.reset()
+        assert counter.requests == 0
+        assert counter.summary() == "Downloaded 0.0 KB (0.0 KB decoded) in 0 requests"
+
+
+class TestSlate:
+    """Tests for fetching every game on a date"""
+    
+    @staticmethod
+    def schedule_entry(game_id, game_datetime, home_id=121):
+        return {
+            'game_id': game_id,
+            'status': 'Final',
+            'home_id': home_id,
+            'home_name': 'Home Team',
+            'away_name': 'Away Team',
+            'venue_name': 'Test Park',
+            'game_datetime': game_datetime,
+        }
+    
+    @patch('statsapi.schedule')
+    def test_slate_dedupes_and_orders_by_first_pitch(self, mock_schedule):
+        """Test that one schedule call yields each game once, earliest first"""
+        mock_schedule.return_value = [
+            self.schedule_entry(3, '2025-04-15T23:10:00Z'),
+            self.schedule_entry(1, '2025-04-15T17:05:00Z'),
+            self.schedule_entry(3, '2025-04-15T23:10:00Z'),
+            self.schedule_entry(2, '2025-04-15T20:10:00Z'),
+        ]
+        
+        # Call the function
+        games, error = get_slate_games("2025-04-15")
+        
+        # Assertions
+        assert error is None
+        assert [game['game_id'] for game in games] == [1, 2, 3]
+        mock_schedule.assert_called_once_with(date="2025-04-15", sportId=1)
+        
+    @patch('statsapi.schedule')
+    def test_slate_with_no_games(self, mock_schedule):
+        """Test the error message when nothing is scheduled"""
+        mock_schedule.return_value = []
+        games, error = get_slate_games("2025-12-25")
+        assert games == []
+        assert "No games scheduled" in error
+    
+    @patch('print_lineups.fetch_game_details')
+    def test_games_fetched_in_parallel_and_returned_in_order(self, mock_fetch):
+        """Test that games are fetched concurrently but yielded in job order"""
+        # Each fetch waits until both are in flight, and the first one finishes last
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def side_effect(game_id, game_status, team_id, snapshot=None, concurrent=True):
+            barrier.wait()
+            if game_id == 1:
+                time.sleep(0.05)
+            return (None, None, None, f"game {game_id}")
+        
+        mock_fetch.side_effect = side_effect
+        jobs = [(self.schedule_entry(1, ''), 121), (self.schedule_entry(2, ''), 147)]
+        
+        # Call the function
+        results = list(fetch_games_details(jobs, max_workers=2))
+        
+        # Assertions
+        assert [details[3] for _, _, details in results] == ["game 1", "game 2"]
+        assert [team_id for _, team_id, _ in results] == [121, 147]
+        for call in mock_fetch.call_args_list:
+            assert call.kwargs['concurrent'] is False
+
+
+class TestDateRange:
+    """Tests for fetching games over a range of dates"""
+    
+    @patch('statsapi.schedule')
+    def test_one_ranged_schedule_request(self, mock_schedule):
+        """Test that a whole range comes from a single schedule call"""
+        mock_schedule.return_value = [
+            TestSlate.schedule_entry(2, '2025-04-16T23:10:00Z'),
+            TestSlate.schedule_entry(1, '2025-04-15T23:10:00Z'),
+        ]
+        
+        # Call the function
+        games, error = get_games_in_range("2025-04-15", "2025-04-16", [121])
+        
+        # Assertions
+        assert error is None
+        assert [game['game_id'] for game in games] == [1, 2]
+        mock_schedule.assert_called_once_with(start_date="2025-04-15", end_date="2025-04-16",
+                                              sportId=1, team='121')
+    
+    @patch('print_lineups.fetch_game_details')
+    def test_results_streamed_as_completed(self, mock_fetch):
+        """Test that unordered fetching yields a game as soon as it finishes"""
+        second_done = threading.Event()
+        
+        def side_effect(game_id, game_status, team_id, snapshot=None, concurrent=True):
+            # The first game can only finish after the second one has been handed back
+            if game_id == 1:
+                assert second_done.wait(timeout=5)
+            return (None, None, None, f"game {game_id}")
+        
+        mock_fetch.side_effect = side_effect
+        jobs = [(TestSlate.schedule_entry(1, ''), 121), (TestSlate.schedule_entry(2, ''), 121)]
+        
+        # Collect results, signalling once the second game arrives
+        order = []
+        for game, _, _ in fetch_games_details(jobs, max_workers=2, ordered=False):
+            order.append(game['game_id'])
+            if game['game_id'] == 2:
+                second_done.set()
+        
+        # Assertions
+        assert order == [2, 1]
+
+
+class TestFetchGameDetails:
+    """Tests for fetching a game's pitchers, umpires and lineups together"""
+    
+    @patch('print_lineups.get_lineup')
+    @patch('print_lineups.get_umpires')
+    @patch('print_lineups.get_probable_pitchers')
+    def test_fetches_run_concurrently(self, mock_pitchers, mock_umpires, mock_lineup):
+        """Test that all three lookups are in flight at the same time"""
+        # Each lookup waits until the other two have started
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def wait_then(value):
+            def side_effect(*args, **kwargs):
+                barrier.wait()
+                return value
+            return side_effect
+        
+        mock_pitchers.side_effect = wait_then({'team': None})
+        mock_umpires.side_effect = wait_then([{'officialType': 'Home Plate'}])
+        mock_lineup.side_effect = wait_then(({'team': {}}, None))
+        
+        # Call the function
+        pitchers, umpires, lineup_data, error = fetch_game_details(778518, "Final", 121)
+        
+        # Assertions
+        assert pitchers == {'team': None}
+        assert umpires == [{'officialType': 'Home Plate'}]
+        assert lineup_data == {'team': {}}
+        assert error is None
+        
+    @patch('print_lineups.get_details_from_hydrated_schedule', return_value={})
+    @patch('print_lineups.get_lineup')
+    @patch('print_lineups.get_umpires')
+    @patch('print_lineups.get_probable_pitchers')
+    def test_sequential_mode_shares_snapshot(self, mock_pitchers, mock_umpires, mock_lineup, mock_hydrated):
+        """Test that sequential mode passes the same snapshot to every lookup"""
+        mock_pitchers.return_value = None
+        mock_umpires.return_value = None
+        mock_lineup.return_value = (None, "Lineup not yet available")
+        
+        snapshot = GameSnapshot(778518)
+        result = fetch_game_details(778518, "Scheduled", 121, snapshot=snapshot, concurrent=False)
+        
+        # Assertions
+        assert result == (None, None, None, "Lineup not yet available")
+        mock_pitchers.assert_called_once_with(778518, "Scheduled", 121, snapshot=snapshot)
+        mock_umpires.assert_called_once_with(778518, snapshot=snapshot)
+        mock_lineup.assert_called_once_with(778518, 121, snapshot=snapshot)
+
+
+class FakeAsyncResponse:
+    """Minimal stand-in for an aiohttp response"""
+    
+    def __init__(self, data):
+        self._data = data
+        
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def raise_for_status(self):
+        pass
+    
+    async def json(self):
+        await asyncio.sleep(0)
+        return self._data
+
+
+class FakeAsyncSession:
+    """Minimal stand-in for an aiohttp session that records requests"""
+    
+    def __init__(self, responder):
+        self.responder = responder
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        
+    def get(self, url, params=None):
+        self.calls.append((url, params))
+        session = self
+        
+        class TrackedResponse(FakeAsyncResponse):
+            async def __aenter__(self):
+                session.in_flight += 1
+                session.max_in_flight = max(session.max_in_flight, session.in_flight)
+                await asyncio.sleep(0.01)
+                return self
+            
+            async def __aexit__(self, *exc):
+                session.in_flight -= 1
+                return False
+        
+        return TrackedResponse(self.responder(url, params))
+
+
+class TestAsyncClient:
+    """Tests for the asyncio MLB Stats API client"""
+    
+    def test_get_team_game(self, mock_schedule_response):
+        """Test schedule lookup matches the synchronous result shape"""
+        session = FakeAsyncSession(lambda url, params: mock_schedule_response)
+        client = AsyncMLBClient(session=session)
+        
+        game_id, game_status, venue_name, _, game_time = asyncio.run(
+            client.get_team_game(117, "2025-03-28"))
+        
+        # Assertions
+        assert game_id == 778518
+        assert game_status == "Final"
+        assert venue_name == "Daikin Park"
+        assert game_time == "2025-03-28T17:10:00Z"
+        _, params = session.calls[0]
+        assert params['date'] == "2025-03-28"
+        assert params['teamId'] == 117
+    
+    def test_fetch_game_details_shares_boxscore(self, mock_boxscore_response, mock_player_response):
+        """Test that concurrent lookups share one boxscore, one parse of it and one people request"""
+        def responder(url, params):
+            return mock_player_response if url.endswith('/people') else mock_boxscore_response
+        session = FakeAsyncSession(responder)
+        client = AsyncMLBClient(session=session)
+        
+        with patch('async_lineups.parse_boxscore', wraps=parse_boxscore) as mock_parse_boxscore:
+            pitchers, umpires, _, _ = asyncio.run(
+                client.fetch_game_details(778518, "Final", 121))
+        
+        # Assertions
+        mock_parse_boxscore.assert_called_once()
+        urls = [url for url, _ in session.calls]
+        assert urls.count("https://statsapi.mlb.com/api/v1/game/778518/boxscore") == 1
+        assert urls.count("https://statsapi.mlb.com/api/v1/people") == 1
+        assert umpires is not None
+        assert pitchers['team_name'] == 'New York Mets'
+        # Only the starting pitchers need looking up; batters' details are in the boxscore
+        people_params = next(params for url, params in session.calls if url.endswith('/people'))
+        assert people_params['personIds'] == '664285'
+        
+    def test_concurrency_is_bounded(self, mock_player_response):
+        """Test that no more than max_concurrency requests are in flight"""
+        session = FakeAsyncSession(lambda url, params: mock_player_response)
+        client = AsyncMLBClient(session=session, max_concurrency=3)
+        
+        async def lookup_many():
+            return await asyncio.gather(*(client.get_pitcher_details(pid) for pid in range(10)))
+        
+        results = asyncio.run(lookup_many())
+        
+        # Assertions
+        assert len(results) == 10
+        assert results[0]['throws_desc'] == "RHP"
+        assert session.max_in_flight == 3
+
+
+@pytest.fixture
+def mock_hydrated_schedule_response():
+    """Fixture for a schedule response hydrated with probable pitchers and officials"""
+    return {
+        'dates': [{
+            'games': [{
+                'gamePk': 778518,
+                'teams': {
+                    'away': {
+                        'team': {'id': 121, 'name': 'New York Mets'},
+                        'probablePitcher': {'id': 1001, 'fullName': 'Away Pitcher', 'primaryNumber': '35',
+                                            'pitchHand': {'code': 'R'}}
+                    },
+                    'home': {
+                        'team': {'id': 142, 'name': 'Minnesota Twins'},
+                        'probablePitcher': {'id': 1002, 'fullName': 'Home Pitcher'}
+                    }
+                },
+                'officials': [{'official': {'fullName': 'Adam Hamari'}, 'officialType': 'Home Plate'}]
+            }]
+        }]
+    }
+
+
+class TestHydratedSchedule:
+    """Tests for filling in pre-game details from one hydrated schedule request"""
+    
+    @patch('print_lineups.get_lineup', return_value=(None, "Lineup not yet available"))
+    @patch('requests.Session.get')
+    def test_hydrated_schedule_provides_pitchers_and_umpires(self, mock_get, mock_lineup,
+                                                             mock_hydrated_schedule_response):
+        """Test that pitchers and umpires come from the schedule plus one people request"""
+        def fake_get(url, params=None):
+            response = MagicMock()
+            if url.endswith('/people'):
+                response.json.return_value = {'people': [
+                    {'id': 1002, 'fullName': 'Home Pitcher', 'primaryNumber': '41', 'pitchHand': {'code': 'L'}}
+                ]}
+            else:
+                response.json.return_value = mock_hydrated_schedule_response
+            return response
+        mock_get.side_effect = fake_get
+        
+        pitchers, umpires, _, _ = fetch_game_details(778518, "Pre-Game", 121)
+        
+        # Assertions
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[0].kwargs['params']['hydrate'] == "probablePitcher,officials,person"
+        assert pitchers['team'] == {'name': 'Away Pitcher', 'jersey': '35', 'throws': 'R', 'throws_desc': 'RHP'}
+        assert pitchers['opponent'] == {'name': 'Home Pitcher', 'jersey': '41', 'throws': 'L', 'throws_desc': 'LHP'}
+        assert umpires[0]['official']['fullName'] == 'Adam Hamari'
+        # Lineups need game positions, which only the boxscore has
+        mock_lineup.assert_called_once()
+        
+    def test_missing_throwing_hand_left_blank(self, mock_hydrated_schedule_response):
+        """Test that a pitcher with a jersey number but no throwing hand gets no "(Unknown)" suffix"""
+        game = mock_hydrated_schedule_response['dates'][0]['games'][0]
+        game['teams']['home']['probablePitcher']['primaryNumber'] = '41'
+        
+        pitchers = parse_hydrated_game(game, 121)['pitchers']
+        
+        # Assertions
+        assert pitchers['opponent'] == {'name': 'Home Pitcher', 'jersey': '41', 'throws': '', 'throws_desc': ''}
+        assert format_pitcher_info(pitchers['opponent']) == "#41 Home Pitcher"
+        
+    @patch('print_lineups.get_lineup')
+    @patch('print_lineups.get_umpires')
+    @patch('print_lineups.get_probable_pitchers')
+    @patch('requests.Session.get')
+    def test_falls_back_only_for_missing_sections(self, mock_get, mock_pitchers, mock_umpires, mock_lineup,
+                                                  mock_hydrated_schedule_response):
+        """Test that boxscore-based lookups only run for what the hydration lacks"""
+        game = mock_hydrated_schedule_response['dates'][0]['games'][0]
+        game['teams']['home']['probablePitcher']['primaryNumber'] = '41'
+        mock_get.return_value.json.return_value = mock_hydrated_schedule_response
+        mock_lineup.return_value = (None, "Lineup not yet available")
+        
+        pitchers, _umpires, lineup_data, error = fetch_game_details(778518, "Scheduled", 121)
+        
+        # Assertions
+        mock_pitchers.assert_not_called()
+        mock_umpires.assert_not_called()
+        mock_lineup.assert_called_once()
+        assert pitchers['opponent']['jersey'] == '41'
+        assert lineup_data is None
+        assert "not yet available" in error
+        
+    @patch('print_lineups.get_lineup', return_value=(None, "Lineup not yet available"))
+    @patch('requests.Session.get')
+    def test_already_fetched_game_not_requested_again(self, mock_get, mock_lineup,
+                                                      mock_hydrated_schedule_response):
+        """Test that a hydrated game passed in by the caller is used without another schedule request"""
+        game = mock_hydrated_schedule_response['dates'][0]['games'][0]
+        game['teams']['home']['probablePitcher']['primaryNumber'] = '41'
+        
+        pitchers, umpires, _, _ = fetch_game_details(778518, "Pre-Game", 121, hydrated_game=game)
+        
+        # Assertions
+        mock_get.assert_not_called()
+        assert pitchers['team']['name'] == 'Away Pitcher'
+        assert umpires[0]['official']['fullName'] == 'Adam Hamari'
+        
+    @patch('print_lineups.get_details_from_hydrated_schedule')
+    @patch('print_lineups.get_lineup', return_value=(None, "Lineup not yet available"))
+    @patch('print_lineups.get_umpires', return_value=None)
+    @patch('print_lineups.get_probable_pitchers', return_value=None)
+    def test_not_used_for_started_games(self, mock_pitchers, mock_umpires, mock_lineup, mock_hydrated):
+        """Test that in-progress and finished games skip the hydrated schedule"""
+        fetch_game_details(778518, "Final", 121)
+        mock_hydrated.assert_not_called()
+        
+    @patch('requests.Session.get')
+    def test_request_failure_returns_nothing(self, mock_get):
+        """Test that a failed hydrated request leaves everything to the fallbacks"""
+        mock_get.side_effect = requests.exceptions.ConnectionError("Network down")
+        assert get_details_from_hydrated_schedule(778518, 121) == {}
+
+
+class TestResponseCache:
+    """Tests for the on-disk response cache"""
+    
+    def test_round_trip_and_persistence(self, tmp_path):
+        """Test that values survive reopening the cache file"""
+        path = str(tmp_path / 'cache.sqlite3')
+        cache = ResponseCache(path)
+        cache.set('people/1', {'people': [{'id': 1}]}, ttl=60)
+        cache.close()
+        
+        reopened = ResponseCache(path)
+        assert reopened.get('people/1') == {'people': [{'id': 1}]}
+        assert reopened.get('people/2') is None
+        assert (reopened.hits, reopened.misses) == (1, 1)
+        
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test that entries past their TTL are not returned"""
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite3'))
+        cache.set('schedule', [], ttl=-1)
+        assert cache.get('schedule') is None
+        
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entries are evicted over the size cap"""
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite3'), max_bytes=25)
+        with patch('time.time', return_value=100.0):
+            cache.set('a', 'x' * 8, ttl=1000)
+            cache.set('b', 'y' * 8, ttl=1000)
+        
+        # Touch 'a' so that 'b' is the least recently used entry
+        with patch('time.time', return_value=200.0):
+            assert cache.get('a') is not None
+            cache.set('c', 'z' * 8, ttl=1000)
+            
+            assert cache.get('a') is not None
+            assert cache.get('b') is None
+            assert cache.get('c') is not None
+    
+    def test_ttl_for_status(self):
+        """Test that finished games are cached longer than upcoming and live ones"""
+        assert print_lineups.ttl_for_status("Final") > print_lineups.ttl_for_status("Scheduled")
+        assert print_lineups.ttl_for_status("Scheduled") > print_lineups.ttl_for_status("In Progress")
+    
+    @patch('requests.Session.get')
+    def test_fetchers_read_through_cache(self, mock_get, mock_player_response, tmp_path):
+        """Test that a repeated lookup is served from the cache without a request"""
+        mock_get.return_value.json.return_value = mock_player_response
+        print_lineups.set_cache(ResponseCache(str(tmp_path / 'cache.sqlite3')))
+        
+        first = get_pitcher_details(123456)
+        second = get_pitcher_details(123456)
+        
+        # Assertions
+        assert first == second
+        assert mock_get.call_count == 1
+        
+    @patch('requests.Session.get')
+    def test_final_game_snapshot_uses_cache(self, mock_get, mock_boxscore_response, tmp_path):
+        """Test that a second run for a finished game makes no requests"""
+        mock_get.return_value.json.return_value = mock_boxscore_response
+        print_lineups.set_cache(ResponseCache(str(tmp_path / 'cache.sqlite3')))
+        
+        for _ in range(2):
+            snapshot = GameSnapshot(778518, "Final")
+            assert get_umpires(778518, snapshot=snapshot) is not None
+        
+        # Assertions
+        assert mock_get.call_count == 1
+
+
+class TestPersonMemo:
+    """Tests for the in-process memo of player and pitcher bios"""
+    
+    def test_lru_eviction_and_counters(self):
+        """Test that the memo is bounded and counts hits and misses"""
+        memo = PersonMemo(maxsize=2)
+        memo.put(1, {'name': 'One'})
+        memo.put(2, {'name': 'Two'})
+        assert memo.get(1) == {'name': 'One'}
+        memo.put(3, {'name': 'Three'})
+        
+        # Person 2 was least recently used
+        assert memo.get(2) is None
+        assert memo.get(3) == {'name': 'Three'}
+        assert len(memo) == 2
+        assert (memo.hits, memo.misses) == (2, 1)
+        
+    def test_concurrent_puts_stay_bounded(self):
+        """Test that the memo stays within its bound under concurrent use"""
+        memo = PersonMemo(maxsize=50)
+        
+        def worker(offset):
+            for pid in range(offset, offset + 200):
+                memo.put(pid, {'name': str(pid)})
+                memo.get(pid)
+        
+        threads = [threading.Thread(target=worker, args=(i * 1000,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(memo) == 50
+        assert memo.hits + memo.misses == 800
+    
+    @patch('requests.Session.get')
+    def test_player_and_pitcher_share_entry(self, mock_get, mock_player_response):
+        """Test that a pitcher lookup after a player lookup is served from memory"""
+        mock_get.return_value.json.return_value = mock_player_response
+        
+        player = get_player_details(123456)
+        pitcher = get_pitcher_details(123456)
+        
+        # Assertions
+        assert player == {'name': "Test Pitcher", 'jersey': "21"}
+        assert pitcher['throws_desc'] == "RHP"
+        assert mock_get.call_count == 1
+        assert print_lineups.get_person_memo().hits == 1
+        
+    @patch('requests.Session.get')
+    def test_bulk_lookup_skips_known_people(self, mock_get, mock_player_response):
+        """Test that the multi-person request only asks for people not yet memoized"""
+        mock_get.return_value.json.return_value = mock_player_response
+        get_pitcher_details(123456)
+        
+        people = get_people_details([123456, 654321])
+        
+        # Assertions
+        assert people[123456]['name'] == "Test Pitcher"
+        mock_get.assert_called_with("https://statsapi.mlb.com/api/v1/people",
+                                    params={'personIds': '654321', 'fields': PEOPLE_FIELDS})
+
+
+class TestWatch:
+    """Tests for polling until lineups are posted"""
+    
+    FIRST_PITCH = datetime(2025, 4, 15, 23, 10, tzinfo=pytz.utc)
+    
+    def test_interval_shrinks_toward_first_pitch(self):
+        """Test that polls are rare far from first pitch and frequent near it"""
+        def interval(hours_before):
+            return watch_interval(self.FIRST_PITCH, self.FIRST_PITCH - timedelta(hours=hours_before))
+        
+        # Assertions
+        assert interval(10) == 30 * 60
+        assert interval(4) == 10 * 60
+        assert interval(2) == 3 * 60
+        assert interval(0.5) == 60
+        assert interval(-1) == 60
+        # A long sleep is cut short where the next, faster band begins
+        assert interval(6 + 5 / 60) == 5 * 60
+    
+    @patch('requests.Session.get')
+    def test_conditional_requests_reuse_unchanged_body(self, mock_get):
+        """Test that validators are sent back and a 304 returns the previous body"""
+        first = MagicMock(status_code=200, headers={'ETag': '"abc"'})
+        first.json.return_value = {'teams': {}}
+        not_modified = MagicMock(status_code=304, headers={})
+        mock_get.side_effect = [first, not_modified]
+        fetcher = ConditionalFetcher()
+        
+        # Fetch the same URL twice
+        assert fetcher.get("https://statsapi.mlb.com/x", params={'fields': 'teams'}) == {'teams': {}}
+        assert fetcher.get("https://statsapi.mlb.com/x", params={'fields': 'teams'}) == {'teams': {}}
+        
+        # Assertions
+        assert mock_get.call_args_list[0].kwargs['headers'] == {}
+        assert mock_get.call_args_list[1].kwargs['headers'] == {'If-None-Match': '"abc"'}
+        not_modified.json.assert_not_called()
+    
+    @patch('print_lineups.lineups_posted')
+    def test_polls_until_posted(self, mock_posted):
+        """Test that polling stops as soon as both lineups are present"""
+        mock_posted.side_effect = [False, False, True]
+        sleeps = []
+        
+        with patch('sys.stdout'):
+            posted = watch_for_lineups(778518, "2025-04-15T23:10:00Z", fetcher=MagicMock(),
+                                       sleep=sleeps.append,
+                                       now=lambda: self.FIRST_PITCH - timedelta(hours=2))
+        
+        # Assertions
+        assert posted is True
+        assert sleeps == [180, 180]
+    
+    @patch('print_lineups.lineups_posted', return_value=False)
+    def test_gives_up_after_first_pitch(self, mock_posted):
+        """Test that watching ends once the game has long been under way"""
+        with patch('sys.stdout'):
+            posted = watch_for_lineups(778518, "2025-04-15T23:10:00Z", fetcher=MagicMock(),
+                                       sleep=MagicMock(),
+                                       now=lambda: self.FIRST_PITCH + timedelta(hours=2))
+        
+        # Assertions
+        assert posted is False
+        mock_posted.assert_called_once()
+    
+    @staticmethod
+    def game_state(status, game_date=None):
+        """Build the minimal schedule response get_game_state reads"""
+        game = {'status': {'detailedState': status}}
+        if game_date:
+            game['gameDate'] = game_date
+        return {'dates': [{'games': [game]}]}
+    
+    @patch('print_lineups.lineups_posted', return_value=False)
+    def test_stops_for_postponed_game(self, mock_posted):
+        """Test that a postponed game without a start time is not watched forever"""
+        fetcher = MagicMock()
+        fetcher.get.return_value = self.game_state('Postponed')
+        sleep = MagicMock()
+        
+        with patch('sys.stdout'):
+            posted = watch_for_lineups(778518, "", fetcher=fetcher, sleep=sleep,
+                                       now=lambda: self.FIRST_PITCH - timedelta(hours=2))
+        
+        # Assertions
+        assert posted is False
+        sleep.assert_not_called()
+        assert fetcher.get.call_args.kwargs['params']['gamePk'] == 778518
+    
+    @patch('print_lineups.lineups_posted', return_value=False)
+    def test_gives_up_after_max_wait(self, mock_posted):
+        """Test that a game with no start time is only watched for WATCH_MAX_WAIT"""
+        fetcher = MagicMock()
+        fetcher.get.return_value = self.game_state('Scheduled')
+        clock = [self.FIRST_PITCH]
+        
+        def sleep(seconds):
+            clock[0] += timedelta(seconds=seconds)
+        
+        with patch('sys.stdout'):
+            posted = watch_for_lineups(778518, "", fetcher=fetcher, sleep=sleep, now=lambda: clock[0])
+        
+        # Assertions
+        assert posted is False
+        assert clock[0] - self.FIRST_PITCH <= timedelta(seconds=print_lineups.WATCH_MAX_WAIT + 30 * 60)
+
+
+class TestRosterTable:
+    """Tests for the daily roster snapshot used before per-person lookups"""
+    
+    @staticmethod
+    def roster_response(*players):
+        return {'roster': [{
+            'jerseyNumber': jersey,
+            'person': {'id': pid, 'fullName': name, 'primaryNumber': '99',
+                       'pitchHand': {'code': throws}, 'batSide': {'code': bats}}
+        } for pid, name, jersey, throws, bats in players]}
+    
+    def test_table_from_roster(self):
+        """Test that roster entries become compact rows with jersey, pitch hand and bat side"""
+        table = RosterTable()
+        table.add_roster(self.roster_response((1, 'Lefty', '47', 'L', 'S')))
+        
+        # Round trip through the cached form
+        table = RosterTable.from_json(json.loads(json.dumps(table.to_json())))
+        
+        # Assertions
+        assert len(table) == 1
+        assert table.get(1) == {'name': 'Lefty', 'jersey': '47', 'throws': 'L', 'throws_desc': 'LHP'}
+        assert table.bat_side(1) == 'S'
+        assert table.get(2) is None
+    
+    @patch('requests.Session.get')
+    def test_loaded_once_per_day(self, mock_get, tmp_path):
+        """Test that the table costs one request per team and is then read from the cache"""
+        print_lineups.set_cache(ResponseCache(str(tmp_path / "cache.sqlite3")))
+        mock_get.return_value.json.return_value = self.roster_response((1, 'Lefty', '47', 'L', 'L'))
+        
+        # Call the function twice
+        first = load_roster_table("2025-04-15", [121, 147])
+        second = load_roster_table("2025-04-15", [121, 147])
+        
+        # Assertions
+        assert mock_get.call_count == 2
+        assert "teams/121/roster" in mock_get.call_args_list[0].args[0]
+        assert mock_get.call_args.kwargs['params']['date'] == "2025-04-15"
+        assert 1 in first and 1 in second
+    
+    @patch('requests.Session.get')
+    def test_incomplete_table_not_cached(self, mock_get, tmp_path):
+        """Test that a table missing a team is built again by the next run"""
+        print_lineups.set_cache(ResponseCache(str(tmp_path / "cache.sqlite3")))
+        mock_get.side_effect = requests.exceptions.ConnectionError("Network down")
+        
+        with patch('sys.stderr', new_callable=io.StringIO) as fake_errors:
+            table = load_roster_table("2025-04-15", [121, 147])
+        
+        # Assertions
+        assert len(table) == 0
+        assert "Error fetching rosters for NYM, NYY" in fake_errors.getvalue()
+        load_roster_table("2025-04-15", [121, 147])
+        assert mock_get.call_count == 4
+    
+    @patch('requests.Session.get')
+    def test_lookups_consult_table_first(self, mock_get, mock_player_response):
+        """Test that only people missing from the table are fetched"""
+        table = RosterTable()
+        table.add_roster(self.roster_response((1, 'Lefty', '47', 'L', 'L')))
+        set_roster_table(table)
+        mock_get.return_value.json.return_value = mock_player_response
+        
+        # Call the functions
+        pitcher = get_pitcher_details(1)
+        people = get_people_details([1, 123456])
+        
+        # Assertions
+        assert pitcher['throws_desc'] == 'LHP'
+        assert people[1]['name'] == 'Lefty'
+        mock_get.assert_called_once_with("https://statsapi.mlb.com/api/v1/people",
+                                         params={'personIds': '123456', 'fields': PEOPLE_FIELDS})
+
+
+class TestParseBoxscore:
+    """Tests for the single-pass raw boxscore parser"""
+    
+    def test_starters_in_batting_order(self, mock_boxscore_with_substitutes):
+        """Test that only starters are kept, ordered by batting slot"""
+        teams = parse_boxscore(mock_boxscore_with_substitutes)
+        
+        # Assertions
+        assert teams['home']['team_id'] == 121
+        assert teams['home']['team_name'] == 'New York Mets'
+        assert teams['home']['short_name'] == 'Mets'
+        assert teams['home']['lineup'] == [
+            {'id': 596019, 'name': 'Francisco Lindor', 'position': 'SS', 'batting_order': 1, 'jersey': '12'},
+            {'id': 683146, 'name': 'Brett Baty', 'position': '2B', 'batting_order': 2, 'jersey': '22'},
+        ]
+        assert [p['name'] for p in teams['away']['lineup']] == ['Bo Bichette']
+        
+    def test_starting_pitcher(self, mock_boxscore_response):
+        """Test that the pitcher with the most innings is reported as the starter"""
+        teams = parse_boxscore(mock_boxscore_response)
+        
+        # Assertions
+        assert teams['home']['starting_pitcher'] == 664285
+        assert teams['away']['starting_pitcher'] is None
+        assert teams['home']['lineup'] == []
+    
+    @patch('requests.Session.get')
+    def test_player_missing_full_name(self, mock_get, mock_boxscore_with_substitutes):
+        """Test that a partial player entry does not stop the lineup from being read"""
+        del mock_boxscore_with_substitutes['teams']['home']['players']['ID596019']['person']['fullName']
+        mock_get.return_value.json.return_value = mock_boxscore_with_substitutes
+        
+        lineup_data, error = get_lineup(778518, 121)
+        
+        # Assertions
+        assert error is None
+        assert [p['name'] for p in lineup_data['team']['lineup']] == ['', 'Brett Baty']
+        
+    @patch('requests.Session.get')
+    def test_malformed_boxscore_falls_back(self, mock_get, mock_boxscore_with_substitutes):
+        """Test that a boxscore parse_boxscore cannot read is left to fallback_get_lineup"""
+        mock_boxscore_with_substitutes['teams']['away']['players']['ID666182']['battingOrder'] = "x00"
+        mock_get.return_value.json.return_value = mock_boxscore_with_substitutes
+        
+        lineup_data, error = get_lineup(778518, 121)
+        
+        # Assertions
+        assert lineup_data is None
+        assert "Lineup not yet available" in error
+
+
 class TestSubstitutionHandling:
     """Tests for handling of substitutions in lineup data"""
     
-    @patch('statsapi.boxscore_data')
-    def test_get_lineup_filters_substitutes(self, mock_boxscore_data, mock_boxscore_data_with_substitutes):
+    @patch('requests.Session.get')
+    def test_get_lineup_filters_substitutes(self, mock_get, mock_boxscore_with_substitutes):
         """Test that get_lineup filters out substitute players from the lineup"""
         # Configure the mock to return our custom mock data
-        mock_boxscore_data.return_value = mock_boxscore_data_with_substitutes
+        mock_get.return_value.json.return_value = mock_boxscore_with_substitutes
         
         # Call the function for the Mets (team_id 121)
         lineup_data, error = get_lineup(778518, 121)
@@ -568,11 +1529,11 @@ class TestSubstitutionHandling:
         assert 'Bo Bichette' in opponent_names
         assert 'Alejandro Kirk' not in opponent_names
     
-    @patch('statsapi.boxscore_data')
-    def test_lineup_batting_order(self, mock_boxscore_data, mock_boxscore_data_with_substitutes):
+    @patch('requests.Session.get')
+    def test_lineup_batting_order(self, mock_get, mock_boxscore_with_substitutes):
         """Test that lineup batting order is preserved correctly"""
         # Configure the mock to return our custom mock data
-        mock_boxscore_data.return_value = mock_boxscore_data_with_substitutes
+        mock_get.return_value.json.return_value = mock_boxscore_with_substitutes
         
         # Call the function for the Mets
         lineup_data, _ = get_lineup(778518, 121)
@@ -586,4 +1547,569 @@ class TestSubstitutionHandling:
         
         # Second player should be Baty (batting order 2)
         assert team_lineup[1]['name'] == 'Brett Baty'
-        assert team_lineup[1]['batting_order'] == 2
\ No newline at end of file
+        assert team_lineup[1]['batting_order'] == 2
+
+
+class TestBackfill:
+    """Tests for the resumable season backfill"""
+    
+    @staticmethod
+    def parsed_game(home_id=121, away_id=147):
+        return {
+            'home': {'team_id': home_id, 'starting_pitcher': 10, 'lineup': [
+                {'id': 1, 'name': 'Home One', 'position': 'SS', 'batting_order': 1, 'jersey': '12'}]},
+            'away': {'team_id': away_id, 'starting_pitcher': 20, 'lineup': [
+                {'id': 2, 'name': 'Away One', 'position': 'CF', 'batting_order': 1, 'jersey': '2'}]},
+        }
+    
+    @staticmethod
+    def schedule_entry(game_id, status='Final', home_id=121, away_id=147):
+        return {'game_id': game_id, 'game_date': '2025-04-15', 'status': status,
+                'home_id': home_id, 'away_id': away_id}
+    
+    def test_rate_limiter_spaces_calls(self):
+        """Test that calls are spread out to the configured rate"""
+        limiter = RateLimiter(rate=100)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        
+        # Five intervals of 10ms must have passed after the first call
+        assert time.monotonic() - start >= 0.045
+    
+    @patch('statsapi.schedule')
+    def test_only_completed_mlb_games_are_backfilled(self, mock_schedule):
+        """Test that unfinished games and games against non-MLB teams are skipped"""
+        mock_schedule.return_value = [
+            self.schedule_entry(1),
+            self.schedule_entry(2, status='Postponed'),
+            self.schedule_entry(3, away_id=159),  # All-Star team
+        ]
+        
+        games, error = get_backfill_games("2025-03-27", "2025-09-28")
+        
+        # Assertions
+        assert error is None
+        assert [game['game_id'] for game in games] == [1]
+    
+    @patch('backfill.fetch_game_lineups')
+    def test_resume_skips_checkpointed_games(self, mock_fetch, tmp_path):
+        """Test that a second run only fetches the games the first one did not store"""
+        games = [self.schedule_entry(1), self.schedule_entry(2), self.schedule_entry(3)]
+        
+        # The first run fails on game 2
+        def first_run(game):
+            if game['game_id'] == 2:
+                raise requests.exceptions.ConnectionError("Network down")
+            return self.parsed_game()
+        
+        mock_fetch.side_effect = first_run
+        store = LineupStore(str(tmp_path / "lineups.sqlite3"))
+        with patch('sys.stdout'):
+            assert backfill(games, store, max_workers=2) == (2, 1)
+        store.close()
+        
+        # The second run, on a reopened store, only fetches game 2
+        mock_fetch.reset_mock()
+        mock_fetch.side_effect = None
+        mock_fetch.return_value = self.parsed_game()
+        store = LineupStore(str(tmp_path / "lineups.sqlite3"))
+        with patch('sys.stdout'):
+            assert backfill(games, store, max_workers=2) == (1, 0)
+        
+        # Assertions
+        assert [call.args[0]['game_id'] for call in mock_fetch.call_args_list] == [2]
+        assert store.completed_game_ids() == {1, 2, 3}
+        rows = store._conn.execute(
+            "SELECT team_id, person_id, name FROM lineups WHERE game_id = 2 ORDER BY team_id").fetchall()
+        assert rows == [(121, 1, 'Home One'), (147, 2, 'Away One')]
+        store.close()
+
+
+class TestLineupArchive:
+    """Tests for the columnar, memory-mapped lineup archive"""
+    
+    def test_round_trip(self, tmp_path, mock_boxscore_with_substitutes):
+        """Test that lineups read back exactly as they were added, sorted by game"""
+        teams = parse_boxscore(mock_boxscore_with_substitutes)
+        builder = LineupArchiveBuilder()
+        builder.add_game(778518, teams)
+        builder.add_lineup(1, 147, [
+            {'id': None, 'name': 'Aaron Judge', 'position': 'RF', 'batting_order': 1, 'jersey': '99'}])
+        builder.write(str(tmp_path / "lineups.lna"))
+        
+        with LineupArchive(str(tmp_path / "lineups.lna")) as archive:
+            # Assertions
+            assert len(archive) == 3
+            assert list(archive.game_ids) == [1, 778518, 778518]
+            assert archive.find(778518, 121)['lineup'] == teams['home']['lineup']
+            assert len(archive.find(778518)) == 2
+            assert archive.find(1, 147)['lineup'][0]['id'] is None
+            assert archive.find(2) == []
+    
+    def test_strings_and_positions_interned(self, tmp_path):
+        """Test that repeated names and positions are stored once"""
+        builder = LineupArchiveBuilder()
+        player = {'id': 596019, 'name': 'Francisco Lindor', 'position': 'SS', 'batting_order': 1, 'jersey': '12'}
+        for game_id in range(100):
+            builder.add_lineup(game_id, 121, [player])
+        builder.write(str(tmp_path / "lineups.lna"))
+        
+        with LineupArchive(str(tmp_path / "lineups.lna")) as archive:
+            # Assertions
+            assert set(archive.names) == {archive.names[0]}
+            assert archive.position_names == ['SS']
+            assert isinstance(archive.person_ids, memoryview)
+            assert archive.lineup(99)['lineup'] == [player]
+    
+    def test_built_from_backfill_store(self, tmp_path):
+        """Test that a backfill store converts into an archive"""
+        store = LineupStore(str(tmp_path / "store.sqlite3"))
+        store.save_game({'game_id': 5, 'game_date': '2025-04-15'}, TestBackfill.parsed_game())
+        store.close()
+        
+        builder = LineupArchiveBuilder()
+        builder.add_store(str(tmp_path / "store.sqlite3"))
+        builder.write(str(tmp_path / "lineups.lna"))
+        
+        with LineupArchive(str(tmp_path / "lineups.lna")) as archive:
+            # Assertions
+            assert archive.find(5, 147)['lineup'][0]['name'] == 'Away One'
+    
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file that is not an archive raises ValueError"""
+        path = tmp_path / "not-an-archive"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            LineupArchive(str(path))
+
+
+class TestLiveFeed:
+    """Tests for tracking a game through the live feed's diffPatch endpoint"""
+    
+    @pytest.fixture
+    def live_feed(self, mock_boxscore_with_substitutes):
+        """Fixture for a minimal live feed built around the substitutes boxscore"""
+        return {
+            'metaData': {'timeStamp': '20250415_231000'},
+            'gameData': {
+                'status': {'abstractGameState': 'Live'},
+                'players': {'ID605400': {'id': 605400, 'fullName': 'Aaron Nola', 'primaryNumber': '27',
+                                         'pitchHand': {'code': 'R'}}},
+            },
+            'liveData': {'boxscore': mock_boxscore_with_substitutes},
+        }
+    
+    @staticmethod
+    def respond(responses):
+        """Build a Session.get side effect that answers by URL suffix"""
+        def get(url, params=None):
+            response = MagicMock()
+            response.json.return_value = responses[url.rsplit('/', 1)[-1]].pop(0)
+            return response
+        return get
+    
+    def test_apply_patch_operations(self):
+        """Test the RFC 6902 operations, including escaped keys and list appends"""
+        doc = {'a': {'b/c': 1}, 'list': [1, 2], 'old': 'x'}
+        doc = apply_patch(doc, [
+            {'op': 'replace', 'path': '/a/b~1c', 'value': 2},
+            {'op': 'add', 'path': '/list/-', 'value': 3},
+            {'op': 'add', 'path': '/list/0', 'value': 0},
+            {'op': 'remove', 'path': '/list/1'},
+            {'op': 'move', 'from': '/old', 'path': '/new'},
+            {'op': 'copy', 'from': '/a', 'path': '/a2'},
+            {'op': 'test', 'path': '/new', 'value': 'x'},
+        ])
+        
+        # Assertions
+        assert doc == {'a': {'b/c': 2}, 'list': [0, 2, 3], 'new': 'x', 'a2': {'b/c': 2}}
+        with pytest.raises(PatchError):
+            apply_patch(doc, [{'op': 'replace', 'path': '/missing/key', 'value': 1}])
+    
+    @patch('requests.Session.get')
+    def test_patches_applied_to_local_state(self, mock_get, live_feed):
+        """Test that only patches are fetched after the first update and the views follow them"""
+        home = '/liveData/boxscore/teams/home/players'
+        mock_get.side_effect = self.respond({
+            'live': [live_feed],
+            'diffPatch': [[{'diff': [
+                {'op': 'replace', 'path': '/metaData/timeStamp', 'value': '20250415_232000'},
+                {'op': 'replace', 'path': f'{home}/ID596019/person/fullName', 'value': 'Frankie Lindor'},
+                {'op': 'add', 'path': f'{home}/ID605400', 'value': {
+                    'person': {'id': 605400, 'fullName': 'Aaron Nola'}, 'position': {'abbreviation': 'P'},
+                    'stats': {'pitching': {'inningsPitched': '1.0'}}}},
+            ]}], []],
+        })
+        game = LiveGame(778518)
+        
+        # Three updates: the full feed, one set of patches, then nothing new
+        assert game.update() is True
+        assert game.update() is True
+        assert game.update() is False
+        
+        # Assertions
+        assert mock_get.call_args_list[1].kwargs['params'] == {'startTimecode': '20250415_231000'}
+        assert mock_get.call_args_list[2].kwargs['params'] == {'startTimecode': '20250415_232000'}
+        lineup_data, error = game.lineup(121)
+        assert error is None
+        assert lineup_data['team']['lineup'][0]['name'] == 'Frankie Lindor'
+        pitchers = game.starting_pitchers(121)
+        assert pitchers['team'] == {'name': 'Aaron Nola', 'jersey': '27', 'throws': 'R', 'throws_desc': 'RHP'}
+        assert mock_get.call_count == 3
+    
+    @patch('requests.Session.get')
+    def test_unappliable_patch_resyncs(self, mock_get, live_feed):
+        """Test that a patch that does not fit the local state triggers a full download"""
+        mock_get.side_effect = self.respond({
+            'live': [live_feed, live_feed],
+            'diffPatch': [[{'diff': [{'op': 'remove', 'path': '/liveData/plays'}]}]],
+        })
+        game = LiveGame(778518)
+        
+        game.update()
+        game.update()
+        
+        # Assertions
+        assert game.resyncs == 2
+        assert game.timecode == '20250415_231000'
+
+
+class TestChangeDetector:
+    """Tests for reporting only the changes between successive snapshots"""
+    
+    @staticmethod
+    def details(order=('Francisco Lindor', 'Juan Soto'), pitcher='Kodai Senga', umpires=None):
+        """Build (pitchers, umpires, lineup_data) for a game with a two-man lineup"""
+        lineup = [{'id': i, 'name': name, 'position': 'DH', 'batting_order': i + 1, 'jersey': str(i)}
+                  for i, name in enumerate(order)]
+        pitchers = {'team': pitcher and {'name': pitcher, 'jersey': '34', 'throws': 'R', 'throws_desc': 'RHP'},
+                    'opponent': None, 'team_name': 'New York Mets', 'opponent_team': 'Atlanta Braves'}
+        lineup_data = {'team': {'name': 'New York Mets', 'lineup': lineup},
+                       'opponent': {'team': 'Atlanta', 'lineup': []}}
+        return pitchers, umpires, lineup_data
+    
+    def test_section_digest_ignores_key_order(self):
+        """Test that equal sections hash the same whatever their key order"""
+        assert section_digest({'a': 1, 'b': [1, 2]}) == section_digest({'b': [1, 2], 'a': 1})
+        assert section_digest({'a': 1}) != section_digest({'a': 2})
+    
+    def test_unchanged_snapshot_is_silent(self):
+        """Test that the first snapshot reports what is posted and a repeat reports nothing"""
+        detector = ChangeDetector()
+        
+        first = detector.update(1, 121, *self.details())
+        second = detector.update(1, 121, *self.details())
+        
+        # Assertions
+        assert [(event['section'], event.get('side'), event['type']) for event in first] == [
+            ('lineup', 'team', 'posted'), ('pitcher', 'team', 'posted')]
+        assert second == []
+    
+    def test_reordered_lineup_and_scratched_pitcher(self):
+        """Test that a batting order swap and a pitcher scratch are reported compactly"""
+        detector = ChangeDetector()
+        detector.update(1, 121, *self.details())
+        
+        events = detector.update(1, 121, *self.details(order=('Juan Soto', 'Francisco Lindor'),
+                                                        pitcher=None))
+        
+        # Assertions
+        lineup_event, pitcher_event = events
+        assert lineup_event['type'] == 'changed'
+        assert [(change['batting_order'], change['before']['name'], change['after']['name'])
+                for change in lineup_event['changes']] == [
+            (1, 'Francisco Lindor', 'Juan Soto'), (2, 'Juan Soto', 'Francisco Lindor')]
+        assert pitcher_event['type'] == 'removed'
+        assert format_event(pitcher_event) == "PITCHER (team) removed: #34 Kodai Senga (RHP) -> -"
+    
+    def test_umpires_posted(self):
+        """Test that an umpire assignment is reported once and then stays silent"""
+        detector = ChangeDetector()
+        detector.update(1, 121, *self.details())
+        umpires = [{'official': {'fullName': 'Angel Hernandez'}, 'officialType': 'Home Plate'}]
+        
+        events = detector.update(1, 121, *self.details(umpires=umpires))
+        
+        # Assertions
+        assert len(events) == 1
+        assert format_event(events[0]) == "UMPIRES posted: Home Plate: Angel Hernandez"
+        assert detector.update(1, 121, *self.details(umpires=umpires)) == []
+
+
+class TestPrefetch:
+    """Tests for the daemon that warms the cache ahead of first pitch"""
+    
+    FIRST_PITCH = pytz.utc.localize(datetime(2025, 4, 15, 23, 10))
+    
+    @staticmethod
+    def schedule_entry(game_id=778518, status='Scheduled'):
+        """Build a statsapi schedule entry for a Braves at Mets game"""
+        return {'game_id': game_id, 'status': status, 'game_datetime': '2025-04-15T23:10:00Z',
+                'home_id': 121, 'away_id': 144, 'home_name': 'New York Mets', 'away_name': 'Atlanta Braves'}
+    
+    def test_prefetch_times_end_at_first_pitch(self):
+        """Test that the timetable starts an hour ahead and ends with first pitch"""
+        times = prefetch_times(self.FIRST_PITCH)
+        
+        # Assertions
+        assert times[0] == self.FIRST_PITCH - timedelta(hours=1)
+        assert times[-1] == self.FIRST_PITCH
+        assert times == sorted(set(times))
+        # Each prefetch renews the entries before the previous ones expire
+        assert all(later - earlier < timedelta(seconds=print_lineups.TTL_PREGAME)
+                   for earlier, later in pairwise(times))
+    
+    @patch('statsapi.schedule')
+    def test_team_schedules_served_from_slate(self, mock_schedule, tmp_path):
+        """Test that get_team_games is answered from the entries cut from the slate"""
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite3'))
+        warm_team_schedules(cache, '2025-04-15', [self.schedule_entry()])
+        print_lineups.set_cache(cache)
+        
+        games, error = get_team_games(144, '2025-04-15')
+        
+        # Assertions
+        assert error is None
+        assert [game['game_id'] for game in games] == [778518]
+        mock_schedule.assert_not_called()
+    
+    def test_refreshing_cache_always_refetches(self, tmp_path):
+        """Test that reads through a RefreshingCache miss but still write the entry"""
+        cache = ResponseCache(str(tmp_path / 'cache.sqlite3'))
+        cache.set('key', {'old': True}, 60)
+        print_lineups.set_cache(RefreshingCache(cache))
+        
+        value = print_lineups.cached_fetch('key', 60, lambda: {'old': False})
+        
+        # Assertions
+        assert value == {'old': False}
+        assert cache.get('key') == {'old': False}
+    
+    @patch('prefetch.load_roster_table')
+    @patch('prefetch.prefetch_game')
+    @patch('prefetch.get_slate_games')
+    def test_daemon_follows_timetable(self, mock_slate, mock_prefetch_game, mock_load_roster_table):
+        """Test that a game is prefetched at each point of its timetable and the daemon then exits"""
+        mock_slate.return_value = ([self.schedule_entry(), self.schedule_entry(1, 'Postponed')], None)
+        clock = [self.FIRST_PITCH - timedelta(hours=5)]
+        prefetch_clock = []
+        mock_prefetch_game.side_effect = lambda game: prefetch_clock.append(clock[0])
+        
+        def sleep(seconds):
+            clock[0] += timedelta(seconds=seconds)
+        
+        daemon = PrefetchDaemon(MagicMock(), '2025-04-15', sleep=sleep, now=lambda: clock[0])
+        
+        # Assertions
+        assert daemon.run() is True
+        assert prefetch_clock == prefetch_times(self.FIRST_PITCH)
+        assert all(call.args[0]['game_id'] == 778518 for call in mock_prefetch_game.call_args_list)
+        assert mock_slate.call_count > 1
+        assert print_lineups.get_cache() is None
+    
+    @patch('print_lineups.fetch_game_details', return_value=(None, None, None, "Lineup not yet available"))
+    @patch('prefetch.prefetch_game')
+    @patch('statsapi.schedule')
+    @patch('requests.Session.get')
+    def test_team_run_after_daemon_needs_no_requests(self, mock_get, mock_schedule, mock_prefetch_game,
+                                                     mock_fetch_game_details, monkeypatch):
+        """Test that a --team run right after the daemon reads the schedule and rosters from the cache"""
+        mock_schedule.return_value = [self.schedule_entry()]
+        mock_get.return_value.json.return_value = {'roster': [
+            {'person': {'id': 607043, 'fullName': 'Brandon Nimmo'}, 'jerseyNumber': '9'}]}
+        cache = ResponseCache(print_lineups.response_cache.get_default_cache_path())
+        clock = self.FIRST_PITCH + timedelta(minutes=1)
+        
+        PrefetchDaemon(cache, '2025-04-15', sleep=lambda seconds: None, now=lambda: clock).run()
+        set_roster_table(None)
+        mock_get.reset_mock()
+        mock_schedule.reset_mock()
+        monkeypatch.setattr(sys, 'argv', ['print_lineups.py', '--team', 'NYM', '--date', '2025-04-15'])
+        with patch('sys.stdout', new_callable=io.StringIO):
+            print_lineups.main()
+        
+        # Assertions
+        mock_get.assert_not_called()
+        mock_schedule.assert_not_called()
+        assert 607043 in print_lineups.get_roster_table()
+        cache.close()
+
+
+class TestLineupServer:
+    """Tests for the JSON server's in-memory cache and endpoints"""
+    
+    def test_concurrent_misses_share_one_fetch(self):
+        """Test that requests arriving while a fetch runs wait for it instead of fetching again"""
+        cache = CoalescingCache()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {'value': 1}, 60
+        
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get('key', fetch))) for _ in range(5)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        # Give the followers time to find the fetch in flight before it finishes
+        while cache.coalesced < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        # Assertions
+        assert len(calls) == 1
+        assert results == [{'value': 1}] * 5
+        assert cache.get('key', fetch) == {'value': 1}
+        assert (cache.misses, cache.coalesced, cache.hits) == (1, 4, 1)
+    
+    def test_failed_fetch_is_not_kept(self):
+        """Test that a fetch error reaches the caller and the next call fetches again"""
+        cache = CoalescingCache()
+        
+        with pytest.raises(requests.exceptions.ConnectionError):
+            cache.get('key', MagicMock(side_effect=requests.exceptions.ConnectionError("down")))
+        
+        # Assertions
+        assert cache.get('key', lambda: ('ok', 0)) == 'ok'
+        assert len(cache) == 0
+    
+    @patch('lineup_server.get_slate_games')
+    def test_games_endpoint_cached(self, mock_get_slate_games):
+        """Test that /games/{date} is answered from memory after the first request"""
+        mock_get_slate_games.return_value = ([TestSlate.schedule_entry(778518, "2025-04-15T23:10:00Z")], None)
+        service = LineupService()
+        
+        first = service.handle('/games/2025-04-15')
+        second = service.handle('/games/2025-04-15/')
+        
+        # Assertions
+        assert first == second
+        assert first[0] == 200
+        assert [game['game_id'] for game in json.loads(first[1])['games']] == [778518]
+        mock_get_slate_games.assert_called_once_with('2025-04-15')
+    
+    @patch('lineup_server.fetch_games_details')
+    @patch('lineup_server.get_team_games')
+    def test_lineup_endpoint(self, mock_get_team_games, mock_fetch_games_details):
+        """Test that /lineup/{team}/{date} returns each of the team's games with its details"""
+        game = TestSlate.schedule_entry(778518, "2025-04-15T23:10:00Z")
+        mock_get_team_games.return_value = ([game], None)
+        mock_fetch_games_details.return_value = iter([(game, 121, ({'team': None}, None, None, "Lineup not yet available"))])
+        
+        status, body = LineupService().handle('/lineup/nym/2025-04-15')
+        
+        # Assertions
+        assert status == 200
+        result = json.loads(body)
+        assert result['team'] == 'NYM'
+        assert result['games'][0]['lineup_error'] == "Lineup not yet available"
+        mock_get_team_games.assert_called_once_with(121, '2025-04-15')
+    
+    @patch('print_lineups.get_lineup', return_value=(None, "Lineup not yet available"))
+    @patch('requests.Session.get')
+    def test_game_endpoint_fetches_schedule_once(self, mock_get, mock_lineup, mock_hydrated_schedule_response):
+        """Test that /game/{game_id} reads the status and the pitchers from one schedule request"""
+        game = mock_hydrated_schedule_response['dates'][0]['games'][0]
+        game['status'] = {'detailedState': 'Pre-Game'}
+        game['teams']['home']['probablePitcher']['primaryNumber'] = '41'
+        mock_get.return_value.json.return_value = mock_hydrated_schedule_response
+        
+        status, body = LineupService().handle('/game/778518')
+        
+        # Assertions
+        assert status == 200
+        assert mock_get.call_count == 1
+        assert json.loads(body)['pitchers']['team']['name'] == 'Home Pitcher'
+    
+    @pytest.mark.parametrize("path, status", [
+        ('/lineup/XYZ/2025-04-15', 400),
+        ('/games/yesterday', 400),
+        ('/players/1', 404),
+        ('/game/abc', 404),
+    ])
+    def test_bad_requests(self, path, status):
+        """Test that bad paths are rejected without any fetch"""
+        assert LineupService().handle(path)[0] == status
+
+
+class TestLineupPush:
+    """Tests for fanning one game's polled changes out to many subscribers"""
+    
+    @staticmethod
+    def hydrated_game(status='Pre-Game'):
+        """Build the parts of a hydrated schedule entry the poller reads"""
+        return {'status': {'detailedState': status},
+                'teams': {'home': {'team': {'id': 121}}, 'away': {'team': {'id': 144}}}}
+    
+    @staticmethod
+    def drain(subscription):
+        """Collect every event waiting in a subscription"""
+        events = []
+        while (event := subscription.get(timeout=0)) is not None:
+            events.append(event)
+        return events
+    
+    @patch('lineup_push.fetch_game_details')
+    @patch('lineup_push.get_hydrated_schedule_game')
+    def test_one_poll_reaches_every_subscriber(self, mock_hydrated, mock_fetch_game_details):
+        """Test that each poll fetches once and its changes reach all subscribers, labeled home/away"""
+        mock_hydrated.return_value = self.hydrated_game()
+        pitchers, umpires, lineup_data = TestChangeDetector.details()
+        mock_fetch_game_details.return_value = (pitchers, umpires, lineup_data, None)
+        poller = GamePoller(778518)
+        subscriptions = [Subscription() for _ in range(3)]
+        for subscription in subscriptions:
+            poller._subscribers.add(subscription)
+        
+        poller.poll()
+        poller.poll()
+        
+        # Assertions
+        assert mock_fetch_game_details.call_count == 2
+        assert mock_fetch_game_details.call_args.kwargs['hydrated_game'] is mock_hydrated.return_value
+        for subscription in subscriptions:
+            events = self.drain(subscription)
+            assert [(event['section'], event['side'], event['type']) for event in events] == [
+                ('lineup', 'home', 'posted'), ('pitcher', 'home', 'posted')]
+            assert 'team_id' not in events[0]
+    
+    @patch('lineup_push.fetch_game_details')
+    @patch('lineup_push.get_hydrated_schedule_game')
+    def test_late_subscriber_gets_current_state(self, mock_hydrated, mock_fetch_game_details):
+        """Test that a subscriber joining later first receives what is already posted"""
+        mock_hydrated.return_value = self.hydrated_game()
+        pitchers, umpires, lineup_data = TestChangeDetector.details()
+        mock_fetch_game_details.return_value = (pitchers, umpires, lineup_data, None)
+        poller = GamePoller(778518)
+        poller.poll()
+        subscription = Subscription()
+        
+        with patch.object(GamePoller, '_run'):
+            poller.subscribe(subscription)
+        
+        # Assertions
+        assert [event['section'] for event in self.drain(subscription)] == ['lineup', 'pitcher']
+    
+    @patch.object(GamePoller, 'poll', return_value=True)
+    def test_hub_shares_pollers(self, mock_poll):
+        """Test that subscribers to a game share its poller, which goes away with the last of them"""
+        hub = EventHub(interval=60)
+        
+        first = hub.subscribe([778518])
+        second = hub.subscribe([778518, 778519])
+        
+        # Assertions
+        assert sorted(hub.pollers()) == [778518, 778519]
+        hub.unsubscribe([778518], first)
+        assert sorted(hub.pollers()) == [778518, 778519]
+        hub.unsubscribe([778518, 778519], second)
+        assert hub.pollers() == {}